@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import math
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +16,28 @@ import pandas as pd
 
 SECONDS_PER_DAY = 86_400.0
 SECONDS_PER_YEAR = SECONDS_PER_DAY * 365.25
+DISPERSION_SHARD_SIZE = 100
+
+INJECTION_RECOVERY_COLUMNS = (
+    "sample_id",
+    "satellite_id",
+    "position_error_m",
+    "velocity_error_mps",
+    "delta_v_mps",
+    "success",
+)
+DRAG_DISPERSION_COLUMNS = (
+    "sample_id",
+    "density_scale",
+    "drag_coefficient",
+    "ballistic_coefficient_m2_per_kg",
+    "semi_major_axis_delta_m",
+    "altitude_delta_m",
+    "along_track_shift_km",
+    "ground_distance_delta_km",
+    "command_distance_delta_km",
+    "within_tolerance",
+)
 
 CLASSICAL_ELEMENT_FIELDS = (
     "semi_major_axis_km",
@@ -34,28 +58,33 @@ from src.constellation.orbit import (
     cartesian_to_classical,
     geodetic_coordinates,
     haversine_distance,
-    inertial_to_ecef,
     propagate_kepler,
     propagate_perturbed,
     classical_to_cartesian,
 )
 from src.constellation.control import compute_lqr_delta_v
+from src.constellation.earth_orientation import earth_orientation
 from src.constellation.frames import eci_to_lvlh, lvlh_to_eci, rotation_matrix_eci_to_lvlh
 from src.constellation.roe import MU_EARTH, OrbitalElements
+from src.constellation.accumulators import StreamingAccumulator
+from src.constellation.sampling import SAMPLERS, standard_normal_samples
 from .design import design_j2_invariant_formation
 from tools.stk_export import (
+    ColumnarGroundTrack,
+    ColumnarStateHistory,
     FacilityDefinition,
     GroundContactInterval,
-    GroundTrack,
-    GroundTrackPoint,
-    PropagatedStateHistory,
     ScenarioMetadata,
     SimulationResults,
-    StateSample,
+    epoch_array,
     sanitize_stk_identifier,
     unique_stk_names,
     export_simulation_to_stk,
 )
+from tools.czml_export import export_czml
+
+# Position error allowed when thinning the CZML ephemeris for the web viewer.
+CZML_TOLERANCE_KM = 0.001
 
 
 @dataclass
@@ -152,8 +181,14 @@ class TriangleFormationResult:
 def simulate_triangle_formation(
     config_source: Mapping[str, object] | Path | str,
     output_directory: Optional[Path | str] = None,
+    *,
+    workers: Optional[int] = None,
 ) -> TriangleFormationResult:
-    """Simulate the triangular formation described by *config_source*."""
+    """Simulate the triangular formation described by *config_source*.
+
+    ``workers`` overrides the ``workers`` entries of the ``monte_carlo`` and
+    ``drag_dispersion`` blocks when sharding the dispersion samples.
+    """
 
     configuration = _load_configuration(config_source)
     formation = configuration["formation"]
@@ -251,6 +286,7 @@ def simulate_triangle_formation(
 
     offsets = np.arange(sample_count, dtype=float) * time_step_s - half_duration
     times = [epoch + timedelta(seconds=float(offset)) for offset in offsets]
+    earth_rotations = earth_orientation(times).rotations
     last_maneuver_time = times[0]
 
     positions: dict[str, np.ndarray] = {
@@ -349,7 +385,7 @@ def simulate_triangle_formation(
             velocities_temp[sat_id].append(vel)
             inertial_positions[sat_id] = pos
 
-            ecef = inertial_to_ecef(pos, current_time)
+            ecef = earth_rotations[index] @ pos
             lat, lon, alt = geodetic_coordinates(ecef)
             latitudes[sat_id][index] = lat
             longitudes[sat_id][index] = lon
@@ -390,7 +426,7 @@ def simulate_triangle_formation(
 
         centroid = sum(vertices) / len(vertices)
         centroid_positions[index] = centroid
-        centroid_ecef = inertial_to_ecef(centroid, times[index])
+        centroid_ecef = earth_rotations[index] @ centroid
         centroid_lat, centroid_lon, centroid_alt = geodetic_coordinates(centroid_ecef)
         centroid_latitudes[index] = centroid_lat
         centroid_longitudes[index] = centroid_lon
@@ -467,14 +503,23 @@ def simulate_triangle_formation(
         command_lat,
         command_lon,
     )
-    injection_recovery, injection_samples = _run_injection_recovery_monte_carlo(
+    # The per-sample dispersion tables are written to disk by the shards
+    # themselves, so only their summaries come back to this process.
+    output_path = Path(output_directory) if output_directory is not None else None
+    if output_path is not None:
+        output_path.mkdir(parents=True, exist_ok=True)
+    injection_recovery, injection_accumulators = _run_injection_recovery_monte_carlo(
         satellite_ids,
         formation,
+        workers,
+        sample_path=None if output_path is None else output_path / "injection_recovery.csv",
     )
-    drag_dispersion, drag_samples = _run_atmospheric_drag_dispersion_monte_carlo(
+    drag_dispersion, _ = _run_atmospheric_drag_dispersion_monte_carlo(
         formation,
         semi_major_axis_m,
         inclination,
+        workers,
+        sample_path=None if output_path is None else output_path / "drag_dispersion.csv",
     )
 
     window, window_series = _formation_window(
@@ -532,6 +577,7 @@ def simulate_triangle_formation(
     artefacts: MutableMapping[str, Optional[str]] = {
         "summary_path": None,
         "stk_directory": None,
+        "czml_path": None,
         "maintenance_csv": None,
         "command_windows_csv": None,
         "injection_recovery_csv": None,
@@ -563,9 +609,7 @@ def simulate_triangle_formation(
         artefacts=artefacts,
     )
 
-    if output_directory is not None:
-        output_path = Path(output_directory)
-        output_path.mkdir(parents=True, exist_ok=True)
+    if output_path is not None:
         summary_path = output_path / "triangle_summary.json"
         artefacts["summary_path"] = str(summary_path)
 
@@ -604,39 +648,8 @@ def simulate_triangle_formation(
         command_df.to_csv(command_path, index=False)
         artefacts["command_windows_csv"] = str(command_path)
 
-        injection_path = output_path / "injection_recovery.csv"
-        injection_samples.to_csv(
-            injection_path,
-            index=False,
-            columns=[
-                "sample_id",
-                "satellite_id",
-                "position_error_m",
-                "velocity_error_mps",
-                "delta_v_mps",
-                "success",
-            ],
-        )
-        artefacts["injection_recovery_csv"] = str(injection_path)
-
-        drag_path = output_path / "drag_dispersion.csv"
-        drag_samples.to_csv(
-            drag_path,
-            index=False,
-            columns=[
-                "sample_id",
-                "density_scale",
-                "drag_coefficient",
-                "ballistic_coefficient_m2_per_kg",
-                "semi_major_axis_delta_m",
-                "altitude_delta_m",
-                "along_track_shift_km",
-                "ground_distance_delta_km",
-                "command_distance_delta_km",
-                "within_tolerance",
-            ],
-        )
-        artefacts["drag_dispersion_csv"] = str(drag_path)
+        artefacts["injection_recovery_csv"] = str(output_path / "injection_recovery.csv")
+        artefacts["drag_dispersion_csv"] = str(output_path / "drag_dispersion.csv")
 
         windows_path = output_path / "formation_windows.csv"
         _write_formation_windows_csv(windows_path, window_series)
@@ -647,7 +660,9 @@ def simulate_triangle_formation(
         artefacts["station_keeping_csv"] = str(station_path)
 
         plot_path = output_path / "injection_recovery_cdf.svg"
-        _write_injection_recovery_plot(injection_samples, plot_path)
+        _write_injection_recovery_plot(
+            injection_accumulators.get(("delta_v_mps", None)), plot_path
+        )
         if plot_path.exists():
             artefacts["injection_recovery_plot"] = str(plot_path)
 
@@ -675,6 +690,14 @@ def simulate_triangle_formation(
         )
         artefacts["stk_directory"] = str(stk_dir)
 
+        czml_path = output_path / "formation.czml"
+        _export_to_czml(
+            result,
+            czml_path,
+            scenario_name=str(metadata.get("scenario_name", "Tehran Triangle Formation")),
+        )
+        artefacts["czml_path"] = str(czml_path)
+
         summary_payload = result.to_summary()
         summary_path.write_text(
             json.dumps(summary_payload, indent=2), encoding="utf-8"
@@ -1639,8 +1662,11 @@ def _format_contact_window(
 
 
 def _run_injection_recovery_monte_carlo(
-    satellite_ids: Sequence[str], formation: Mapping[str, object]
-) -> tuple[Mapping[str, object], pd.DataFrame]:
+    satellite_ids: Sequence[str],
+    formation: Mapping[str, object],
+    workers: Optional[int] = None,
+    sample_path: Optional[Path] = None,
+) -> tuple[Mapping[str, object], Mapping[tuple[str, Optional[str]], StreamingAccumulator]]:
     config = formation.get("monte_carlo", {})
     sample_count = int(config.get("samples", 200))
     position_sigma_m = float(config.get("position_sigma_m", 250.0))
@@ -1649,32 +1675,25 @@ def _run_injection_recovery_monte_carlo(
     recovery_time_s = float(config.get("recovery_time_s", 12.0 * 3600.0))
     delta_v_budget = float(config.get("delta_v_budget_mps", 15.0))
     seed = config.get("seed")
-    rng = np.random.default_rng(seed)
-
-    records: list[Mapping[str, object]] = []
-    for sample_index in range(sample_count):
-        for sat_id in satellite_ids:
-            position_error = rng.normal(0.0, position_sigma_m, size=3)
-            velocity_error = rng.normal(0.0, velocity_sigma_mps, size=3)
-            position_mag = float(np.linalg.norm(position_error))
-            velocity_mag = float(np.linalg.norm(velocity_error))
-            delta_v_position = 2.0 * position_mag / recovery_time_s
-            delta_v_total = delta_v_position + velocity_mag
-            success = delta_v_total <= delta_v_budget
-            records.append(
-                {
-                    "sample_id": sample_index,
-                    "satellite_id": sat_id,
-                    "position_error_m": position_mag,
-                    "velocity_error_mps": velocity_mag,
-                    "delta_v_mps": delta_v_total,
-                    "success": bool(success),
-                }
-            )
 
-    dataframe = pd.DataFrame.from_records(records)
+    accumulators = _run_dispersion_shards(
+        _injection_recovery_shard,
+        seed,
+        sample_count,
+        _dispersion_workers(config, workers),
+        ("delta_v_mps", "success"),
+        "satellite_id",
+        sample_path,
+        INJECTION_RECOVERY_COLUMNS,
+        *_dispersion_sampler(config, symmetric=True),
+        tuple(satellite_ids),
+        position_sigma_m,
+        velocity_sigma_mps,
+        recovery_time_s,
+        delta_v_budget,
+    )
 
-    if dataframe.empty:
+    if not accumulators:
         aggregate = {
             "success_rate": 1.0,
             "mean_delta_v_mps": 0.0,
@@ -1684,19 +1703,21 @@ def _run_injection_recovery_monte_carlo(
         per_spacecraft = {sat_id: aggregate for sat_id in satellite_ids}
         success_rate = 1.0
     else:
-        success_rate = float(dataframe["success"].mean())
+        success_rate = accumulators["success", None].mean
         per_spacecraft = {}
-        for sat_id, group in dataframe.groupby("satellite_id"):
-            per_spacecraft[str(sat_id)] = {
-                "mean_delta_v_mps": float(group["delta_v_mps"].mean()),
-                "p95_delta_v_mps": float(group["delta_v_mps"].quantile(0.95)),
-                "max_delta_v_mps": float(group["delta_v_mps"].max()),
-                "success_rate": float(group["success"].mean()),
+        for sat_id in sorted(str(identifier) for identifier in satellite_ids):
+            delta_v = accumulators["delta_v_mps", sat_id]
+            per_spacecraft[sat_id] = {
+                "mean_delta_v_mps": delta_v.mean,
+                "p95_delta_v_mps": delta_v.quantile(0.95),
+                "max_delta_v_mps": delta_v.maximum,
+                "success_rate": accumulators["success", sat_id].mean,
             }
+        delta_v = accumulators["delta_v_mps", None]
         aggregate = {
-            "mean_delta_v_mps": float(dataframe["delta_v_mps"].mean()),
-            "p95_delta_v_mps": float(dataframe["delta_v_mps"].quantile(0.95)),
-            "max_delta_v_mps": float(dataframe["delta_v_mps"].max()),
+            "mean_delta_v_mps": delta_v.mean,
+            "p95_delta_v_mps": delta_v.quantile(0.95),
+            "max_delta_v_mps": delta_v.maximum,
         }
 
     metrics = {
@@ -1712,14 +1733,16 @@ def _run_injection_recovery_monte_carlo(
         },
     }
 
-    return metrics, dataframe
+    return metrics, accumulators
 
 
 def _run_atmospheric_drag_dispersion_monte_carlo(
     formation: Mapping[str, object],
     semi_major_axis_m: float,
     inclination_rad: float,
-) -> tuple[Mapping[str, object], pd.DataFrame]:
+    workers: Optional[int] = None,
+    sample_path: Optional[Path] = None,
+) -> tuple[Mapping[str, object], Mapping[tuple[str, Optional[str]], StreamingAccumulator]]:
     settings = formation.get("drag_dispersion", {})
     sample_count = int(settings.get("samples", 200))
     density_sigma = float(settings.get("density_sigma", 0.2))
@@ -1735,7 +1758,6 @@ def _run_atmospheric_drag_dispersion_monte_carlo(
     if spacecraft_mass <= 0.0:
         raise ValueError("Spacecraft mass must be positive for drag dispersions.")
 
-    rng = np.random.default_rng(seed)
     ballistic_coeff_base = ballistic_area / spacecraft_mass
 
     mean_motion = math.sqrt(MU_EARTH / semi_major_axis_m**3)
@@ -1743,56 +1765,38 @@ def _run_atmospheric_drag_dispersion_monte_carlo(
     horizon = max(time_horizon_orbits, 0.0) * orbital_period
     horizon = max(horizon, integration_step)
 
-    records: list[Mapping[str, object]] = []
     tolerance_km = float(formation.get("ground_tolerance_km", 350.0))
-    orbital_radius = semi_major_axis_m
-    ground_projection_scale = math.cos(inclination_rad)
 
     time_samples = np.arange(0.0, horizon + 0.5 * integration_step, integration_step)
 
-    for sample_id in range(sample_count):
-        density_scale = max(0.0, 1.0 + rng.normal(0.0, density_sigma))
-        cd_scale = max(0.0, 1.0 + rng.normal(0.0, drag_coefficient_sigma))
-
-        rho = reference_density * density_scale
-        cd = drag_coefficient * cd_scale
-        ballistic_coefficient = ballistic_coeff_base
-
-        orbital_velocity = math.sqrt(MU_EARTH / semi_major_axis_m)
-        drag_acceleration = 0.5 * rho * cd * ballistic_coefficient * orbital_velocity**2
-        da_dt = -2.0 * semi_major_axis_m**2 * drag_acceleration / MU_EARTH
-
-        semi_major_axis_series = semi_major_axis_m + da_dt * time_samples
-        semi_major_axis_series = np.maximum(semi_major_axis_series, EARTH_EQUATORIAL_RADIUS_M + 150_000.0)
-
-        altitude_delta = semi_major_axis_series[-1] - semi_major_axis_m
-        new_mean_motion = math.sqrt(MU_EARTH / semi_major_axis_series[-1] ** 3)
-        delta_theta = (new_mean_motion - mean_motion) * horizon
-        along_track_shift = abs(delta_theta) * orbital_radius / 1_000.0
-
-        ground_distance_delta = along_track_shift * abs(ground_projection_scale)
-        command_distance_delta = along_track_shift
-
-        within_tolerance = ground_distance_delta <= tolerance_km
-
-        records.append(
-            {
-                "sample_id": sample_id,
-                "density_scale": float(density_scale),
-                "drag_coefficient": float(cd),
-                "ballistic_coefficient_m2_per_kg": float(ballistic_coefficient),
-                "semi_major_axis_delta_m": float(altitude_delta),
-                "altitude_delta_m": float(altitude_delta),
-                "along_track_shift_km": float(along_track_shift),
-                "ground_distance_delta_km": float(ground_distance_delta),
-                "command_distance_delta_km": float(command_distance_delta),
-                "within_tolerance": bool(within_tolerance),
-            }
-        )
-
-    dataframe = pd.DataFrame.from_records(records)
+    accumulators = _run_dispersion_shards(
+        _drag_dispersion_shard,
+        seed,
+        sample_count,
+        _dispersion_workers(settings, workers),
+        (
+            "ground_distance_delta_km",
+            "along_track_shift_km",
+            "altitude_delta_m",
+            "within_tolerance",
+        ),
+        None,
+        sample_path,
+        DRAG_DISPERSION_COLUMNS,
+        *_dispersion_sampler(settings),
+        density_sigma,
+        drag_coefficient_sigma,
+        reference_density,
+        drag_coefficient,
+        ballistic_coeff_base,
+        semi_major_axis_m,
+        inclination_rad,
+        float(time_samples[-1]),
+        horizon,
+        tolerance_km,
+    )
 
-    if dataframe.empty:
+    if not accumulators:
         aggregate = {
             "p95_ground_distance_delta_km": 0.0,
             "max_ground_distance_delta_km": 0.0,
@@ -1802,24 +1806,16 @@ def _run_atmospheric_drag_dispersion_monte_carlo(
         }
         success_rate = 1.0
     else:
+        ground_distance = accumulators["ground_distance_delta_km", None]
+        along_track = accumulators["along_track_shift_km", None]
         aggregate = {
-            "p95_ground_distance_delta_km": float(
-                dataframe["ground_distance_delta_km"].quantile(0.95)
-            ),
-            "max_ground_distance_delta_km": float(
-                dataframe["ground_distance_delta_km"].max()
-            ),
-            "p95_along_track_shift_km": float(
-                dataframe["along_track_shift_km"].quantile(0.95)
-            ),
-            "max_along_track_shift_km": float(
-                dataframe["along_track_shift_km"].max()
-            ),
-            "p95_altitude_delta_m": float(
-                dataframe["altitude_delta_m"].quantile(0.95)
-            ),
+            "p95_ground_distance_delta_km": ground_distance.quantile(0.95),
+            "max_ground_distance_delta_km": ground_distance.maximum,
+            "p95_along_track_shift_km": along_track.quantile(0.95),
+            "max_along_track_shift_km": along_track.maximum,
+            "p95_altitude_delta_m": accumulators["altitude_delta_m", None].quantile(0.95),
         }
-        success_rate = float(dataframe["within_tolerance"].mean())
+        success_rate = accumulators["within_tolerance", None].mean
 
     metrics = {
         "sample_count": sample_count,
@@ -1838,11 +1834,240 @@ def _run_atmospheric_drag_dispersion_monte_carlo(
         "tolerance_km": tolerance_km,
     }
 
-    return metrics, dataframe
+    return metrics, accumulators
+
+
+def _dispersion_workers(config: Mapping[str, object], override: Optional[int]) -> int:
+    """Return the worker count for a dispersion block, preferring *override*."""
+
+    value = override if override is not None else config.get("workers", 1)
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def _dispersion_sampler(
+    config: Mapping[str, object], *, symmetric: bool = False
+) -> tuple[str, bool]:
+    """Return the ``sampler`` and ``antithetic`` settings of a dispersion block.
 
+    *symmetric* marks studies whose outputs are unchanged when every draw
+    changes sign; antithetic pairs would duplicate their samples, so the
+    option is rejected for them.
+    """
+
+    sampler = str(config.get("sampler", "pseudo_random")).strip().lower()
+    if sampler not in SAMPLERS:
+        raise ValueError(
+            f"Unknown dispersion sampler {sampler!r}; expected one of {', '.join(SAMPLERS)}."
+        )
+    antithetic = bool(config.get("antithetic", False))
+    if antithetic and symmetric:
+        raise ValueError(
+            "Antithetic sampling is not supported for this dispersion study: its outputs "
+            "depend only on error magnitudes, so mirrored draws would repeat every sample."
+        )
+    return sampler, antithetic
+
+
+def _run_dispersion_shards(
+    shard_function,
+    seed: object,
+    sample_count: int,
+    workers: int,
+    columns: Sequence[str],
+    group_column: Optional[str],
+    sample_path: Optional[Path],
+    sample_columns: Sequence[str],
+    *arguments: object,
+) -> Mapping[tuple[str, Optional[str]], StreamingAccumulator]:
+    """Evaluate *shard_function* over fixed-size shards and merge their summaries.
+
+    Each shard draws from its own child of ``SeedSequence(seed)`` and the
+    shard boundaries depend only on :data:`DISPERSION_SHARD_SIZE`, so the
+    samples are identical whether the shards run in-process or across a
+    process pool.  Every shard summarises *columns* into
+    :class:`~src.constellation.accumulators.StreamingAccumulator` instances
+    keyed by ``(column, None)`` and, when *group_column* is given,
+    ``(column, group)``; only these are returned, merged in shard order.
+    When *sample_path* is given the shards also write their *sample_columns*
+    beside it, and the parts are then concatenated into *sample_path*, so the
+    per-sample table never passes between processes.
+    """
+
+    offsets = list(range(0, max(sample_count, 0), DISPERSION_SHARD_SIZE))
+    shard_seeds = np.random.SeedSequence(seed).spawn(len(offsets))
+    part_paths = [
+        None if sample_path is None else sample_path.with_name(f"{sample_path.name}.{index:05d}")
+        for index in range(len(offsets))
+    ]
+    tasks = [
+        (offset, min(DISPERSION_SHARD_SIZE, sample_count - offset), shard_seed)
+        for offset, shard_seed in zip(offsets, shard_seeds)
+    ]
+
+    shard_arguments = [
+        (shard_function, columns, group_column, part_path, sample_columns, *task, *arguments)
+        for part_path, task in zip(part_paths, tasks)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [
+                executor.submit(_summarised_dispersion_shard, *shard_argument)
+                for shard_argument in shard_arguments
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [_summarised_dispersion_shard(*shard_argument) for shard_argument in shard_arguments]
+
+    accumulators: MutableMapping[tuple[str, Optional[str]], StreamingAccumulator] = {}
+    for shard_accumulators in results:
+        for key, accumulator in shard_accumulators.items():
+            accumulators.setdefault(key, StreamingAccumulator()).merge(accumulator)
+
+    if sample_path is not None:
+        with sample_path.open("w", encoding="utf-8", newline="") as stream:
+            pd.DataFrame(columns=list(sample_columns)).to_csv(stream, index=False)
+            for part_path in part_paths:
+                with part_path.open("r", encoding="utf-8", newline="") as part:
+                    shutil.copyfileobj(part, stream)
+                part_path.unlink()
+    return accumulators
+
+
+def _summarised_dispersion_shard(
+    shard_function,
+    columns: Sequence[str],
+    group_column: Optional[str],
+    part_path: Optional[Path],
+    sample_columns: Sequence[str],
+    *arguments: object,
+) -> Mapping[tuple[str, Optional[str]], StreamingAccumulator]:
+    """Run one dispersion shard, write its samples to *part_path* and summarise *columns*."""
+
+    frame = shard_function(*arguments)
+    if part_path is not None:
+        frame.to_csv(part_path, index=False, header=False, columns=list(sample_columns))
+    accumulators: MutableMapping[tuple[str, Optional[str]], StreamingAccumulator] = {}
+    for column in columns:
+        accumulators[column, None] = StreamingAccumulator()
+        accumulators[column, None].update(frame[column].to_numpy(dtype=float))
+    if group_column is not None:
+        for group, group_frame in frame.groupby(group_column, sort=False):
+            for column in columns:
+                accumulator = StreamingAccumulator()
+                accumulator.update(group_frame[column].to_numpy(dtype=float))
+                accumulators[column, str(group)] = accumulator
+    return accumulators
+
+
+def _injection_recovery_shard(
+    sample_offset: int,
+    sample_count: int,
+    seed_sequence: np.random.SeedSequence,
+    sampler: str,
+    antithetic: bool,
+    satellite_ids: Sequence[str],
+    position_sigma_m: float,
+    velocity_sigma_mps: float,
+    recovery_time_s: float,
+    delta_v_budget: float,
+) -> pd.DataFrame:
+    """Sample one shard of injection errors and the recovery delta-v they imply."""
+
+    rng = np.random.default_rng(seed_sequence)
+    sigmas = np.repeat([position_sigma_m, velocity_sigma_mps], 3)
+    draws = standard_normal_samples(
+        rng, sample_count, 6 * len(satellite_ids), sampler=sampler, antithetic=antithetic
+    )
+    errors = draws.reshape(sample_count, len(satellite_ids), 6) * sigmas
+    position_mag = np.linalg.norm(errors[..., :3], axis=-1).ravel()
+    velocity_mag = np.linalg.norm(errors[..., 3:], axis=-1).ravel()
+    delta_v_total = 2.0 * position_mag / recovery_time_s + velocity_mag
+
+    return pd.DataFrame(
+        {
+            "sample_id": np.repeat(
+                np.arange(sample_offset, sample_offset + sample_count), len(satellite_ids)
+            ),
+            "satellite_id": np.tile(np.asarray(satellite_ids, dtype=object), sample_count),
+            "position_error_m": position_mag,
+            "velocity_error_mps": velocity_mag,
+            "delta_v_mps": delta_v_total,
+            "success": delta_v_total <= delta_v_budget,
+        }
+    )
 
-def _write_injection_recovery_plot(samples: pd.DataFrame, output_path: Path) -> None:
-    if samples.empty:
+
+def _drag_dispersion_shard(
+    sample_offset: int,
+    sample_count: int,
+    seed_sequence: np.random.SeedSequence,
+    sampler: str,
+    antithetic: bool,
+    density_sigma: float,
+    drag_coefficient_sigma: float,
+    reference_density: float,
+    drag_coefficient: float,
+    ballistic_coefficient: float,
+    semi_major_axis_m: float,
+    inclination_rad: float,
+    final_time_s: float,
+    horizon: float,
+    tolerance_km: float,
+) -> pd.DataFrame:
+    """Sample one shard of density and drag-coefficient dispersions."""
+
+    rng = np.random.default_rng(seed_sequence)
+    draws = standard_normal_samples(
+        rng, sample_count, 2, sampler=sampler, antithetic=antithetic
+    ) * np.array([density_sigma, drag_coefficient_sigma])
+    density_scale = np.maximum(0.0, 1.0 + draws[:, 0])
+    cd_scale = np.maximum(0.0, 1.0 + draws[:, 1])
+
+    rho = reference_density * density_scale
+    cd = drag_coefficient * cd_scale
+
+    mean_motion = math.sqrt(MU_EARTH / semi_major_axis_m**3)
+    orbital_velocity = math.sqrt(MU_EARTH / semi_major_axis_m)
+    drag_acceleration = 0.5 * rho * cd * ballistic_coefficient * orbital_velocity**2
+    da_dt = -2.0 * semi_major_axis_m**2 * drag_acceleration / MU_EARTH
+
+    final_semi_major_axis = np.maximum(
+        semi_major_axis_m + da_dt * final_time_s,
+        EARTH_EQUATORIAL_RADIUS_M + 150_000.0,
+    )
+
+    altitude_delta = final_semi_major_axis - semi_major_axis_m
+    new_mean_motion = np.sqrt(MU_EARTH / final_semi_major_axis**3)
+    delta_theta = (new_mean_motion - mean_motion) * horizon
+    along_track_shift = np.abs(delta_theta) * semi_major_axis_m / 1_000.0
+
+    ground_distance_delta = along_track_shift * abs(math.cos(inclination_rad))
+
+    return pd.DataFrame(
+        {
+            "sample_id": np.arange(sample_offset, sample_offset + sample_count),
+            "density_scale": density_scale,
+            "drag_coefficient": cd,
+            "ballistic_coefficient_m2_per_kg": np.full(sample_count, ballistic_coefficient),
+            "semi_major_axis_delta_m": altitude_delta,
+            "altitude_delta_m": altitude_delta,
+            "along_track_shift_km": along_track_shift,
+            "ground_distance_delta_km": ground_distance_delta,
+            "command_distance_delta_km": along_track_shift,
+            "within_tolerance": ground_distance_delta <= tolerance_km,
+        }
+    )
+
+
+def _write_injection_recovery_plot(
+    delta_v: Optional[StreamingAccumulator], output_path: Path
+) -> None:
+    """Plot the delta-v CDF from the quantiles of the merged *delta_v* summary."""
+
+    if delta_v is None or not delta_v.count:
         return
 
     import matplotlib
@@ -1850,8 +2075,8 @@ def _write_injection_recovery_plot(samples: pd.DataFrame, output_path: Path) ->
     matplotlib.use("Agg")
     import matplotlib.pyplot as plt  # noqa: WPS433 - imported for plotting
 
-    values = np.sort(samples["delta_v_mps"].to_numpy(dtype=float))
-    cumulative = (np.arange(len(values), dtype=float) + 1.0) / float(len(values))
+    cumulative = np.linspace(0.0, 1.0, 201)
+    values = np.array([delta_v.quantile(probability) for probability in cumulative])
 
     figure, axis = plt.subplots(figsize=(6.0, 4.0))
     axis.plot(values, cumulative, color="#1f77b4", linewidth=2.0)
@@ -1873,29 +2098,27 @@ def _export_to_stk(result: TriangleFormationResult, output_dir: Path, scenario_n
     safe_satellite_names = unique_stk_names(satellite_ids)
     safe_facility_name = sanitize_stk_identifier("Tehran", default="Facility")
     safe_scenario_name = sanitize_stk_identifier(scenario_name, default="Scenario")
+    epochs = epoch_array(result.times)
 
     for sat_id in satellite_ids:
         safe_id = safe_satellite_names[sat_id]
-        samples = [
-            StateSample(
-                epoch=epoch,
-                position_eci_km=result.positions_m[sat_id][index] / 1_000.0,
-                velocity_eci_kms=result.velocities_mps[sat_id][index] / 1_000.0,
+        state_histories.append(
+            ColumnarStateHistory(
+                satellite_id=safe_id,
+                epochs=epochs,
+                positions_eci_km=np.asarray(result.positions_m[sat_id], dtype=float) / 1_000.0,
+                velocities_eci_kms=np.asarray(result.velocities_mps[sat_id], dtype=float) / 1_000.0,
             )
-            for index, epoch in enumerate(result.times)
-        ]
-        state_histories.append(PropagatedStateHistory(satellite_id=safe_id, samples=samples))
-
-        track_points = [
-            GroundTrackPoint(
-                epoch=epoch,
-                latitude_deg=math.degrees(result.latitudes_rad[sat_id][index]),
-                longitude_deg=math.degrees(result.longitudes_rad[sat_id][index]),
-                altitude_km=result.altitudes_m[sat_id][index] / 1_000.0,
+        )
+        ground_tracks.append(
+            ColumnarGroundTrack(
+                satellite_id=safe_id,
+                epochs=epochs,
+                latitude_deg=np.degrees(result.latitudes_rad[sat_id]),
+                longitude_deg=np.degrees(result.longitudes_rad[sat_id]),
+                altitude_km=np.asarray(result.altitudes_m[sat_id], dtype=float) / 1_000.0,
             )
-            for index, epoch in enumerate(result.times)
-        ]
-        ground_tracks.append(GroundTrack(satellite_id=safe_id, points=track_points))
+        )
 
     window = result.metrics["formation_window"]
     if window.get("start") and window.get("end"):
@@ -1942,4 +2165,26 @@ def _export_to_stk(result: TriangleFormationResult, output_dir: Path, scenario_n
     export_simulation_to_stk(sim_results, output_dir, scenario_metadata)
 
 
+def _export_to_czml(result: TriangleFormationResult, output_path: Path, scenario_name: str) -> None:
+    """Write the decimated formation ephemerides, available during the formation windows."""
+
+    epochs = epoch_array(result.times)
+    histories = [
+        ColumnarStateHistory(
+            satellite_id=sat_id,
+            epochs=epochs,
+            positions_eci_km=np.asarray(result.positions_m[sat_id], dtype=float) / 1_000.0,
+            velocities_eci_kms=np.asarray(result.velocities_mps[sat_id], dtype=float) / 1_000.0,
+        )
+        for sat_id in sorted(result.positions_m)
+    ]
+    export_czml(
+        histories,
+        output_path,
+        document_name=scenario_name,
+        formation_windows=result.metrics["formation_windows"],
+        tolerance_km=CZML_TOLERANCE_KM,
+    )
+
+
 __all__ = ["simulate_triangle_formation", "TriangleFormationResult"]
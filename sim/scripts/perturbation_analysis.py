@@ -15,32 +15,43 @@ from __future__ import annotations
 import json
 import math
 import logging
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Mapping, MutableMapping, Sequence
+from typing import Iterable, Iterator, Mapping, MutableMapping, Sequence
 
 import os
 
 import numpy as np
 from statistics import fmean
 
+from src.constellation.accumulators import StreamingAccumulator
 from src.constellation.frames import rotation_matrix_rtn_to_eci
 from src.constellation.orbit import (
     EARTH_EQUATORIAL_RADIUS_M,
     EARTH_ROTATION_RATE,
     cartesian_to_classical,
     geodetic_coordinates,
+    geodetic_coordinates_array,
     haversine_distance,
+    haversine_distance_array,
     inertial_to_ecef,
+    inertial_to_ecef_series,
 )
 from src.constellation.roe import MU_EARTH, OrbitalElements
+from src.constellation.sampling import SAMPLERS, standard_normal_samples
 
 
 J2_COEFFICIENT = 1.08262668e-3
 SOLAR_FLUX_BASE = 150.0
 OMEGA_EARTH_VECTOR = np.array([0.0, 0.0, EARTH_ROTATION_RATE], dtype=float)
-OMEGA_EARTH_VECTOR = np.array([0.0, 0.0, EARTH_ROTATION_RATE], dtype=float)
+_J2_AXIS_OFFSETS = np.array([1.0, 1.0, 3.0], dtype=float)
+# Central-difference steps in semi-major axis [m], inclination [rad], and
+# relative drag coefficient used by the linearised Monte Carlo surrogate.
+_SENSITIVITY_STEPS = np.array([1.0, 1.0e-6, 1.0e-3], dtype=float)
 
 DEFAULT_FORMATION = (
     {
@@ -97,13 +108,33 @@ DEFAULT_MONTE_CARLO = {
     "enabled": True,
     "runs": 1000,
     "seed": 4242,
+    "mode": "ensemble",
+    "batch_size": 250,
+    "workers": 1,
+    "spot_checks": 8,
+    "sampler": "pseudo_random",
+    "antithetic": False,
     "dispersions": {
         "semi_major_axis_sigma_m": 5.0,
         "inclination_sigma_deg": 0.01,
         "drag_coefficient_sigma": 0.05,
     },
+    # When enabled, the study draws up to ``max_runs`` samples in place of
+    # ``runs`` and tests the stopping rule every ``batch_size`` runs; the
+    # top-level ``batch_size`` only sets the size of the parallel shards.
+    "adaptive": {
+        "enabled": False,
+        "half_width": 0.02,
+        "confidence_level": 0.95,
+        "interval": "wilson",
+        "max_runs": 5000,
+        "batch_size": 50,
+    },
 }
 
+MONTE_CARLO_MODES = ("ensemble", "serial", "linearised")
+CONFIDENCE_INTERVAL_METHODS = ("wilson", "clopper_pearson")
+
 
 @dataclass
 class PropagatorSettings:
@@ -134,6 +165,73 @@ class SpacecraftState:
     mass_kg: float
 
 
+@dataclass
+class CrossTrackSeries:
+    """Deterministic cross-track histories held in memory.
+
+    ``cross_track_km`` [km] and ``altitude_m`` [m] have shape
+    ``(epochs, vehicles)`` with columns ordered as ``identifiers``.
+    """
+
+    identifiers: list[str]
+    epochs: list[datetime]
+    cross_track_km: np.ndarray
+    altitude_m: np.ndarray
+
+    def nearest_sample(self, target: datetime) -> tuple[datetime, dict[str, float]]:
+        """Return the first epoch closest to *target* and the cross-track values there."""
+
+        if not self.epochs:
+            return target, {}
+        index = _nearest_epoch_index(self.epochs, target)
+        return self.epochs[index], {
+            identifier: float(value)
+            for identifier, value in zip(self.identifiers, self.cross_track_km[index])
+        }
+
+
+@dataclass
+class RaanSweep:
+    r"""Formation history propagated once and re-used for any leader RAAN.
+
+    Central gravity, \(J_2\), and drag in an atmosphere co-rotating about the
+    spin axis are all invariant under rotations about :math:`z`, so changing
+    the RAAN by :math:`\Delta\Omega` rotates the whole inertial trajectory by
+    :math:`\Delta\Omega` about :math:`z`.  :meth:`cross_track` applies that
+    rotation to the stored positions instead of propagating again.
+    """
+
+    reference_raan_deg: float
+    identifiers: list[str]
+    epochs: list[datetime]
+    position_history: np.ndarray
+    target_lat: float
+    target_lon: float
+
+    def cross_track(self, raan_deg: float) -> CrossTrackSeries:
+        """Return the cross-track series the formation would have at *raan_deg*."""
+
+        angle = math.radians(float(raan_deg) - self.reference_raan_deg)
+        cos_angle = math.cos(angle)
+        sin_angle = math.sin(angle)
+        rotation = np.array(
+            [
+                [cos_angle, -sin_angle, 0.0],
+                [sin_angle, cos_angle, 0.0],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+        cross_track, altitude = _cross_track_km(
+            self.position_history @ rotation.T, self.epochs, self.target_lat, self.target_lon
+        )
+        return CrossTrackSeries(
+            identifiers=list(self.identifiers),
+            epochs=list(self.epochs),
+            cross_track_km=cross_track,
+            altitude_m=altitude,
+        )
+
+
 def propagate_constellation(
     scenario: Mapping[str, object],
     *,
@@ -191,6 +289,139 @@ def propagate_constellation(
     return summary, artefact_paths
 
 
+def propagate_cross_track(
+    scenario: Mapping[str, object],
+    *,
+    formation: Sequence[Mapping[str, float | str]] = DEFAULT_FORMATION,
+    settings: PropagatorSettings | None = None,
+    raan_deg: float | None = None,
+) -> CrossTrackSeries:
+    """Propagate the deterministic formation and return its cross-track series.
+
+    Nothing is written to disk and the Monte Carlo and orbital-element
+    post-processing of :func:`propagate_constellation` is skipped.  When
+    *raan_deg* is given it replaces the leader's RAAN without modifying
+    *scenario*.
+    """
+
+    resolved_settings = settings or _default_settings(scenario)
+    target_lat, target_lon = _target_coordinates(scenario)
+    leader_elements = _scenario_orbital_elements(scenario)
+    if raan_deg is not None:
+        leader_elements = replace(leader_elements, raan=math.radians(float(raan_deg)))
+
+    states, times, position_history, _ = _propagate_formation_history(
+        leader_elements, formation, resolved_settings
+    )
+    cross_track, altitude = _cross_track_km(position_history, times, target_lat, target_lon)
+    return CrossTrackSeries(
+        identifiers=[state.identifier for state in states],
+        epochs=times,
+        cross_track_km=cross_track,
+        altitude_m=altitude,
+    )
+
+
+def prepare_raan_sweep(
+    scenario: Mapping[str, object],
+    *,
+    formation: Sequence[Mapping[str, float | str]] = DEFAULT_FORMATION,
+    settings: PropagatorSettings | None = None,
+) -> RaanSweep:
+    """Propagate the formation once at the scenario RAAN for rotational RAAN sweeps."""
+
+    resolved_settings = settings or _default_settings(scenario)
+    target_lat, target_lon = _target_coordinates(scenario)
+    leader_elements = _scenario_orbital_elements(scenario)
+
+    states, times, position_history, _ = _propagate_formation_history(
+        leader_elements, formation, resolved_settings
+    )
+    return RaanSweep(
+        reference_raan_deg=math.degrees(leader_elements.raan),
+        identifiers=[state.identifier for state in states],
+        epochs=times,
+        position_history=position_history,
+        target_lat=target_lat,
+        target_lon=target_lon,
+    )
+
+
+def propagate_cross_track_windows(
+    scenario: Mapping[str, object],
+    offsets: Sequence[timedelta],
+    *,
+    formation: Sequence[Mapping[str, float | str]] = DEFAULT_FORMATION,
+    settings: PropagatorSettings | None = None,
+) -> list[tuple[CrossTrackSeries, MutableMapping[str, object]]]:
+    r"""Propagate once across several shifted copies of the analysis window.
+
+    Window ``k`` spans the resolved start and stop times shifted by
+    ``offsets[k]`` and is evaluated at the shifted evaluation time.  The
+    formation is integrated continuously from the unshifted start (or the
+    earliest window, if one precedes it) to the latest window, so drag and
+    \(J_2\) effects accumulate between windows and a subset of offsets sees
+    the same states as the full set.  Only the states falling inside a window
+    are retained.  Each entry pairs the
+    window's cross-track series with the evaluation summary reported by
+    :func:`propagate_constellation`.
+    """
+
+    resolved_settings = settings or _default_settings(scenario)
+    target_lat, target_lon = _target_coordinates(scenario)
+    leader_elements = _scenario_orbital_elements(scenario)
+    if not offsets:
+        return []
+
+    step_s = float(resolved_settings.time_step_s)
+    window_span_s = (resolved_settings.stop_time - resolved_settings.start_time).total_seconds()
+    origin_s = min(0.0, *(offset.total_seconds() for offset in offsets))
+    origin = resolved_settings.start_time + timedelta(seconds=origin_s)
+    # Integer step ranges covering each window on the shared fixed-step grid.
+    ranges: list[tuple[int, int]] = []
+    for offset in offsets:
+        first = math.ceil((offset.total_seconds() - origin_s) / step_s - 1.0e-9)
+        last = math.floor((offset.total_seconds() - origin_s + window_span_s) / step_s + 1.0e-9)
+        ranges.append((first, last))
+    step_count = max(last for _, last in ranges) + 1
+
+    states = _initial_states(
+        leader_elements,
+        formation,
+        resolved_settings.drag_coefficient,
+        epoch_offset_s=(origin - resolved_settings.epoch_time).total_seconds(),
+    )
+    identifiers = [state.identifier for state in states]
+    positions, velocities, drag_factors = _state_arrays(states)
+    histories = [np.empty((last - first + 1, len(states), 3), dtype=float) for first, last in ranges]
+    recorded: dict[int, list[tuple[np.ndarray, int]]] = {}
+    for history, (first, last) in zip(histories, ranges):
+        for step in range(first, last + 1):
+            recorded.setdefault(step, []).append((history, step - first))
+    for step, (step_positions, _) in enumerate(
+        _propagated_states(positions, velocities, drag_factors, resolved_settings, step_count)
+    ):
+        for history, row in recorded.get(step, ()):
+            history[row] = step_positions
+
+    evaluation_time = _resolve_evaluation_time(resolved_settings)
+    results: list[tuple[CrossTrackSeries, MutableMapping[str, object]]] = []
+    for offset, history, (first, last) in zip(offsets, histories, ranges):
+        epochs = [origin + timedelta(seconds=step * step_s) for step in range(first, last + 1)]
+        cross_track, altitude = _cross_track_km(history, epochs, target_lat, target_lon)
+        _, _, evaluation = _evaluate_cross_track(
+            identifiers, epochs, cross_track, evaluation_time + offset, resolved_settings
+        )
+        series = CrossTrackSeries(
+            identifiers=list(identifiers),
+            epochs=epochs,
+            cross_track_km=cross_track,
+            altitude_m=altitude,
+        )
+        results.append((series, evaluation))
+    return results
+
+
 def scenario_cross_track_limits(
     scenario: Mapping[str, object]
 ) -> tuple[float, float, float | None]:
@@ -282,6 +513,7 @@ def _build_summary(
     orbital_period = deterministic_metrics.get("orbital_period_s", 0.0)
     two_body_period = deterministic_metrics.get("two_body_period_s", orbital_period)
     period_delta = float(orbital_period) - float(two_body_period)
+    monte_carlo_runs, monte_carlo_max_runs = _monte_carlo_run_counts(monte_carlo_metrics)
 
     return {
         "model": "high_fidelity_j2_drag",
@@ -295,7 +527,8 @@ def _build_summary(
             "drag_coefficient": float(settings.drag_coefficient),
             "ballistic_coefficient_m2_per_kg": float(settings.ballistic_coefficient_m2_per_kg),
             "solar_flux_index": float(settings.solar_flux_index),
-            "monte_carlo_runs": int(monte_carlo_config.get("runs", 0)),
+            "monte_carlo_runs": monte_carlo_runs,
+            "monte_carlo_max_runs": monte_carlo_max_runs,
         },
         "cross_track": deterministic_metrics.get("cross_track", {}),
         "altitude_range_m": deterministic_metrics.get("altitude_range_m", {}),
@@ -304,6 +537,20 @@ def _build_summary(
     }
 
 
+def _monte_carlo_run_counts(monte_carlo_metrics: Mapping[str, object]) -> tuple[int, int]:
+    """Return the runs achieved by the Monte Carlo study and its run budget.
+
+    Adaptive studies may stop before the budget, so the configured run count
+    describes neither figure.
+    """
+
+    runs = int(monte_carlo_metrics.get("runs", 0))
+    stopping = monte_carlo_metrics.get("stopping")
+    if isinstance(stopping, Mapping):
+        return runs, int(stopping.get("max_runs", runs))
+    return runs, runs
+
+
 def _default_settings(scenario: Mapping[str, object]) -> PropagatorSettings:
     """Return baseline propagation settings derived from the scenario."""
 
@@ -393,6 +640,10 @@ def _normalise_monte_carlo(monte_carlo: Mapping[str, object] | None) -> MutableM
                 default_disp = dict(DEFAULT_MONTE_CARLO.get("dispersions", {}))
                 default_disp.update({k: float(v) for k, v in value.items()})
                 config["dispersions"] = default_disp
+            elif key == "adaptive" and isinstance(value, Mapping):
+                default_adaptive = dict(DEFAULT_MONTE_CARLO["adaptive"])
+                default_adaptive.update(value)
+                config["adaptive"] = default_adaptive
             else:
                 config[key] = value
 
@@ -407,6 +658,84 @@ def _normalise_monte_carlo(monte_carlo: Mapping[str, object] | None) -> MutableM
         runs = DEFAULT_MONTE_CARLO["runs"]
     config["runs"] = max(runs, 500)
 
+    mode = str(config.get("mode", DEFAULT_MONTE_CARLO["mode"])).strip().lower()
+    if mode not in MONTE_CARLO_MODES:
+        LOGGER.warning("Unknown Monte Carlo mode %r; falling back to 'ensemble'.", mode)
+        mode = DEFAULT_MONTE_CARLO["mode"]
+    config["mode"] = mode
+
+    try:
+        batch_size = int(config.get("batch_size", DEFAULT_MONTE_CARLO["batch_size"]))
+    except (TypeError, ValueError):
+        batch_size = DEFAULT_MONTE_CARLO["batch_size"]
+    config["batch_size"] = max(batch_size, 1)
+
+    try:
+        workers = int(config.get("workers", DEFAULT_MONTE_CARLO["workers"]))
+    except (TypeError, ValueError):
+        workers = DEFAULT_MONTE_CARLO["workers"]
+    config["workers"] = max(workers, 1)
+
+    try:
+        spot_checks = int(config.get("spot_checks", DEFAULT_MONTE_CARLO["spot_checks"]))
+    except (TypeError, ValueError):
+        spot_checks = DEFAULT_MONTE_CARLO["spot_checks"]
+    config["spot_checks"] = max(spot_checks, 0)
+
+    sampler = str(config.get("sampler", DEFAULT_MONTE_CARLO["sampler"])).strip().lower()
+    if sampler not in SAMPLERS:
+        LOGGER.warning("Unknown Monte Carlo sampler %r; falling back to 'pseudo_random'.", sampler)
+        sampler = DEFAULT_MONTE_CARLO["sampler"]
+    config["sampler"] = sampler
+    config["antithetic"] = bool(config.get("antithetic", DEFAULT_MONTE_CARLO["antithetic"]))
+
+    config["adaptive"] = _normalise_adaptive_stopping(config.get("adaptive"))
+
+    return config
+
+
+def _normalise_adaptive_stopping(adaptive: object) -> MutableMapping[str, object]:
+    """Return the adaptive-stopping block with defaults applied and values validated."""
+
+    defaults = DEFAULT_MONTE_CARLO["adaptive"]
+    if isinstance(adaptive, bool):
+        adaptive = {"enabled": adaptive}
+    if not isinstance(adaptive, Mapping):
+        adaptive = {}
+    config = dict(defaults)
+    config.update(adaptive)
+    config["enabled"] = bool(config.get("enabled", False))
+
+    try:
+        half_width = float(config.get("half_width", defaults["half_width"]))
+    except (TypeError, ValueError):
+        half_width = defaults["half_width"]
+    config["half_width"] = half_width if 0.0 < half_width < 0.5 else defaults["half_width"]
+
+    try:
+        level = float(config.get("confidence_level", defaults["confidence_level"]))
+    except (TypeError, ValueError):
+        level = defaults["confidence_level"]
+    config["confidence_level"] = level if 0.0 < level < 1.0 else defaults["confidence_level"]
+
+    method = str(config.get("interval", defaults["interval"])).strip().lower()
+    if method not in CONFIDENCE_INTERVAL_METHODS:
+        LOGGER.warning("Unknown confidence interval %r; falling back to 'wilson'.", method)
+        method = defaults["interval"]
+    config["interval"] = method
+
+    try:
+        max_runs = int(config.get("max_runs", defaults["max_runs"]))
+    except (TypeError, ValueError):
+        max_runs = defaults["max_runs"]
+    config["max_runs"] = max(max_runs, 1)
+
+    try:
+        batch_size = int(config.get("batch_size", defaults["batch_size"]))
+    except (TypeError, ValueError):
+        batch_size = defaults["batch_size"]
+    config["batch_size"] = max(batch_size, 1)
+
     return config
 
 
@@ -648,140 +977,50 @@ def _propagate_deterministic(
 ]:
     """Propagate the deterministic trajectory and capture time histories."""
 
-    epoch_offset = (settings.start_time - settings.epoch_time).total_seconds()
-    states = _initial_states(
-        leader_elements,
-        formation,
-        settings.drag_coefficient,
-        epoch_offset_s=epoch_offset,
+    states, times, position_history, velocity_history = _propagate_formation_history(
+        leader_elements, formation, settings
     )
-    epoch = settings.start_time
-    dt = settings.time_step_s
-
-    times: list[datetime] = []
-    cross_track_series: dict[str, list[float]] = {state.identifier: [] for state in states}
-    altitude_series: dict[str, list[float]] = {state.identifier: [] for state in states}
-    orbital_elements_series: dict[str, dict[str, list[float]]] = {
-        state.identifier: {field: [] for field in CLASSICAL_ELEMENT_FIELDS} for state in states
-    }
-    metrics = _initial_metric_structure(states, target_lat, target_lon)
+    identifiers = [state.identifier for state in states]
     plane_metrics = _plane_intersection_metrics(states, target_lat, target_lon)
-    relative_stats = {"max_abs": 0.0, "min_abs": math.inf, "time_of_min": None, "series": []}
 
     mean_motion = leader_elements.mean_motion()
     orbital_period = 2.0 * math.pi / mean_motion if mean_motion else 0.0
 
-    while epoch <= settings.stop_time + timedelta(seconds=1e-6):
-        times.append(epoch)
-        for state in states:
-            elements = cartesian_to_classical(state.position_m, state.velocity_mps)
-            per_satellite = orbital_elements_series[state.identifier]
-            per_satellite["semi_major_axis_km"].append(elements.semi_major_axis / 1_000.0)
-            per_satellite["eccentricity"].append(elements.eccentricity)
-            per_satellite["inclination_deg"].append(
-                _normalise_angle_degrees(elements.inclination)
-            )
-            per_satellite["raan_deg"].append(_normalise_angle_degrees(elements.raan))
-            per_satellite["argument_of_perigee_deg"].append(
-                _normalise_angle_degrees(elements.arg_perigee)
-            )
-            per_satellite["mean_anomaly_deg"].append(
-                _normalise_angle_degrees(elements.mean_anomaly)
-            )
-        _record_metrics(
-            states,
-            epoch,
-            target_lat,
-            target_lon,
-            metrics,
-            cross_track_series,
-            altitude_series,
-            relative_stats,
-        )
-
-        if epoch >= settings.stop_time:
-            break
-
-        states = _rk4_step(states, dt, settings)
-        epoch += timedelta(seconds=dt)
-
-    overall_min_abs = 0.0
-    for entry in metrics["vehicles"]:
-        min_abs = float(entry.get("min_abs_cross_track_km", math.inf))
-        if math.isfinite(min_abs):
-            overall_min_abs = max(overall_min_abs, min_abs)
-    metrics["overall_min_abs_cross_track_km"] = float(overall_min_abs)
-
-    evaluation_time = _resolve_evaluation_time(settings)
-    evaluation_timestamp = evaluation_time
-    before_index = after_index = 0
-    fraction = 0.0
-    if times:
-        before_index = max(
-            (idx for idx, stamp in enumerate(times) if stamp <= evaluation_time),
-            default=0,
-        )
-        after_index = min(
-            (idx for idx, stamp in enumerate(times) if stamp >= evaluation_time),
-            default=len(times) - 1,
+    cross_track, altitude = _cross_track_km(position_history, times, target_lat, target_lon)
+    leader_index, plane_b_index = _relative_pair_indices(identifiers)
+    if leader_index is not None and plane_b_index is not None:
+        relative = _relative_cross_track_km(
+            position_history, velocity_history, leader_index, plane_b_index
         )
-        if after_index < before_index:
-            after_index = before_index
-        before_time = times[before_index]
-        after_time = times[after_index]
-        if after_time > before_time:
-            elapsed = (evaluation_time - before_time).total_seconds()
-            span = (after_time - before_time).total_seconds()
-            fraction = max(0.0, min(elapsed / span, 1.0))
-        else:
-            fraction = 0.0
-
-    evaluation_values: dict[str, float] = {}
-    evaluation_abs: dict[str, float] = {}
-    for identifier, series_values in cross_track_series.items():
-        value_before = float("nan")
-        value_after = float("nan")
-        if series_values:
-            clamped_before = min(before_index, len(series_values) - 1)
-            clamped_after = min(after_index, len(series_values) - 1)
-            value_before = float(series_values[clamped_before])
-            value_after = float(series_values[clamped_after])
-            if math.isfinite(value_before) and math.isfinite(value_after):
-                value = value_before + fraction * (value_after - value_before)
-            elif math.isfinite(value_before):
-                value = value_before
-            elif math.isfinite(value_after):
-                value = value_after
-            else:
-                value = float("nan")
-        else:
-            value = float("nan")
-        evaluation_values[identifier] = value
-        evaluation_abs[identifier] = abs(value) if math.isfinite(value) else math.inf
-
-    centroid_value = fmean(evaluation_values.values()) if evaluation_values else math.nan
-    centroid_abs = abs(centroid_value) if math.isfinite(centroid_value) else math.inf
-    worst_abs = max(evaluation_abs.values()) if evaluation_abs else math.inf
-
-    primary_limit = float(settings.primary_cross_track_limit_km)
-    waiver_limit = float(settings.waiver_cross_track_limit_km)
+    else:
+        relative = np.full(len(times), np.nan)
+    metrics, relative_summary = _cross_track_summary(
+        identifiers, times, cross_track, relative, target_lat, target_lon
+    )
 
-    primary_compliant = (
-        math.isfinite(centroid_abs)
-        and centroid_abs <= primary_limit
-        and math.isfinite(worst_abs)
-        and worst_abs <= waiver_limit
+    cross_track_series = {
+        identifier: cross_track[:, index].tolist() for index, identifier in enumerate(identifiers)
+    }
+    altitude_series = {
+        identifier: altitude[:, index].tolist() for index, identifier in enumerate(identifiers)
+    }
+    orbital_elements_series = _orbital_element_series(
+        identifiers, position_history, velocity_history
     )
-    waiver_compliant = math.isfinite(worst_abs) and worst_abs <= waiver_limit
-    finite_vehicle_abs = [
-        value for value in evaluation_abs.values() if math.isfinite(value)
-    ]
-    waiver_pass_fraction = (
-        sum(1 for value in finite_vehicle_abs if value <= waiver_limit) / len(finite_vehicle_abs)
-        if finite_vehicle_abs
-        else 0.0
+
+    evaluation_values, evaluation_abs, evaluation = _evaluate_cross_track(
+        identifiers, times, cross_track, _resolve_evaluation_time(settings), settings
     )
-    primary_pass_fraction = 1.0 if primary_compliant else 0.0
+    primary_limit = evaluation["primary_limit_km"]
+    waiver_limit = evaluation["waiver_limit_km"]
+    primary_compliant = evaluation["primary_compliant"]
+    waiver_compliant = evaluation["waiver_compliant"]
+    primary_pass_fraction = evaluation["primary_pass_fraction"]
+    waiver_pass_fraction = evaluation["waiver_pass_fraction"]
+    evaluation_timestamp_iso = evaluation["time_utc"]
+    centroid_value_out = evaluation["centroid_cross_track_km"]
+    centroid_abs_out = evaluation["centroid_abs_cross_track_km"]
+    worst_abs_out = evaluation["worst_vehicle_abs_cross_track_km"]
 
     for entry in metrics["vehicles"]:
         identifier = str(entry.get("identifier", ""))
@@ -797,31 +1036,7 @@ def _propagate_deterministic(
             math.isfinite(abs_value) and abs_value <= waiver_limit
         )
 
-    evaluation_timestamp_iso = evaluation_timestamp.isoformat().replace("+00:00", "Z")
-    centroid_value_out = float(centroid_value) if math.isfinite(centroid_value) else None
-    centroid_abs_out = float(centroid_abs) if math.isfinite(centroid_abs) else None
-    worst_abs_out = float(worst_abs) if math.isfinite(worst_abs) else None
-
-    metrics["evaluation"] = {
-        "time_utc": evaluation_timestamp_iso,
-        "vehicles": {
-            identifier: (float(value) if math.isfinite(value) else None)
-            for identifier, value in evaluation_values.items()
-        },
-        "vehicle_abs": {
-            identifier: (float(value) if math.isfinite(value) else None)
-            for identifier, value in evaluation_abs.items()
-        },
-        "centroid_cross_track_km": centroid_value_out,
-        "centroid_abs_cross_track_km": centroid_abs_out,
-        "worst_vehicle_abs_cross_track_km": worst_abs_out,
-        "primary_compliant": bool(primary_compliant),
-        "waiver_compliant": bool(waiver_compliant),
-        "primary_limit_km": float(primary_limit),
-        "waiver_limit_km": float(waiver_limit),
-        "primary_pass_fraction": float(primary_pass_fraction),
-        "waiver_pass_fraction": float(waiver_pass_fraction),
-    }
+    metrics["evaluation"] = evaluation
     metrics["centroid_cross_track_km_at_evaluation"] = centroid_value_out
     metrics["centroid_abs_cross_track_km_at_evaluation"] = centroid_abs_out
     metrics["overall_abs_cross_track_km_at_evaluation"] = worst_abs_out
@@ -832,13 +1047,6 @@ def _propagate_deterministic(
     metrics["primary_pass_fraction"] = float(primary_pass_fraction)
     metrics["waiver_pass_fraction"] = float(waiver_pass_fraction)
 
-    relative_summary = {
-        "max_abs_km": float(relative_stats["max_abs"]),
-        "min_abs_km": float(relative_stats["min_abs"] if math.isfinite(relative_stats["min_abs"]) else 0.0),
-        "time_of_min": relative_stats["time_of_min"],
-        "series": list(relative_stats["series"]),
-    }
-
     altitude_min = min(min(series) for series in altitude_series.values()) if altitude_series else 0.0
     altitude_max = max(max(series) for series in altitude_series.values()) if altitude_series else 0.0
 
@@ -932,48 +1140,254 @@ def _propagate_deterministic(
     return series, deterministic_metrics
 
 
-def _initial_metric_structure(
-    states: Sequence[SpacecraftState],
-    target_lat: float,
-    target_lon: float,
-) -> MutableMapping[str, object]:
-    """Construct the dictionary used to record cross-track statistics."""
+def _evaluate_cross_track(
+    identifiers: Sequence[str],
+    times: Sequence[datetime],
+    cross_track: np.ndarray,
+    evaluation_time: datetime,
+    settings: PropagatorSettings,
+) -> tuple[dict[str, float], dict[str, float], MutableMapping[str, object]]:
+    """Interpolate ``(epochs, vehicles)`` cross-track at *evaluation_time* and assess compliance.
 
-    vehicle_metrics: list[MutableMapping[str, object]] = []
-    for state in states:
-        vehicle_metrics.append(
-            {
-                "identifier": state.identifier,
-                "target_latitude_deg": math.degrees(target_lat),
-                "target_longitude_deg": math.degrees(target_lon),
-                "max_cross_track_km": -math.inf,
-                "min_cross_track_km": math.inf,
-                "max_abs_cross_track_km": -math.inf,
-                "min_abs_cross_track_km": math.inf,
-                "time_of_max_abs_cross_track": None,
-                "time_of_min_abs_cross_track": None,
-                "pass_count": 0,
-                "compliant": False,
-            }
+    Returns the signed and absolute per-vehicle values (NaN and infinity when
+    undefined) together with the evaluation summary.  Values are linearly
+    interpolated between the bracketing epochs, falling back to whichever
+    neighbour is finite.
+    """
+
+    before_index = after_index = 0
+    fraction = 0.0
+    if times:
+        before_index = max(
+            (idx for idx, stamp in enumerate(times) if stamp <= evaluation_time),
+            default=0,
         )
+        after_index = min(
+            (idx for idx, stamp in enumerate(times) if stamp >= evaluation_time),
+            default=len(times) - 1,
+        )
+        if after_index < before_index:
+            after_index = before_index
+        before_time = times[before_index]
+        after_time = times[after_index]
+        if after_time > before_time:
+            elapsed = (evaluation_time - before_time).total_seconds()
+            span = (after_time - before_time).total_seconds()
+            fraction = max(0.0, min(elapsed / span, 1.0))
 
-    return {
-        "vehicles": vehicle_metrics,
-        "overall_max_abs_cross_track_km": -math.inf,
-        "overall_min_abs_cross_track_km": math.inf,
-        "centroid": {
-            "min_cross_track_km": math.inf,
-            "min_abs_cross_track_km": math.inf,
-            "time_of_min_abs_cross_track": None,
-            "vehicle_cross_track_km_at_min": {},
-            "vehicle_abs_cross_track_km_at_min": {},
-            "worst_vehicle_abs_cross_track_km": math.inf,
-        },
-    }
+    evaluation_values: dict[str, float] = {}
+    evaluation_abs: dict[str, float] = {}
+    for column, identifier in enumerate(identifiers):
+        value = float("nan")
+        if times:
+            value_before = float(cross_track[before_index, column])
+            value_after = float(cross_track[after_index, column])
+            if math.isfinite(value_before) and math.isfinite(value_after):
+                value = value_before + fraction * (value_after - value_before)
+            elif math.isfinite(value_before):
+                value = value_before
+            elif math.isfinite(value_after):
+                value = value_after
+        evaluation_values[identifier] = value
+        evaluation_abs[identifier] = abs(value) if math.isfinite(value) else math.inf
 
+    centroid_value = fmean(evaluation_values.values()) if evaluation_values else math.nan
+    centroid_abs = abs(centroid_value) if math.isfinite(centroid_value) else math.inf
+    worst_abs = max(evaluation_abs.values()) if evaluation_abs else math.inf
 
-def _normalise_angle_degrees(angle_rad: float) -> float:
-    """Convert radians to wrapped degrees in the [0, 360) interval."""
+    primary_limit = float(settings.primary_cross_track_limit_km)
+    waiver_limit = float(settings.waiver_cross_track_limit_km)
+
+    primary_compliant = (
+        math.isfinite(centroid_abs)
+        and centroid_abs <= primary_limit
+        and math.isfinite(worst_abs)
+        and worst_abs <= waiver_limit
+    )
+    waiver_compliant = math.isfinite(worst_abs) and worst_abs <= waiver_limit
+    finite_vehicle_abs = [
+        value for value in evaluation_abs.values() if math.isfinite(value)
+    ]
+    waiver_pass_fraction = (
+        sum(1 for value in finite_vehicle_abs if value <= waiver_limit) / len(finite_vehicle_abs)
+        if finite_vehicle_abs
+        else 0.0
+    )
+    primary_pass_fraction = 1.0 if primary_compliant else 0.0
+
+    evaluation: MutableMapping[str, object] = {
+        "time_utc": evaluation_time.isoformat().replace("+00:00", "Z"),
+        "vehicles": {
+            identifier: (float(value) if math.isfinite(value) else None)
+            for identifier, value in evaluation_values.items()
+        },
+        "vehicle_abs": {
+            identifier: (float(value) if math.isfinite(value) else None)
+            for identifier, value in evaluation_abs.items()
+        },
+        "centroid_cross_track_km": (
+            float(centroid_value) if math.isfinite(centroid_value) else None
+        ),
+        "centroid_abs_cross_track_km": float(centroid_abs) if math.isfinite(centroid_abs) else None,
+        "worst_vehicle_abs_cross_track_km": float(worst_abs) if math.isfinite(worst_abs) else None,
+        "primary_compliant": bool(primary_compliant),
+        "waiver_compliant": bool(waiver_compliant),
+        "primary_limit_km": float(primary_limit),
+        "waiver_limit_km": float(waiver_limit),
+        "primary_pass_fraction": float(primary_pass_fraction),
+        "waiver_pass_fraction": float(waiver_pass_fraction),
+    }
+    return evaluation_values, evaluation_abs, evaluation
+
+
+def _propagate_formation_history(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+) -> tuple[list[SpacecraftState], list[datetime], np.ndarray, np.ndarray]:
+    """Return the initial states, epochs, and recorded ``(epochs, vehicles, 3)`` histories."""
+
+    epoch_offset = (settings.start_time - settings.epoch_time).total_seconds()
+    states = _initial_states(
+        leader_elements,
+        formation,
+        settings.drag_coefficient,
+        epoch_offset_s=epoch_offset,
+    )
+    positions, velocities, drag_factors = _state_arrays(states)
+    times = _epoch_grid(settings)
+    position_history, velocity_history = _record_states(
+        _propagated_states(positions, velocities, drag_factors, settings, len(times)),
+        len(times),
+    )
+    return states, times, position_history, velocity_history
+
+
+def _record_states(
+    states: Iterable[tuple[np.ndarray, np.ndarray]],
+    epoch_count: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Copy a stream of ``(..., 3)`` states into preallocated ``(epochs, ..., 3)`` arrays."""
+
+    position_history: np.ndarray | None = None
+    velocity_history: np.ndarray | None = None
+    for step, (positions, velocities) in enumerate(states):
+        if position_history is None:
+            position_history = np.empty((epoch_count, *np.shape(positions)), dtype=float)
+            velocity_history = np.empty((epoch_count, *np.shape(velocities)), dtype=float)
+        position_history[step] = positions
+        velocity_history[step] = velocities
+    return position_history, velocity_history
+
+
+def _orbital_element_series(
+    identifiers: Sequence[str],
+    position_history: np.ndarray,
+    velocity_history: np.ndarray,
+) -> dict[str, dict[str, list[float]]]:
+    """Return classical element histories for recorded ``(epochs, vehicles, 3)`` states."""
+
+    series: dict[str, dict[str, list[float]]] = {}
+    for index, identifier in enumerate(identifiers):
+        per_satellite: dict[str, list[float]] = {field: [] for field in CLASSICAL_ELEMENT_FIELDS}
+        for position, velocity in zip(position_history[:, index], velocity_history[:, index]):
+            elements = cartesian_to_classical(position, velocity)
+            per_satellite["semi_major_axis_km"].append(elements.semi_major_axis / 1_000.0)
+            per_satellite["eccentricity"].append(elements.eccentricity)
+            per_satellite["inclination_deg"].append(
+                _normalise_angle_degrees(elements.inclination)
+            )
+            per_satellite["raan_deg"].append(_normalise_angle_degrees(elements.raan))
+            per_satellite["argument_of_perigee_deg"].append(
+                _normalise_angle_degrees(elements.arg_perigee)
+            )
+            per_satellite["mean_anomaly_deg"].append(
+                _normalise_angle_degrees(elements.mean_anomaly)
+            )
+        series[identifier] = per_satellite
+    return series
+
+
+def _cross_track_summary(
+    identifiers: Sequence[str],
+    epochs: Sequence[datetime],
+    cross_track: np.ndarray,
+    relative: np.ndarray,
+    target_lat: float,
+    target_lon: float,
+) -> tuple[MutableMapping[str, object], MutableMapping[str, object]]:
+    """Summarise ``(epochs, vehicles)`` cross-track and ``(epochs,)`` relative histories.
+
+    Extrema report the first epoch at which they occur.  A pass is counted
+    whenever the signed offset changes sign between consecutive epochs or
+    leaves an exact zero.
+    """
+
+    stamps = [epoch.isoformat().replace("+00:00", "Z") for epoch in epochs]
+    abs_cross_track = np.abs(cross_track)
+    max_abs_index = np.argmax(abs_cross_track, axis=0)
+    min_abs_index = np.argmin(abs_cross_track, axis=0)
+    previous = cross_track[:-1]
+    passes = np.count_nonzero((previous == 0.0) | (previous * cross_track[1:] < 0.0), axis=0)
+
+    vehicle_metrics: list[MutableMapping[str, object]] = []
+    for column, identifier in enumerate(identifiers):
+        vehicle_metrics.append(
+            {
+                "identifier": identifier,
+                "target_latitude_deg": math.degrees(target_lat),
+                "target_longitude_deg": math.degrees(target_lon),
+                "max_cross_track_km": float(np.max(cross_track[:, column])),
+                "min_cross_track_km": float(np.min(cross_track[:, column])),
+                "max_abs_cross_track_km": float(abs_cross_track[max_abs_index[column], column]),
+                "min_abs_cross_track_km": float(abs_cross_track[min_abs_index[column], column]),
+                "time_of_max_abs_cross_track": stamps[max_abs_index[column]],
+                "time_of_min_abs_cross_track": stamps[min_abs_index[column]],
+                "pass_count": int(passes[column]),
+                "compliant": False,
+            }
+        )
+
+    centroid = np.mean(cross_track, axis=1)
+    centroid_index = int(np.argmin(np.abs(centroid)))
+    at_minimum = cross_track[centroid_index]
+    metrics: MutableMapping[str, object] = {
+        "vehicles": vehicle_metrics,
+        "overall_max_abs_cross_track_km": float(np.max(abs_cross_track)),
+        # The overall minimum is the worst vehicle's closest approach.
+        "overall_min_abs_cross_track_km": float(
+            max(np.max(np.min(abs_cross_track, axis=0)), 0.0)
+        ),
+        "centroid": {
+            "min_cross_track_km": float(centroid[centroid_index]),
+            "min_abs_cross_track_km": float(abs(centroid[centroid_index])),
+            "time_of_min_abs_cross_track": stamps[centroid_index],
+            "vehicle_cross_track_km_at_min": {
+                identifier: float(value) for identifier, value in zip(identifiers, at_minimum)
+            },
+            "vehicle_abs_cross_track_km_at_min": {
+                identifier: float(abs(value)) for identifier, value in zip(identifiers, at_minimum)
+            },
+            "worst_vehicle_abs_cross_track_km": float(np.max(np.abs(at_minimum))),
+        },
+    }
+
+    defined = np.isfinite(relative)
+    relative_abs = np.abs(relative[defined])
+    relative_stamps = [stamp for stamp, flag in zip(stamps, defined) if flag]
+    relative_summary: MutableMapping[str, object] = {
+        "max_abs_km": float(np.max(relative_abs, initial=0.0)),
+        "min_abs_km": float(np.min(relative_abs)) if relative_abs.size else 0.0,
+        "time_of_min": relative_stamps[int(np.argmin(relative_abs))] if relative_abs.size else None,
+        "series": [
+            (stamp, float(value)) for stamp, value in zip(relative_stamps, relative[defined])
+        ],
+    }
+    return metrics, relative_summary
+
+
+def _normalise_angle_degrees(angle_rad: float) -> float:
+    """Convert radians to wrapped degrees in the [0, 360) interval."""
 
     value = math.degrees(angle_rad)
     if not math.isfinite(value):
@@ -1054,187 +1468,108 @@ def _plane_intersection_metrics(
     }
 
 
-def _record_metrics(
-    states: Sequence[SpacecraftState],
-    epoch: datetime,
-    target_lat: float,
-    target_lon: float,
-    metrics: MutableMapping[str, object],
-    cross_track_series: MutableMapping[str, list[float]],
-    altitude_series: MutableMapping[str, list[float]],
-    relative_stats: MutableMapping[str, object],
-) -> None:
-    """Update cross-track statistics for the current epoch."""
-
-    vehicle_entries = metrics["vehicles"]
-    centroid_metrics = metrics.get("centroid", {})
-    epoch_values: dict[str, float] = {}
-
-    for index, state in enumerate(states):
-        position_ecef = inertial_to_ecef(state.position_m, epoch)
-        latitude, longitude, altitude = geodetic_coordinates(position_ecef)
-        cross_track_distance_m = haversine_distance(latitude, longitude, target_lat, target_lon)
-        sign = 1.0 if latitude >= target_lat else -1.0
-        cross_track_km = sign * (cross_track_distance_m / 1_000.0)
-
-        cross_track_series[state.identifier].append(float(cross_track_km))
-        altitude_series[state.identifier].append(float(altitude))
-        epoch_values[state.identifier] = float(cross_track_km)
-
-        entry = vehicle_entries[index]
-        entry["max_cross_track_km"] = max(entry["max_cross_track_km"], cross_track_km)
-        entry["min_cross_track_km"] = min(entry["min_cross_track_km"], cross_track_km)
-
-        abs_value = abs(cross_track_km)
-        if abs_value > entry["max_abs_cross_track_km"]:
-            entry["max_abs_cross_track_km"] = abs_value
-            entry["time_of_max_abs_cross_track"] = epoch.isoformat().replace("+00:00", "Z")
-        if abs_value < entry["min_abs_cross_track_km"]:
-            entry["min_abs_cross_track_km"] = abs_value
-            entry["time_of_min_abs_cross_track"] = epoch.isoformat().replace("+00:00", "Z")
-
-        previous_series = cross_track_series[state.identifier]
-        if len(previous_series) >= 2 and previous_series[-2] == 0.0:
-            entry["pass_count"] += 1
-        elif len(previous_series) >= 2 and previous_series[-2] * cross_track_km < 0.0:
-            entry["pass_count"] += 1
-
-        metrics["overall_max_abs_cross_track_km"] = max(
-            metrics["overall_max_abs_cross_track_km"], abs_value
-        )
-        metrics["overall_min_abs_cross_track_km"] = min(
-            metrics["overall_min_abs_cross_track_km"], abs_value
-        )
-
-    if epoch_values and isinstance(centroid_metrics, MutableMapping):
-        centroid_value = fmean(epoch_values.values())
-        abs_centroid = abs(centroid_value)
-        if abs_centroid < centroid_metrics.get("min_abs_cross_track_km", math.inf):
-            centroid_metrics["min_cross_track_km"] = float(centroid_value)
-            centroid_metrics["min_abs_cross_track_km"] = float(abs_centroid)
-            centroid_metrics["time_of_min_abs_cross_track"] = (
-                epoch.isoformat().replace("+00:00", "Z")
-            )
-            centroid_metrics["vehicle_cross_track_km_at_min"] = {
-                identifier: float(value) for identifier, value in epoch_values.items()
-            }
-            centroid_metrics["vehicle_abs_cross_track_km_at_min"] = {
-                identifier: float(abs(value))
-                for identifier, value in epoch_values.items()
-            }
-            centroid_metrics["worst_vehicle_abs_cross_track_km"] = float(
-                max(abs(value) for value in epoch_values.values())
-            )
+def _relative_pair_indices(identifiers: Sequence[str]) -> tuple[int | None, int | None]:
+    """Return the indices of the leader and first Plane B spacecraft, if present."""
 
-    leader_state = next((state for state in states if state.identifier == "FSAT-LDR"), None)
-    plane_b_state = next(
-        (state for state in states if PLANE_ASSIGNMENTS.get(state.identifier) == "Plane B"),
+    leader_index = next(
+        (index for index, identifier in enumerate(identifiers) if identifier == "FSAT-LDR"),
         None,
     )
-    if leader_state is not None and plane_b_state is not None:
-        normal_vec = np.cross(leader_state.position_m, leader_state.velocity_mps)
-        norm_normal = np.linalg.norm(normal_vec)
-        if norm_normal > 0.0:
-            normal_unit = normal_vec / norm_normal
-            relative_vec = plane_b_state.position_m - leader_state.position_m
-            cross_track_km = float(np.dot(relative_vec, normal_unit) / 1_000.0)
-            abs_val = abs(cross_track_km)
-            if abs_val > relative_stats["max_abs"]:
-                relative_stats["max_abs"] = abs_val
-            if abs_val < relative_stats["min_abs"]:
-                relative_stats["min_abs"] = abs_val
-                relative_stats["time_of_min"] = epoch.isoformat().replace("+00:00", "Z")
-            relative_stats["series"].append(
-                (epoch.isoformat().replace("+00:00", "Z"), cross_track_km)
-            )
+    plane_b_index = next(
+        (
+            index
+            for index, identifier in enumerate(identifiers)
+            if PLANE_ASSIGNMENTS.get(identifier) == "Plane B"
+        ),
+        None,
+    )
+    return leader_index, plane_b_index
 
 
-def _rk4_step(states: Sequence[SpacecraftState], dt: float, settings: PropagatorSettings) -> list[SpacecraftState]:
-    """Advance the spacecraft states by *dt* seconds using RK4 integration."""
+def _state_arrays(
+    states: Sequence[SpacecraftState],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stack *states* into ``(N, 3)`` position/velocity arrays and drag factors.
 
-    next_states: list[SpacecraftState] = []
-    for state in states:
-        x0 = state.position_m
-        v0 = state.velocity_mps
+    The drag factor of each spacecraft is ``C_d A / m`` so that the vectorised
+    force model can evaluate atmospheric drag for the whole formation at once.
+    """
 
-        a1 = _acceleration(x0, v0, state, settings)
-        k1_pos = v0
-        k1_vel = a1
+    positions = np.array([state.position_m for state in states], dtype=float).reshape(-1, 3)
+    velocities = np.array([state.velocity_mps for state in states], dtype=float).reshape(-1, 3)
+    drag_factors = np.array(
+        [state.drag_coefficient * state.area_m2 / state.mass_kg for state in states],
+        dtype=float,
+    )
+    return positions, velocities, drag_factors
 
-        a2 = _acceleration(x0 + 0.5 * dt * k1_pos, v0 + 0.5 * dt * k1_vel, state, settings)
-        k2_pos = v0 + 0.5 * dt * k1_vel
-        k2_vel = a2
 
-        a3 = _acceleration(x0 + 0.5 * dt * k2_pos, v0 + 0.5 * dt * k2_vel, state, settings)
-        k3_pos = v0 + 0.5 * dt * k2_vel
-        k3_vel = a3
+def _rk4_step(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    drag_factors: np.ndarray,
+    dt: float,
+    settings: PropagatorSettings,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Advance ``(N, 3)`` position and velocity arrays by *dt* seconds using RK4."""
+
+    a1 = _acceleration(positions, velocities, drag_factors, settings)
+    k1_pos = velocities
+    k1_vel = a1
 
-        a4 = _acceleration(x0 + dt * k3_pos, v0 + dt * k3_vel, state, settings)
-        k4_pos = v0 + dt * k3_vel
-        k4_vel = a4
+    k2_pos = velocities + 0.5 * dt * k1_vel
+    k2_vel = _acceleration(positions + 0.5 * dt * k1_pos, k2_pos, drag_factors, settings)
 
-        new_position = x0 + (dt / 6.0) * (k1_pos + 2.0 * k2_pos + 2.0 * k3_pos + k4_pos)
-        new_velocity = v0 + (dt / 6.0) * (k1_vel + 2.0 * k2_vel + 2.0 * k3_vel + k4_vel)
+    k3_pos = velocities + 0.5 * dt * k2_vel
+    k3_vel = _acceleration(positions + 0.5 * dt * k2_pos, k3_pos, drag_factors, settings)
 
-        state.position_m = new_position
-        state.velocity_mps = new_velocity
-        next_states.append(state)
+    k4_pos = velocities + dt * k3_vel
+    k4_vel = _acceleration(positions + dt * k3_pos, k4_pos, drag_factors, settings)
 
-    return next_states
+    new_positions = positions + (dt / 6.0) * (k1_pos + 2.0 * k2_pos + 2.0 * k3_pos + k4_pos)
+    new_velocities = velocities + (dt / 6.0) * (k1_vel + 2.0 * k2_vel + 2.0 * k3_vel + k4_vel)
+    return new_positions, new_velocities
 
 
 def _acceleration(
-    position: np.ndarray,
-    velocity: np.ndarray,
-    state: SpacecraftState,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    drag_factors: np.ndarray,
     settings: PropagatorSettings,
 ) -> np.ndarray:
-    r"""Return acceleration including central gravity, \(J_2\), and drag."""
+    r"""Return ``(N, 3)`` accelerations including central gravity, \(J_2\), and drag."""
 
-    r_vec = position
-    v_vec = velocity
-    r_norm = np.linalg.norm(r_vec)
+    r_norm = np.linalg.norm(positions, axis=-1, keepdims=True)
 
-    if r_norm == 0.0:
+    if np.any(r_norm == 0.0):
         raise ValueError("State vector has zero magnitude; cannot propagate.")
 
     mu = MU_EARTH
-    central = -mu * r_vec / (r_norm**3)
-
-    z2 = r_vec[2] ** 2
-    r2 = r_norm**2
-    factor = 1.5 * J2_COEFFICIENT * mu * (EARTH_EQUATORIAL_RADIUS_M**2) / (r_norm**5)
-    coef_xy = factor * (5.0 * z2 / r2 - 1.0)
-    coef_z = factor * (5.0 * z2 / r2 - 3.0)
-    accel_j2 = np.array([coef_xy * r_vec[0], coef_xy * r_vec[1], coef_z * r_vec[2]], dtype=float)
-
-    v_rel = v_vec - np.cross(OMEGA_EARTH_VECTOR, r_vec)
-    speed_rel = np.linalg.norm(v_rel)
-    altitude = r_norm - EARTH_EQUATORIAL_RADIUS_M
-    density = _atmospheric_density(altitude, settings.solar_flux_index)
-    drag = np.zeros(3, dtype=float)
-
-    if speed_rel > 0.0 and density > 0.0:
-        ballistic = state.area_m2 / state.mass_kg
-        drag = (
-            -0.5
-            * density
-            * state.drag_coefficient
-            * ballistic
-            * speed_rel
-            * v_rel
-        )
+    r2 = r_norm * r_norm
+    central = -mu * positions / (r2 * r_norm)
+
+    z2_over_r2 = positions[..., 2:3] ** 2 / r2
+    factor = 1.5 * J2_COEFFICIENT * mu * (EARTH_EQUATORIAL_RADIUS_M**2) / (r2 * r2 * r_norm)
+    accel_j2 = factor * (5.0 * z2_over_r2 - _J2_AXIS_OFFSETS) * positions
+
+    # Velocity relative to the co-rotating atmosphere, v - ω × r with ω along +z.
+    v_rel = velocities.copy()
+    v_rel[..., 0] += EARTH_ROTATION_RATE * positions[..., 1]
+    v_rel[..., 1] -= EARTH_ROTATION_RATE * positions[..., 0]
+    speed_rel = np.linalg.norm(v_rel, axis=-1, keepdims=True)
+    density = _atmospheric_density(r_norm - EARTH_EQUATORIAL_RADIUS_M, settings.solar_flux_index)
+    drag = -0.5 * density * drag_factors[..., np.newaxis] * speed_rel * v_rel
 
     return central + accel_j2 + drag
 
 
-def _atmospheric_density(altitude_m: float, solar_index: float) -> float:
+def _atmospheric_density(altitude_m: np.ndarray | float, solar_index: float) -> np.ndarray:
     """Return a simple exponential atmospheric density profile."""
 
     base_density = 3.614e-11  # kg/m^3 at 400 km reference
     scale_height = 55_000.0 * math.sqrt(max(solar_index, 1.0) / SOLAR_FLUX_BASE)
-    density = base_density * math.exp(-(altitude_m - 400_000.0) / scale_height)
-    return max(density, 0.0)
+    density = base_density * np.exp(-(np.asarray(altitude_m, dtype=float) - 400_000.0) / scale_height)
+    return np.maximum(density, 0.0)
 
 
 def _run_monte_carlo(
@@ -1261,7 +1596,11 @@ def _run_monte_carlo(
             "max_abs_cross_track_km": {},
             "fleet_compliance_probability": 1.0,
         }
-    runs = max(runs, 500)
+    adaptive = _normalise_adaptive_stopping(monte_carlo.get("adaptive"))
+    if adaptive["enabled"]:
+        runs = int(adaptive["max_runs"])
+    else:
+        runs = max(runs, 500)
 
     dispersions = monte_carlo.get("dispersions", {})
     sigma_a = float(dispersions.get("semi_major_axis_sigma_m", 0.0))
@@ -1269,191 +1608,856 @@ def _run_monte_carlo(
     sigma_cd = float(dispersions.get("drag_coefficient_sigma", 0.0))
 
     seed = int(monte_carlo.get("seed", 42))
-    rng = np.random.default_rng(seed)
-
-    vehicle_ids = [entry.get("identifier", "spacecraft") for entry in formation]
-    run_metrics_max: dict[str, list[float]] = {str(identifier): [] for identifier in vehicle_ids}
-    run_metrics_min: dict[str, list[float]] = {str(identifier): [] for identifier in vehicle_ids}
-    run_metrics_eval: dict[str, list[float]] = {str(identifier): [] for identifier in vehicle_ids}
-    intersection_distances: list[float] = []
-    relative_max_list: list[float] = []
-    relative_min_list: list[float] = []
-    centroid_abs_list: list[float] = []
-    worst_abs_list: list[float] = []
-
-    primary_success_count = 0
-    waiver_success_count = 0
-    relative_success_count = 0
-    plane_success_count = 0
+    mode = str(monte_carlo.get("mode", DEFAULT_MONTE_CARLO["mode"]))
+    batch_size = max(int(monte_carlo.get("batch_size", DEFAULT_MONTE_CARLO["batch_size"])), 1)
+    workers = max(int(monte_carlo.get("workers", DEFAULT_MONTE_CARLO["workers"])), 1)
+    spot_checks = (
+        max(int(monte_carlo.get("spot_checks", DEFAULT_MONTE_CARLO["spot_checks"])), 0)
+        if mode == "linearised"
+        else 0
+    )
+    sampler = str(monte_carlo.get("sampler", DEFAULT_MONTE_CARLO["sampler"]))
+    antithetic = bool(monte_carlo.get("antithetic", DEFAULT_MONTE_CARLO["antithetic"]))
 
     evaluation_time = _resolve_evaluation_time(settings)
-    primary_limit = float(settings.primary_cross_track_limit_km)
-    waiver_limit = float(settings.waiver_cross_track_limit_km)
-    plane_limit = settings.plane_intersection_limit_km
-
     epoch_offset = (settings.start_time - settings.epoch_time).total_seconds()
 
+    shard_starts = range(0, runs, batch_size)
+    shard_sizes = [min(batch_size, runs - start) for start in shard_starts]
+    workers = min(workers, len(shard_sizes))
+    # Shards are summarised in blocks that end on every multiple of the
+    # adaptive check interval, so the stopping rule is tested at the same run
+    # counts whatever the shard size.
+    check_interval = int(adaptive["batch_size"]) if adaptive["enabled"] else runs
+    shard_blocks = [
+        _monte_carlo_block_sizes(start, size, check_interval)
+        for start, size in zip(shard_starts, shard_sizes)
+    ]
+
     evaluation_iso = evaluation_time.isoformat().replace("+00:00", "Z")
     LOGGER.info(
-        "Monte Carlo dispersion: seed=%d, runs=%d, evaluation_utc=%s",
+        "Monte Carlo dispersion: seed=%d, runs=%d, mode=%s, sampler=%s%s, shards=%d, workers=%d, "
+        "adaptive=%s, evaluation_utc=%s",
         seed,
         runs,
+        mode,
+        sampler,
+        " (antithetic)" if antithetic else "",
+        len(shard_sizes),
+        workers,
+        adaptive["enabled"],
         evaluation_iso,
     )
 
-    for _ in range(runs):
-        dispersed_elements = OrbitalElements(
-            semi_major_axis=leader_elements.semi_major_axis + rng.normal(0.0, sigma_a),
-            eccentricity=leader_elements.eccentricity,
-            inclination=leader_elements.inclination + rng.normal(0.0, sigma_i),
-            raan=leader_elements.raan,
-            arg_perigee=leader_elements.arg_perigee,
-            mean_anomaly=leader_elements.mean_anomaly,
+    # Every shard draws from its own child of the root seed sequence, and the
+    # shard boundaries depend only on ``batch_size``, so the merged statistics
+    # are bit-identical for any worker count.
+    shard_seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+    sigmas = (sigma_a, sigma_i, sigma_cd)
+    # The linearised surrogate shares one set of sensitivities across the
+    # study, and only the first shard (always merged, even when an adaptive
+    # study stops early) checks it against the nonlinear dynamics.
+    sensitivities = (
+        _linearised_sensitivities(leader_elements, formation, settings, epoch_offset)
+        if mode == "linearised"
+        else None
+    )
+    shard_arguments = [
+        (
+            leader_elements,
+            formation,
+            settings,
+            target_lat,
+            target_lon,
+            sigmas,
+            shard_seed,
+            size,
+            mode,
+            epoch_offset,
+            evaluation_time,
+            spot_checks if index == 0 else 0,
+            sampler,
+            antithetic,
+            sensitivities,
+            blocks,
+        )
+        for index, (shard_seed, size, blocks) in enumerate(
+            zip(shard_seeds, shard_sizes, shard_blocks)
         )
+    ]
 
-        drag_scale = 1.0 + rng.normal(0.0, sigma_cd)
-        states = _initial_states(
-            dispersed_elements,
-            formation,
-            settings.drag_coefficient * drag_scale,
-            epoch_offset_s=epoch_offset,
+    # Blocks are merged and the stopping rule is checked strictly in run
+    # order, so an adaptive study stops after the same block for any worker
+    # count; the rest of that shard and those in flight are discarded.
+    accumulator: MonteCarloAccumulator | None = None
+    converged = False
+    shard_results = _monte_carlo_shard_results(shard_arguments, workers)
+    try:
+        for block_summaries in shard_results:
+            for block_summary in block_summaries:
+                if accumulator is None:
+                    accumulator = block_summary
+                else:
+                    accumulator.merge(block_summary)
+                if (
+                    adaptive["enabled"]
+                    and accumulator.runs % check_interval == 0
+                    and _compliance_intervals_converged(accumulator, adaptive)
+                ):
+                    converged = True
+                    break
+            if converged:
+                break
+    finally:
+        shard_results.close()
+
+    vehicle_ids = [str(entry.get("identifier", "spacecraft")) for entry in formation]
+    aggregated = _aggregate_monte_carlo(
+        accumulator,
+        vehicle_ids,
+        settings,
+        seed=seed,
+        evaluation_time=evaluation_time,
+    )
+    aggregated["confidence_intervals"] = _compliance_intervals(accumulator, adaptive)
+    aggregated["stopping"] = {
+        "adaptive": bool(adaptive["enabled"]),
+        "converged": converged,
+        "target_half_width": float(adaptive["half_width"]),
+        "max_runs": runs,
+        "batch_size": batch_size,
+        "check_interval": check_interval,
+    }
+    if adaptive["enabled"]:
+        LOGGER.info(
+            "Adaptive Monte Carlo %s after %d of %d runs.",
+            "converged" if converged else "exhausted its budget",
+            accumulator.runs,
+            runs,
+        )
+    return aggregated
+
+
+def _monte_carlo_block_sizes(start: int, size: int, check_interval: int) -> list[int]:
+    """Split the shard of *size* runs from *start* at every multiple of *check_interval*."""
+
+    first = (start // check_interval + 1) * check_interval
+    edges = [0, *(boundary - start for boundary in range(first, start + size, check_interval)), size]
+    return [upper - lower for lower, upper in zip(edges, edges[1:])]
+
+
+def _monte_carlo_shard_results(
+    shard_arguments: Sequence[tuple[object, ...]],
+    workers: int,
+) -> Iterator[list["MonteCarloAccumulator"]]:
+    """Yield each shard's block accumulators in order, keeping at most *workers* shards in flight."""
+
+    if workers <= 1:
+        for arguments in shard_arguments:
+            yield _run_monte_carlo_shard(*arguments)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        remaining = iter(shard_arguments)
+        pending = deque(
+            executor.submit(_run_monte_carlo_shard, *arguments)
+            for arguments in islice(remaining, workers)
+        )
+        while pending:
+            result = pending.popleft().result()
+            arguments = next(remaining, None)
+            if arguments is not None:
+                pending.append(executor.submit(_run_monte_carlo_shard, *arguments))
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _binomial_interval(
+    successes: int, trials: int, confidence_level: float, method: str
+) -> tuple[float, float]:
+    """Return the two-sided Wilson or Clopper–Pearson interval for a binomial fraction."""
+
+    if trials <= 0:
+        return 0.0, 1.0
+    from scipy.stats import beta, norm
+
+    alpha = 1.0 - confidence_level
+    if method == "clopper_pearson":
+        lower = (
+            0.0
+            if successes == 0
+            else float(beta.ppf(alpha / 2.0, successes, trials - successes + 1))
+        )
+        upper = (
+            1.0
+            if successes == trials
+            else float(beta.ppf(1.0 - alpha / 2.0, successes + 1, trials - successes))
+        )
+        return lower, upper
+
+    z = float(norm.ppf(1.0 - alpha / 2.0))
+    fraction = successes / trials
+    denominator = 1.0 + z * z / trials
+    centre = (fraction + z * z / (2.0 * trials)) / denominator
+    spread = z * math.sqrt(fraction * (1.0 - fraction) / trials + z * z / (4.0 * trials * trials))
+    spread /= denominator
+    lower = 0.0 if successes == 0 else max(centre - spread, 0.0)
+    upper = 1.0 if successes == trials else min(centre + spread, 1.0)
+    return lower, upper
+
+
+def _compliance_intervals(
+    accumulator: "MonteCarloAccumulator", adaptive: Mapping[str, object]
+) -> MutableMapping[str, object]:
+    """Return confidence intervals on the primary and waiver compliance fractions."""
+
+    level = float(adaptive["confidence_level"])
+    method = str(adaptive["interval"])
+    intervals: MutableMapping[str, object] = {"method": method, "confidence_level": level}
+    for key, successes in (
+        ("primary_fraction", accumulator.primary_compliant),
+        ("waiver_fraction", accumulator.waiver_compliant),
+    ):
+        lower, upper = _binomial_interval(successes, accumulator.runs, level, method)
+        intervals[key] = {
+            "lower": lower,
+            "upper": upper,
+            "half_width": 0.5 * (upper - lower),
+        }
+    return intervals
+
+
+def _compliance_intervals_converged(
+    accumulator: "MonteCarloAccumulator", adaptive: Mapping[str, object]
+) -> bool:
+    """Return whether both compliance intervals are narrower than the target half-width."""
+
+    intervals = _compliance_intervals(accumulator, adaptive)
+    target = float(adaptive["half_width"])
+    return all(
+        intervals[key]["half_width"] <= target for key in ("primary_fraction", "waiver_fraction")
+    )
+
+
+def _run_monte_carlo_shard(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    target_lat: float,
+    target_lon: float,
+    sigmas: tuple[float, float, float],
+    seed_sequence: np.random.SeedSequence,
+    runs: int,
+    mode: str,
+    epoch_offset: float,
+    evaluation_time: datetime,
+    spot_checks: int = 0,
+    sampler: str = "pseudo_random",
+    antithetic: bool = False,
+    sensitivities: LinearisedSensitivities | None = None,
+    block_sizes: Sequence[int] | None = None,
+) -> list["MonteCarloAccumulator"]:
+    """Propagate one shard of dispersions and reduce it to mergeable statistics.
+
+    The shard is summarised as consecutive blocks of *block_sizes* runs (one
+    block by default) so the caller can test a stopping rule part-way through
+    it.  In ``linearised`` mode the samples are mapped through *sensitivities*
+    (computed here when omitted), and the first *spot_checks* samples are also
+    propagated with the nonlinear ensemble, the largest cross-track
+    discrepancy being carried in the first block's accumulator.
+    """
+
+    rng = np.random.default_rng(seed_sequence)
+    # Columns hold the semi-major axis [m], inclination [rad], and relative drag
+    # coefficient offsets.  Scaling standard-normal draws keeps the random
+    # numbers common to variants that share a seed but differ in their sigmas.
+    samples = standard_normal_samples(
+        rng, runs, 3, sampler=sampler, antithetic=antithetic
+    ) * np.asarray(sigmas, dtype=float)
+    arguments = (leader_elements, formation, settings, target_lat, target_lon)
+    if mode == "linearised":
+        run_metrics = _propagate_monte_carlo_linearised(
+            *arguments, samples, epoch_offset, evaluation_time, sensitivities
+        )
+    else:
+        propagate = (
+            _propagate_monte_carlo_serial if mode == "serial" else _propagate_monte_carlo_ensemble
+        )
+        run_metrics = propagate(*arguments, samples, epoch_offset, evaluation_time)
+    edges = np.cumsum([0, *(block_sizes or [runs])])
+    accumulators = [
+        _summarise_run_metrics(
+            MonteCarloRunMetrics(
+                *(getattr(run_metrics, field.name)[lower:upper] for field in fields(run_metrics))
+            ),
+            settings,
+        )
+        for lower, upper in zip(edges, edges[1:])
+    ]
+
+    check_count = min(spot_checks, runs)
+    if check_count:
+        reference = _propagate_monte_carlo_ensemble(
+            *arguments, samples[:check_count], epoch_offset, evaluation_time
+        )
+        errors = [
+            np.abs(getattr(reference, name) - getattr(run_metrics, name)[:check_count])
+            for name in ("vehicle_max_abs_km", "vehicle_min_abs_km", "vehicle_evaluation_km")
+        ]
+        accumulators[0].surrogate_checks = check_count
+        accumulators[0].surrogate_max_error_km = float(
+            max(np.max(error, initial=0.0) for error in errors)
+        )
+    return accumulators
+
+
+@dataclass
+class MonteCarloRunMetrics:
+    """Per-run Monte Carlo outcomes stacked along a leading run axis.
+
+    Vehicle arrays have shape ``(runs, vehicles)``; the remaining arrays have
+    shape ``(runs,)``.  Cross-track values are expressed in kilometres.
+    """
+
+    vehicle_max_abs_km: np.ndarray
+    vehicle_min_abs_km: np.ndarray
+    vehicle_evaluation_km: np.ndarray
+    relative_max_abs_km: np.ndarray
+    relative_min_abs_km: np.ndarray
+    plane_distance_km: np.ndarray
+
+
+def _epoch_grid(settings: PropagatorSettings) -> list[datetime]:
+    """Return the fixed-step epochs visited by the propagators."""
+
+    epochs: list[datetime] = []
+    epoch = settings.start_time
+    while epoch <= settings.stop_time + timedelta(seconds=1e-6):
+        epochs.append(epoch)
+        if epoch >= settings.stop_time:
+            break
+        epoch += timedelta(seconds=settings.time_step_s)
+    return epochs
+
+
+def _nearest_epoch_index(epochs: Sequence[datetime], target: datetime) -> int:
+    """Return the index of the first epoch closest to *target*."""
+
+    offsets = [abs((epoch - target).total_seconds()) for epoch in epochs]
+    return int(np.argmin(offsets)) if offsets else 0
+
+
+def _cross_track_km(
+    positions: np.ndarray,
+    epochs: Sequence[datetime],
+    target_lat: float,
+    target_lon: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return signed cross-track distances [km] and altitudes [m] for ``(epochs, ..., 3)`` positions."""
+
+    latitude, longitude, altitude = geodetic_coordinates_array(
+        inertial_to_ecef_series(positions, epochs)
+    )
+    distance_m = haversine_distance_array(latitude, longitude, target_lat, target_lon)
+    sign = np.where(latitude >= target_lat, 1.0, -1.0)
+    return sign * (distance_m / 1_000.0), altitude
+
+
+def _relative_cross_track_km(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    leader_index: int,
+    plane_b_index: int,
+) -> np.ndarray:
+    """Return the Plane B offset along the leader orbit normal for ``(..., N, 3)`` states.
+
+    Entries whose leader angular momentum vanishes are returned as NaN.
+    """
+
+    leader_position = positions[..., leader_index, :]
+    normal = np.cross(leader_position, velocities[..., leader_index, :])
+    norm = np.linalg.norm(normal, axis=-1)
+    relative = positions[..., plane_b_index, :] - leader_position
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset_km = np.einsum("...i,...i->...", relative, normal) / norm / 1_000.0
+    return np.where(norm > 0.0, offset_km, np.nan)
+
+
+def _plane_intersection_distance_km(
+    identifiers: Sequence[str],
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    target_lat: float,
+    target_lon: float,
+) -> np.ndarray:
+    """Vectorised target distance of :func:`_plane_intersection_metrics`.
+
+    *positions* and *velocities* have shape ``(..., N, 3)``; the result drops the
+    vehicle and vector axes and holds ``inf`` wherever the planes are undefined.
+    """
+
+    momentum = np.cross(positions, velocities)
+    momentum_norm = np.linalg.norm(momentum, axis=-1)
+    valid = momentum_norm > 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_normals = np.where(valid[..., np.newaxis], momentum / momentum_norm[..., np.newaxis], 0.0)
+
+    plane_labels = np.array([PLANE_ASSIGNMENTS.get(identifier, "Plane A") for identifier in identifiers])
+    averaged: list[np.ndarray] = []
+    defined = np.ones(positions.shape[:-2], dtype=bool)
+    for plane in ("Plane A", "Plane B"):
+        members = valid & (plane_labels == plane)
+        mean_vec = np.sum(unit_normals * members[..., np.newaxis], axis=-2)
+        mean_norm = np.linalg.norm(mean_vec, axis=-1)
+        defined &= (np.count_nonzero(members, axis=-1) > 0) & (mean_norm > 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averaged.append(mean_vec / mean_norm[..., np.newaxis])
+
+    line_direction = np.cross(averaged[0], averaged[1])
+    line_norm = np.linalg.norm(line_direction, axis=-1)
+    defined &= line_norm > 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        surface_point = line_direction / line_norm[..., np.newaxis] * EARTH_EQUATORIAL_RADIUS_M
+        candidates = np.stack((surface_point, -surface_point))
+        latitude, longitude, _ = geodetic_coordinates_array(candidates)
+        distances = haversine_distance_array(latitude, longitude, target_lat, target_lon)
+    return np.where(defined, np.min(distances, axis=0) / 1_000.0, math.inf)
+
+
+def _dispersed_initial_states(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    sample: np.ndarray,
+    epoch_offset: float,
+) -> list[SpacecraftState]:
+    """Return the formation initial states for one dispersion *sample*."""
+
+    delta_a, delta_i, delta_cd = (float(value) for value in sample)
+    dispersed_elements = OrbitalElements(
+        semi_major_axis=leader_elements.semi_major_axis + delta_a,
+        eccentricity=leader_elements.eccentricity,
+        inclination=leader_elements.inclination + delta_i,
+        raan=leader_elements.raan,
+        arg_perigee=leader_elements.arg_perigee,
+        mean_anomaly=leader_elements.mean_anomaly,
+    )
+    return _initial_states(
+        dispersed_elements,
+        formation,
+        settings.drag_coefficient * (1.0 + delta_cd),
+        epoch_offset_s=epoch_offset,
+    )
+
+
+def _dispersed_state_arrays(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    samples: np.ndarray,
+    epoch_offset: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(runs, vehicles, 3)`` initial states and drag factors for *samples*."""
+
+    run_count = len(samples)
+    vehicle_count = len(formation)
+    positions = np.empty((run_count, vehicle_count, 3), dtype=float)
+    velocities = np.empty((run_count, vehicle_count, 3), dtype=float)
+    drag_factors = np.empty((run_count, vehicle_count), dtype=float)
+    for index, sample in enumerate(samples):
+        states = _dispersed_initial_states(
+            leader_elements, formation, settings, sample, epoch_offset
+        )
+        positions[index], velocities[index], drag_factors[index] = _state_arrays(states)
+    return positions, velocities, drag_factors
+
+
+def _propagated_states(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    drag_factors: np.ndarray,
+    settings: PropagatorSettings,
+    epoch_count: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield the RK4-propagated states at each of *epoch_count* grid epochs."""
+
+    yield positions, velocities
+    for _ in range(epoch_count - 1):
+        positions, velocities = _rk4_step(
+            positions, velocities, drag_factors, settings.time_step_s, settings
+        )
+        yield positions, velocities
+
+
+def _run_metrics_from_states(
+    identifiers: Sequence[str],
+    epochs: Sequence[datetime],
+    states: Iterable[tuple[np.ndarray, np.ndarray]],
+    target_lat: float,
+    target_lon: float,
+    evaluation_time: datetime,
+) -> MonteCarloRunMetrics:
+    """Reduce a stream of ``(runs, vehicles, 3)`` states on *epochs* to per-run metrics."""
+
+    position_history, velocity_history = _record_states(states, len(epochs))
+    cross_track = _cross_track_km(position_history, epochs, target_lat, target_lon)[0]
+    plane_distances = _plane_intersection_distance_km(
+        identifiers, position_history[0], velocity_history[0], target_lat, target_lon
+    )
+    relative = np.full(cross_track.shape[:2], np.nan, dtype=float)
+    leader_index, plane_b_index = _relative_pair_indices(identifiers)
+    if leader_index is not None and plane_b_index is not None:
+        relative[1:] = _relative_cross_track_km(
+            position_history[1:], velocity_history[1:], leader_index, plane_b_index
+        )
+
+    abs_cross_track = np.abs(cross_track)
+    # The relative offset is sampled after each integration step, matching the
+    # serial loop which never inspected the initial epoch.
+    abs_relative = np.abs(relative[1:])
+    return MonteCarloRunMetrics(
+        vehicle_max_abs_km=np.max(abs_cross_track, axis=0),
+        vehicle_min_abs_km=np.min(abs_cross_track, axis=0),
+        vehicle_evaluation_km=cross_track[_nearest_epoch_index(epochs, evaluation_time)],
+        relative_max_abs_km=np.max(
+            np.nan_to_num(abs_relative, nan=0.0), axis=0, initial=0.0
+        ),
+        relative_min_abs_km=np.min(
+            np.where(np.isnan(abs_relative), math.inf, abs_relative), axis=0, initial=math.inf
+        ),
+        plane_distance_km=plane_distances,
+    )
+
+
+def _propagate_monte_carlo_ensemble(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    target_lat: float,
+    target_lon: float,
+    samples: np.ndarray,
+    epoch_offset: float,
+    evaluation_time: datetime,
+) -> MonteCarloRunMetrics:
+    """Propagate every dispersion in *samples* together as ``(runs, vehicles, 3)`` arrays."""
+
+    identifiers = [str(entry.get("identifier", "spacecraft")) for entry in formation]
+    positions, velocities, drag_factors = _dispersed_state_arrays(
+        leader_elements, formation, settings, samples, epoch_offset
+    )
+    epochs = _epoch_grid(settings)
+    return _run_metrics_from_states(
+        identifiers,
+        epochs,
+        _propagated_states(positions, velocities, drag_factors, settings, len(epochs)),
+        target_lat,
+        target_lon,
+        evaluation_time,
+    )
+
+
+@dataclass
+class LinearisedSensitivities:
+    """Nominal formation states on the epoch grid and their dispersion sensitivities.
+
+    ``positions`` and ``velocities`` have shape ``(epochs, vehicles, 3)``; the
+    sensitivity arrays add a parameter axis, ``(epochs, 3, vehicles, 3)``.
+    """
+
+    positions: np.ndarray
+    velocities: np.ndarray
+    position_sensitivity: np.ndarray
+    velocity_sensitivity: np.ndarray
+
+
+def _linearised_sensitivities(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    epoch_offset: float,
+) -> LinearisedSensitivities:
+    r"""Propagate the nominal formation and its central-difference neighbours.
+
+    The seven trajectories yield the sensitivity
+    :math:`\partial \mathbf{x}_k / \partial \mathbf{p}` of every state on the epoch
+    grid (the state-transition matrix projected onto the dispersion
+    directions, including the drag-coefficient parameter).
+    """
+
+    steps = _SENSITIVITY_STEPS
+    stencil = np.vstack((np.zeros(3), np.diag(steps), -np.diag(steps)))
+    positions, velocities, drag_factors = _dispersed_state_arrays(
+        leader_elements, formation, settings, stencil, epoch_offset
+    )
+    epoch_count = len(_epoch_grid(settings))
+    position_history, velocity_history = _record_states(
+        _propagated_states(positions, velocities, drag_factors, settings, epoch_count),
+        epoch_count,
+    )
+    scale = (2.0 * steps)[:, np.newaxis, np.newaxis]
+    return LinearisedSensitivities(
+        positions=position_history[:, 0],
+        velocities=velocity_history[:, 0],
+        position_sensitivity=(position_history[:, 1:4] - position_history[:, 4:7]) / scale,
+        velocity_sensitivity=(velocity_history[:, 1:4] - velocity_history[:, 4:7]) / scale,
+    )
+
+
+def _propagate_monte_carlo_linearised(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    target_lat: float,
+    target_lon: float,
+    samples: np.ndarray,
+    epoch_offset: float,
+    evaluation_time: datetime,
+    sensitivities: LinearisedSensitivities | None = None,
+) -> MonteCarloRunMetrics:
+    r"""Map *samples* through the dispersion sensitivities of the nominal trajectory.
+
+    Each sampled state is
+    :math:`\mathbf{x}_k + (\partial \mathbf{x}_k / \partial \mathbf{p})\,\delta\mathbf{p}`
+    with the sensitivities of :func:`_linearised_sensitivities`.  Passing them
+    in lets a whole study share one propagation of seven trajectories,
+    regardless of the number of samples or shards.  Cross-track metrics are
+    evaluated on the linearised states exactly as in the nonlinear ensemble.
+    """
+
+    if sensitivities is None:
+        sensitivities = _linearised_sensitivities(
+            leader_elements, formation, settings, epoch_offset
+        )
+    identifiers = [str(entry.get("identifier", "spacecraft")) for entry in formation]
+    epochs = _epoch_grid(settings)
+    weights = np.asarray(samples, dtype=float)
+
+    def linearised_states() -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        for index in range(len(epochs)):
+            yield (
+                sensitivities.positions[index]
+                + np.einsum("rp,pnk->rnk", weights, sensitivities.position_sensitivity[index]),
+                sensitivities.velocities[index]
+                + np.einsum("rp,pnk->rnk", weights, sensitivities.velocity_sensitivity[index]),
+            )
+
+    return _run_metrics_from_states(
+        identifiers,
+        epochs,
+        linearised_states(),
+        target_lat,
+        target_lon,
+        evaluation_time,
+    )
+
+
+def _propagate_monte_carlo_serial(
+    leader_elements: OrbitalElements,
+    formation: Sequence[Mapping[str, float | str]],
+    settings: PropagatorSettings,
+    target_lat: float,
+    target_lon: float,
+    samples: np.ndarray,
+    epoch_offset: float,
+    evaluation_time: datetime,
+) -> MonteCarloRunMetrics:
+    """Propagate each dispersion in *samples* on its own (reference implementation)."""
+
+    run_count = len(samples)
+    vehicle_count = len(formation)
+    metrics = MonteCarloRunMetrics(
+        vehicle_max_abs_km=np.full((run_count, vehicle_count), -math.inf),
+        vehicle_min_abs_km=np.full((run_count, vehicle_count), math.inf),
+        vehicle_evaluation_km=np.full((run_count, vehicle_count), math.nan),
+        relative_max_abs_km=np.zeros(run_count),
+        relative_min_abs_km=np.full(run_count, math.inf),
+        plane_distance_km=np.full(run_count, math.inf),
+    )
+
+    for run_index, sample in enumerate(samples):
+        states = _dispersed_initial_states(
+            leader_elements, formation, settings, sample, epoch_offset
         )
         plane_metrics = _plane_intersection_metrics(states, target_lat, target_lon)
-        plane_distance = float(plane_metrics.get("target_distance_km", math.inf))
+        metrics.plane_distance_km[run_index] = float(
+            plane_metrics.get("target_distance_km", math.inf)
+        )
+        identifiers = [str(state.identifier) for state in states]
+        positions, velocities, drag_factors = _state_arrays(states)
+        leader_index, plane_b_index = _relative_pair_indices(identifiers)
 
         epoch = settings.start_time
         dt = settings.time_step_s
-        vehicle_metrics = _initial_metric_structure(states, target_lat, target_lon)
-        previous_signs = {state.identifier: 0.0 for state in states}
-        relative_run_stats = {"max": 0.0, "min": math.inf}
-        evaluation_snapshot: dict[str, float] = {}
+        max_abs = metrics.vehicle_max_abs_km[run_index]
+        min_abs = metrics.vehicle_min_abs_km[run_index]
         evaluation_best = math.inf
 
         while epoch <= settings.stop_time + timedelta(seconds=1e-6):
-            current_values: dict[str, float] = {}
-            for idx, state in enumerate(states):
-                position_ecef = inertial_to_ecef(state.position_m, epoch)
+            current_values = np.empty(len(identifiers), dtype=float)
+            for idx in range(len(identifiers)):
+                position_ecef = inertial_to_ecef(positions[idx], epoch)
                 latitude, longitude, _ = geodetic_coordinates(position_ecef)
                 distance = haversine_distance(latitude, longitude, target_lat, target_lon)
                 sign = 1.0 if latitude >= target_lat else -1.0
                 cross_track_km = sign * (distance / 1_000.0)
 
-                vehicle_entry = vehicle_metrics["vehicles"][idx]
-                vehicle_entry["max_cross_track_km"] = max(
-                    vehicle_entry["max_cross_track_km"], cross_track_km
-                )
-                vehicle_entry["min_cross_track_km"] = min(
-                    vehicle_entry["min_cross_track_km"], cross_track_km
-                )
                 abs_value = abs(cross_track_km)
-                if abs_value > vehicle_entry["max_abs_cross_track_km"]:
-                    vehicle_entry["max_abs_cross_track_km"] = abs_value
-                if abs_value < vehicle_entry["min_abs_cross_track_km"]:
-                    vehicle_entry["min_abs_cross_track_km"] = abs_value
-
-                current_values[str(state.identifier)] = float(cross_track_km)
-
-                identifier = str(state.identifier)
-                previous_sign = previous_signs[identifier]
-                if previous_sign != 0.0 and previous_sign * cross_track_km < 0.0:
-                    vehicle_entry["pass_count"] += 1
-                previous_signs[identifier] = cross_track_km
+                max_abs[idx] = max(max_abs[idx], abs_value)
+                min_abs[idx] = min(min_abs[idx], abs_value)
+                current_values[idx] = cross_track_km
 
             diff = abs((epoch - evaluation_time).total_seconds())
             if diff < evaluation_best:
                 evaluation_best = diff
-                evaluation_snapshot = dict(current_values)
+                metrics.vehicle_evaluation_km[run_index] = current_values
 
             if epoch >= settings.stop_time:
                 break
 
-            states = _rk4_step(states, dt, settings)
+            positions, velocities = _rk4_step(positions, velocities, drag_factors, dt, settings)
             epoch += timedelta(seconds=dt)
 
-            leader_state = next((state for state in states if state.identifier == "FSAT-LDR"), None)
-            plane_b_state = next(
-                (state for state in states if PLANE_ASSIGNMENTS.get(state.identifier) == "Plane B"),
-                None,
-            )
-            if leader_state is not None and plane_b_state is not None:
-                normal_vec = np.cross(leader_state.position_m, leader_state.velocity_mps)
+            if leader_index is not None and plane_b_index is not None:
+                normal_vec = np.cross(positions[leader_index], velocities[leader_index])
                 norm_normal = np.linalg.norm(normal_vec)
                 if norm_normal > 0.0:
                     normal_unit = normal_vec / norm_normal
-                    relative_vec = plane_b_state.position_m - leader_state.position_m
-                    cross_track_km = float(np.dot(relative_vec, normal_unit) / 1_000.0)
-                    abs_val = abs(cross_track_km)
-                    if abs_val > relative_run_stats["max"]:
-                        relative_run_stats["max"] = abs_val
-                    if abs_val < relative_run_stats["min"]:
-                        relative_run_stats["min"] = abs_val
-
-        evaluation_abs = {
-            identifier: abs(value) if math.isfinite(value) else math.inf
-            for identifier, value in evaluation_snapshot.items()
-        }
-        centroid_value = (
-            fmean(evaluation_snapshot.values()) if evaluation_snapshot else math.nan
-        )
-        centroid_abs = abs(centroid_value) if math.isfinite(centroid_value) else math.inf
-        worst_abs = max(evaluation_abs.values()) if evaluation_abs else math.inf
-
-        primary_compliant = (
-            math.isfinite(centroid_abs)
-            and centroid_abs <= primary_limit
-            and math.isfinite(worst_abs)
-            and worst_abs <= waiver_limit
+                    relative_vec = positions[plane_b_index] - positions[leader_index]
+                    abs_val = abs(float(np.dot(relative_vec, normal_unit) / 1_000.0))
+                    if abs_val > metrics.relative_max_abs_km[run_index]:
+                        metrics.relative_max_abs_km[run_index] = abs_val
+                    if abs_val < metrics.relative_min_abs_km[run_index]:
+                        metrics.relative_min_abs_km[run_index] = abs_val
+
+    return metrics
+
+
+@dataclass
+class MonteCarloAccumulator:
+    """Compliance counts and distribution summaries for a block of Monte Carlo runs."""
+
+    runs: int
+    primary_compliant: int
+    waiver_compliant: int
+    relative_compliant: int
+    plane_compliant: int
+    vehicle_max_abs_km: list[StreamingAccumulator]
+    vehicle_min_abs_km: list[StreamingAccumulator]
+    vehicle_evaluation_abs_km: list[StreamingAccumulator]
+    plane_distance_km: StreamingAccumulator
+    relative_max_abs_km: StreamingAccumulator
+    relative_min_abs_km: StreamingAccumulator
+    centroid_abs_km: StreamingAccumulator
+    worst_abs_km: StreamingAccumulator
+    surrogate_checks: int = 0
+    surrogate_max_error_km: float = 0.0
+
+    def merge(self, other: "MonteCarloAccumulator") -> None:
+        """Combine the runs summarised by *other* into this accumulator."""
+
+        self.runs += other.runs
+        self.primary_compliant += other.primary_compliant
+        self.waiver_compliant += other.waiver_compliant
+        self.relative_compliant += other.relative_compliant
+        self.plane_compliant += other.plane_compliant
+        self.surrogate_checks += other.surrogate_checks
+        self.surrogate_max_error_km = max(
+            self.surrogate_max_error_km, other.surrogate_max_error_km
         )
-        waiver_compliant = math.isfinite(worst_abs) and worst_abs <= waiver_limit
-
-        if math.isfinite(centroid_abs):
-            centroid_abs_list.append(centroid_abs)
-        if math.isfinite(worst_abs):
-            worst_abs_list.append(worst_abs)
-
-        for entry in vehicle_metrics["vehicles"]:
-            identifier = str(entry["identifier"])
-            max_abs = float(entry["max_abs_cross_track_km"])
-            min_abs = float(entry.get("min_abs_cross_track_km", math.inf))
-            value = evaluation_snapshot.get(identifier, float("nan"))
-            abs_value = evaluation_abs.get(identifier, math.inf)
-            entry["cross_track_at_evaluation_km"] = (
-                float(value) if math.isfinite(value) else None
-            )
-            entry["abs_cross_track_at_evaluation_km"] = (
-                float(abs_value) if math.isfinite(abs_value) else None
-            )
-            entry["compliant"] = bool(
-                math.isfinite(abs_value) and abs_value <= waiver_limit
-            )
-            run_metrics_max[identifier].append(max_abs)
-            if math.isfinite(min_abs):
-                run_metrics_min[identifier].append(min_abs)
-            if math.isfinite(abs_value):
-                run_metrics_eval[identifier].append(abs_value)
+        for mine, theirs in zip(
+            (*self.vehicle_max_abs_km, *self.vehicle_min_abs_km, *self.vehicle_evaluation_abs_km),
+            (*other.vehicle_max_abs_km, *other.vehicle_min_abs_km, *other.vehicle_evaluation_abs_km),
+        ):
+            mine.merge(theirs)
+        for name in (
+            "plane_distance_km",
+            "relative_max_abs_km",
+            "relative_min_abs_km",
+            "centroid_abs_km",
+            "worst_abs_km",
+        ):
+            getattr(self, name).merge(getattr(other, name))
+
+
+def _summarise_run_metrics(
+    run_metrics: MonteCarloRunMetrics,
+    settings: PropagatorSettings,
+) -> MonteCarloAccumulator:
+    """Reduce per-run outcomes into compliance counts and mergeable statistics."""
 
-        plane_success = True
-        if math.isfinite(plane_distance):
-            if plane_limit is not None:
-                intersection_distances.append(plane_distance)
-                plane_success = plane_distance <= plane_limit
-        elif plane_limit is not None:
-            plane_success = False
-
-        if plane_success:
-            plane_success_count += 1
-
-        if math.isfinite(relative_run_stats["max"]):
-            relative_max_list.append(relative_run_stats["max"])
-        if math.isfinite(relative_run_stats["min"]):
-            relative_min_list.append(relative_run_stats["min"])
-
-        if primary_compliant:
-            primary_success_count += 1
-        if waiver_compliant:
-            waiver_success_count += 1
-        if relative_run_stats["max"] <= waiver_limit:
-            relative_success_count += 1
+    runs, vehicle_count = run_metrics.vehicle_max_abs_km.shape
+    primary_limit = float(settings.primary_cross_track_limit_km)
+    waiver_limit = float(settings.waiver_cross_track_limit_km)
+    plane_limit = settings.plane_intersection_limit_km
+
+    evaluation = run_metrics.vehicle_evaluation_km
+    evaluation_abs = np.where(np.isfinite(evaluation), np.abs(evaluation), math.inf)
+    centroid_abs = np.abs(np.mean(evaluation, axis=1))
+    centroid_abs = np.where(np.isfinite(centroid_abs), centroid_abs, math.inf)
+    worst_abs = np.max(evaluation_abs, axis=1)
+
+    waiver_compliant = np.isfinite(worst_abs) & (worst_abs <= waiver_limit)
+    primary_compliant = (
+        np.isfinite(centroid_abs) & (centroid_abs <= primary_limit) & waiver_compliant
+    )
+    relative_compliant = run_metrics.relative_max_abs_km <= waiver_limit
+
+    plane_distance = run_metrics.plane_distance_km
+    if plane_limit is not None:
+        plane_compliant = np.isfinite(plane_distance) & (plane_distance <= plane_limit)
+    else:
+        plane_compliant = np.ones(runs, dtype=bool)
+
+    def statistics(values: np.ndarray) -> StreamingAccumulator:
+        summary = StreamingAccumulator()
+        summary.update(values)
+        return summary
+
+    return MonteCarloAccumulator(
+        runs=int(runs),
+        primary_compliant=int(np.count_nonzero(primary_compliant)),
+        waiver_compliant=int(np.count_nonzero(waiver_compliant)),
+        relative_compliant=int(np.count_nonzero(relative_compliant)),
+        plane_compliant=int(np.count_nonzero(plane_compliant)),
+        vehicle_max_abs_km=[
+            statistics(run_metrics.vehicle_max_abs_km[:, column]) for column in range(vehicle_count)
+        ],
+        vehicle_min_abs_km=[
+            statistics(run_metrics.vehicle_min_abs_km[:, column]) for column in range(vehicle_count)
+        ],
+        vehicle_evaluation_abs_km=[
+            statistics(evaluation_abs[:, column]) for column in range(vehicle_count)
+        ],
+        plane_distance_km=statistics(plane_distance),
+        relative_max_abs_km=statistics(run_metrics.relative_max_abs_km),
+        relative_min_abs_km=statistics(run_metrics.relative_min_abs_km),
+        centroid_abs_km=statistics(centroid_abs),
+        worst_abs_km=statistics(worst_abs),
+    )
+
+
+def _aggregate_monte_carlo(
+    accumulator: MonteCarloAccumulator,
+    vehicle_ids: Sequence[str],
+    settings: PropagatorSettings,
+    *,
+    seed: int,
+    evaluation_time: datetime,
+) -> MutableMapping[str, object]:
+    """Convert merged Monte Carlo statistics into compliance fractions and summaries."""
+
+    runs = accumulator.runs
+    primary_limit = float(settings.primary_cross_track_limit_km)
+    waiver_limit = float(settings.waiver_cross_track_limit_km)
+    plane_limit = settings.plane_intersection_limit_km
+
+    def fraction(count: int) -> float:
+        return float(count / runs) if runs else 0.0
+
+    primary_fraction = fraction(accumulator.primary_compliant)
+    waiver_fraction = fraction(accumulator.waiver_compliant)
 
     aggregated: MutableMapping[str, object] = {
         "runs": runs,
@@ -1463,18 +2467,12 @@ def _run_monte_carlo(
         "evaluation_abs_cross_track_km": {},
         "relative_cross_track_km": {},
         "compliance": {
-            "primary_fraction": float(primary_success_count / runs) if runs else 0.0,
-            "waiver_fraction": float(waiver_success_count / runs) if runs else 0.0,
-            "relative_fraction": float(relative_success_count / runs) if runs else 0.0,
+            "primary_fraction": primary_fraction,
+            "waiver_fraction": waiver_fraction,
+            "relative_fraction": fraction(accumulator.relative_compliant),
         },
-        "fleet_compliance_probability": float(primary_success_count / runs)
-        if runs
-        else 0.0,
-        "absolute_cross_track_compliance_probability": float(
-            waiver_success_count / runs
-        )
-        if runs
-        else 0.0,
+        "fleet_compliance_probability": primary_fraction,
+        "absolute_cross_track_compliance_probability": waiver_fraction,
         "evaluation_time_utc": evaluation_time.isoformat().replace("+00:00", "Z"),
         "cross_track_limits_km": {
             "primary": float(primary_limit),
@@ -1484,97 +2482,43 @@ def _run_monte_carlo(
 
     if plane_limit is not None:
         aggregated["plane_intersection_distance_km"] = {}
+        aggregated["compliance"]["plane_fraction"] = fraction(accumulator.plane_compliant)
+
+    for column, identifier in enumerate(vehicle_ids):
+        for key, statistics in (
+            ("max_abs_cross_track_km", accumulator.vehicle_max_abs_km[column]),
+            ("min_abs_cross_track_km", accumulator.vehicle_min_abs_km[column]),
+            ("evaluation_abs_cross_track_km", accumulator.vehicle_evaluation_abs_km[column]),
+        ):
+            if statistics.count:
+                aggregated[key][identifier] = statistics.summary()
+
+    if plane_limit is not None and accumulator.plane_distance_km.count:
+        aggregated["plane_intersection_distance_km"]["fleet"] = (
+            accumulator.plane_distance_km.summary()
+        )
 
-    if plane_limit is not None:
-        aggregated["compliance"]["plane_fraction"] = float(
-            plane_success_count / runs
-        ) if runs else 0.0
-
-    for identifier, values in run_metrics_max.items():
-        if not values:
-            continue
-        array = np.asarray(values, dtype=float)
-        aggregated["max_abs_cross_track_km"][identifier] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
-
-    for identifier, values in run_metrics_min.items():
-        if not values:
-            continue
-        array = np.asarray(values, dtype=float)
-        aggregated["min_abs_cross_track_km"][identifier] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
-
-    for identifier, values in run_metrics_eval.items():
-        if not values:
-            continue
-        array = np.asarray(values, dtype=float)
-        aggregated["evaluation_abs_cross_track_km"][identifier] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
-
-    if plane_limit is not None and intersection_distances:
-        array = np.asarray(intersection_distances, dtype=float)
-        aggregated["plane_intersection_distance_km"]["fleet"] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
-
-    if relative_max_list:
-        array = np.asarray(relative_max_list, dtype=float)
-        aggregated["relative_cross_track_km"]["fleet_relative_max"] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
-    if relative_min_list:
-        array = np.asarray(relative_min_list, dtype=float)
-        aggregated["relative_cross_track_km"]["fleet_relative_min"] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
+    if accumulator.relative_max_abs_km.count:
+        aggregated["relative_cross_track_km"]["fleet_relative_max"] = (
+            accumulator.relative_max_abs_km.summary()
+        )
+    if accumulator.relative_min_abs_km.count:
+        aggregated["relative_cross_track_km"]["fleet_relative_min"] = (
+            accumulator.relative_min_abs_km.summary()
+        )
 
-    if centroid_abs_list:
-        array = np.asarray(centroid_abs_list, dtype=float)
-        centroid_stats = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
-        }
+    if accumulator.centroid_abs_km.count:
+        centroid_stats = accumulator.centroid_abs_km.summary()
         aggregated["centroid_abs_cross_track_km"] = centroid_stats
         aggregated["centroid_abs_cross_track_km_mean"] = centroid_stats["mean"]
         aggregated["centroid_abs_cross_track_km_p95"] = centroid_stats["p95"]
-    if worst_abs_list:
-        array = np.asarray(worst_abs_list, dtype=float)
-        aggregated["worst_vehicle_abs_cross_track_km"] = {
-            "mean": float(np.mean(array)),
-            "std": float(np.std(array)),
-            "p95": float(np.percentile(array, 95.0)),
-            "min": float(np.min(array)),
-            "max": float(np.max(array)),
+    if accumulator.worst_abs_km.count:
+        aggregated["worst_vehicle_abs_cross_track_km"] = accumulator.worst_abs_km.summary()
+
+    if accumulator.surrogate_checks:
+        aggregated["surrogate_validation"] = {
+            "spot_checks": accumulator.surrogate_checks,
+            "max_abs_cross_track_error_km": accumulator.surrogate_max_error_km,
         }
 
     return aggregated
@@ -1630,6 +2574,7 @@ def _write_outputs(
     _write_monte_carlo_csv(monte_carlo_path, monte_carlo_metrics)
     monte_carlo_summary_path.write_text(json.dumps(monte_carlo_metrics, indent=2), encoding="utf-8")
 
+    monte_carlo_runs, monte_carlo_max_runs = _monte_carlo_run_counts(monte_carlo_metrics)
     settings_payload = {
         "propagator": {
             "integrator": "fixed_step_rk4",
@@ -1644,8 +2589,16 @@ def _write_outputs(
             },
         },
         "monte_carlo": {
-            "runs": monte_carlo_config.get("runs", 0),
+            "runs": monte_carlo_runs,
+            "max_runs": monte_carlo_max_runs,
             "seed": monte_carlo_config.get("seed", 0),
+            "mode": monte_carlo_config.get("mode", DEFAULT_MONTE_CARLO["mode"]),
+            "batch_size": monte_carlo_config.get("batch_size", DEFAULT_MONTE_CARLO["batch_size"]),
+            "workers": monte_carlo_config.get("workers", DEFAULT_MONTE_CARLO["workers"]),
+            "spot_checks": monte_carlo_config.get("spot_checks", DEFAULT_MONTE_CARLO["spot_checks"]),
+            "sampler": monte_carlo_config.get("sampler", DEFAULT_MONTE_CARLO["sampler"]),
+            "antithetic": monte_carlo_config.get("antithetic", DEFAULT_MONTE_CARLO["antithetic"]),
+            "adaptive": monte_carlo_config.get("adaptive", DEFAULT_MONTE_CARLO["adaptive"]),
             "dispersions": monte_carlo_config.get("dispersions", {}),
         },
         "epoch_time_utc": settings.epoch_time.isoformat().replace("+00:00", "Z"),
@@ -1839,8 +2792,13 @@ def _parse_time(value: object) -> datetime | None:
 
 
 __all__ = [
+    "CrossTrackSeries",
     "PropagatorSettings",
+    "RaanSweep",
+    "prepare_raan_sweep",
     "propagate_constellation",
+    "propagate_cross_track",
+    "propagate_cross_track_windows",
     "scenario_cross_track_limits",
     "scenario_access_window",
 ]
@@ -21,31 +21,32 @@ workflows.  The CLI accepts either a named scenario (resolved relative to the
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import logging
 import math
-import tempfile
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from statistics import fmean
 from typing import Iterable, Mapping, MutableMapping, Optional, Sequence
 
+import numpy as np
+
 from tools.render_scenario_plots import generate_visualisations as generate_scenario_plots
 from tools.stk_export import (
+    ColumnarGroundTrack,
+    ColumnarStateHistory,
     FacilityDefinition,
     GroundContactInterval,
-    GroundTrack,
-    GroundTrackPoint,
-    PropagatedStateHistory,
     ScenarioMetadata,
     SimulationResults,
-    StateSample,
+    epoch_array,
     export_simulation_to_stk,
 )
 
+from src.constellation.earth_orientation import earth_orientation, greenwich_sidereal_angle
+
 from . import configuration
 from . import perturbation_analysis
 
@@ -53,11 +54,14 @@ LOGGER = logging.getLogger(__name__)
 
 MU_EARTH_KM3_S2 = 398_600.4418
 EARTH_RADIUS_KM = 6_378.1363
+J2_COEFFICIENT = 1.082_626_68e-3
 EARTH_FLATTENING = 1.0 / 298.257_223_563
 EARTH_ECCENTRICITY_SQUARED = 2.0 * EARTH_FLATTENING - EARTH_FLATTENING**2
 EARTH_SECOND_ECCENTRICITY_SQUARED = (
     EARTH_ECCENTRICITY_SQUARED / (1.0 - EARTH_ECCENTRICITY_SQUARED)
 )
+RAAN_SWEEP_MODES = ("rotation", "propagate")
+_RAAN_OBJECTIVE_PENALTY_KM = 1.0e9
 
 
 @dataclass
@@ -115,6 +119,7 @@ def run_scenario(
     output_directory: Optional[Path | str] = None,
     *,
     metrics_specification: Optional[Sequence[str]] = None,
+    monte_carlo_workers: Optional[int] = None,
 ) -> MutableMapping[str, object]:
     """Execute the sequential scenario pipeline."""
 
@@ -123,7 +128,7 @@ def run_scenario(
 
     stage_sequence: list[str] = []
 
-    raan_alignment = _resolve_raan_alignment(scenario)
+    raan_alignment = _resolve_raan_alignment(scenario, workers=monte_carlo_workers)
     if raan_alignment:
         stage_sequence.append("raan_alignment")
         best = raan_alignment.get("best_evaluation", {})
@@ -155,6 +160,7 @@ def run_scenario(
         scenario,
         output_directory=output_directory,
         raan_alignment=raan_alignment,
+        monte_carlo_workers=monte_carlo_workers,
     )
     stage_sequence.append("high_fidelity_j2_drag_propagation")
     LOGGER.info(
@@ -256,6 +262,11 @@ def parse_args(args: Optional[Iterable[str]] = None) -> argparse.Namespace:
         metavar="METRIC",
         help="Optional list of metric identifiers to prioritise in the summary.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes sharing the RAAN search and Monte Carlo runs.",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -283,6 +294,7 @@ def main(args: Optional[Iterable[str]] = None) -> int:
         config_source,
         output_directory=namespace.output_dir,
         metrics_specification=namespace.metrics,
+        monte_carlo_workers=namespace.workers,
     )
 
     stage_description = ", ".join(results["stage_sequence"])
@@ -304,9 +316,25 @@ def _load_configuration(source: configuration.ConfigSource) -> MutableMapping[st
 
 
 def _resolve_raan_alignment(
-    scenario: MutableMapping[str, object]
+    scenario: MutableMapping[str, object],
+    workers: Optional[int] = None,
 ) -> MutableMapping[str, object]:
-    """Optimise the RAAN to minimise centroid cross-track at the window midpoint."""
+    """Optimise the RAAN to minimise centroid cross-track at the window midpoint.
+
+    The search is seeded with the RAAN that places the sub-satellite point on
+    the target meridian at the midpoint (:func:`_analytic_raan_guess`).  A
+    stencil of ``bracket_samples`` candidates spanning ``search_span_deg``
+    either side of the seed is evaluated concurrently across *workers*
+    processes, after which bounded Brent iterations refine the bracket around
+    the best stencil point.  Should the refined optimum settle against an edge
+    of that bracket, the seed missed the basin: ``coarse_samples`` candidates
+    spread over ``coarse_range_deg`` (the full circle by default) are then
+    evaluated on the same pool and Brent is restarted around the best of
+    them.  With the default ``sweep`` of ``"rotation"`` the
+    formation is propagated once and every candidate is evaluated by rotating
+    the stored states about the spin axis (:class:`perturbation_analysis.RaanSweep`);
+    ``"propagate"`` re-propagates each candidate instead.
+    """
 
     orbital = scenario.get("orbital_elements")
     if not isinstance(orbital, MutableMapping):
@@ -340,21 +368,34 @@ def _resolve_raan_alignment(
     else:
         window_duration = float(solver_config.get("window_duration_s", 90.0))
     time_step = float(solver_config.get("time_step_s", 10.0))
-    search_span = float(solver_config.get("search_span_deg", 5.0))
-    samples = max(int(solver_config.get("samples_per_iteration", 9)), 3)
-    iterations = max(int(solver_config.get("iterations", 4)), 1)
+    search_span = max(float(solver_config.get("search_span_deg", 5.0)), 1e-3)
+    solver_config = _migrate_raan_solver_keys(solver_config)
+    bracket_samples = max(int(solver_config.get("bracket_samples", 5)), 3)
+    tolerance_deg = max(float(solver_config.get("tolerance_deg", 1e-4)), 1e-8)
+    max_iterations = max(int(solver_config.get("max_iterations", 25)), 1)
     coarse_samples = max(int(solver_config.get("coarse_samples", 36)), 3)
-    margin_s = max(float(solver_config.get("propagation_margin_s", 300.0)), 120.0)
-    coarse_range = solver_config.get("coarse_range_deg", (0.0, 360.0))
+    coarse_lower, coarse_upper = 0.0, 360.0
+    coarse_range = solver_config.get("coarse_range_deg")
     if (
         isinstance(coarse_range, Sequence)
         and len(coarse_range) == 2
         and all(isinstance(value, (int, float)) for value in coarse_range)
+        and float(coarse_range[1]) > float(coarse_range[0])
     ):
-        coarse_lower = float(coarse_range[0])
-        coarse_upper = float(coarse_range[1])
-    else:
-        coarse_lower, coarse_upper = 0.0, 360.0
+        coarse_lower, coarse_upper = float(coarse_range[0]), float(coarse_range[1])
+    margin_s = max(float(solver_config.get("propagation_margin_s", 300.0)), 120.0)
+    sweep_mode = str(solver_config.get("sweep", "rotation")).strip().lower()
+    if sweep_mode not in RAAN_SWEEP_MODES:
+        LOGGER.warning(
+            "Unknown RAAN sweep mode %r; falling back to 'rotation'.", sweep_mode
+        )
+        sweep_mode = "rotation"
+    if workers is None:
+        workers = solver_config.get("workers", 1)
+    try:
+        workers = max(int(workers), 1)
+    except (TypeError, ValueError):
+        workers = 1
 
     margin = timedelta(seconds=margin_s)
     if window_start:
@@ -371,10 +412,7 @@ def _resolve_raan_alignment(
     primary_limit, waiver_limit, plane_limit = perturbation_analysis.scenario_cross_track_limits(
         scenario
     )
-
-    baseline = _evaluate_raan_candidate(
-        scenario,
-        initial_raan,
+    candidate_arguments = (
         start_time,
         stop_time,
         epoch_time,
@@ -386,90 +424,93 @@ def _resolve_raan_alignment(
         plane_limit,
     )
 
-    evaluations: list[MutableMapping[str, object]] = [baseline]
-    best_result: MutableMapping[str, object] | None = baseline
-
-    for index in range(coarse_samples):
-        if coarse_samples == 1:
-            candidate = coarse_lower
-        else:
-            fraction = index / (coarse_samples - 1)
-            candidate = coarse_lower + (coarse_upper - coarse_lower) * fraction
-        result = _evaluate_raan_candidate(
+    sweep: Optional[perturbation_analysis.RaanSweep] = None
+    if sweep_mode == "rotation":
+        # Rotated candidates cost a frame conversion rather than a propagation,
+        # so a process pool would only add overhead.
+        sweep = perturbation_analysis.prepare_raan_sweep(
             scenario,
-            candidate,
-            start_time,
-            stop_time,
-            epoch_time,
-            time_step,
-            window_duration,
-            midpoint,
-            primary_limit,
-            waiver_limit,
-            plane_limit,
-        )
-        evaluations.append(result)
-        if not best_result or (
-            result.get("centroid_abs_cross_track_km", math.inf)
-            < best_result.get("centroid_abs_cross_track_km", math.inf)
-        ):
-            best_result = result
-
-    if not best_result:
-        return {}
-
-    centre_raan = float(best_result.get("raan_deg", initial_raan))
-    lower = centre_raan - search_span
-    upper = centre_raan + search_span
-
-    for _ in range(iterations):
-        iteration_results: list[MutableMapping[str, object]] = []
-        for index in range(samples):
-            if samples == 1:
-                candidate = lower
-            else:
-                fraction = index / (samples - 1)
-                candidate = lower + (upper - lower) * fraction
-            result = _evaluate_raan_candidate(
-                scenario,
-                candidate,
+            settings=_raan_candidate_settings(
                 start_time,
                 stop_time,
                 epoch_time,
                 time_step,
-                window_duration,
                 midpoint,
                 primary_limit,
                 waiver_limit,
                 plane_limit,
-            )
-            evaluations.append(result)
-            iteration_results.append(result)
-            if not best_result or (
-                result.get("centroid_abs_cross_track_km", math.inf)
-                < best_result.get("centroid_abs_cross_track_km", math.inf)
-            ):
-                best_result = result
+            ),
+        )
+        workers = 1
 
-        if not iteration_results:
-            break
+    analytic_raan = _analytic_raan_guess(scenario, classical, epoch_time, midpoint)
+    centre_raan = initial_raan if analytic_raan is None else analytic_raan
+
+    def objective(result: Mapping[str, object]) -> float:
+        value = result.get("centroid_abs_cross_track_km")
+        return float(value) if isinstance(value, (int, float)) else math.inf
+
+    # The baseline and the bracketing stencil are independent propagations, so
+    # they are evaluated concurrently; Brent's iterations are inherently serial.
+    offsets = [
+        -search_span + 2.0 * search_span * index / (bracket_samples - 1)
+        for index in range(bracket_samples)
+    ]
+    stencil = [centre_raan + offset for offset in offsets]
+    first_round = _evaluate_raan_candidates(
+        scenario, [initial_raan, *stencil], candidate_arguments, workers, sweep
+    )
+    baseline = first_round[0]
+    evaluations: list[MutableMapping[str, object]] = list(first_round)
+
+    from scipy.optimize import minimize_scalar
 
-        iteration_best = min(
-            iteration_results,
-            key=lambda item: item.get("centroid_abs_cross_track_km", math.inf),
+    def brent_objective(raan_deg: float) -> float:
+        result = _evaluate_raan_candidate(scenario, raan_deg, *candidate_arguments, sweep=sweep)
+        evaluations.append(result)
+        value = objective(result)
+        return value if math.isfinite(value) else _RAAN_OBJECTIVE_PENALTY_KM
+
+    def refine(
+        samples: Sequence[float], results: Sequence[Mapping[str, object]]
+    ) -> tuple[tuple[float, float], object]:
+        values = [objective(result) for result in results]
+        best = min(range(len(samples)), key=values.__getitem__)
+        bracket = (samples[max(best - 1, 0)], samples[min(best + 1, len(samples) - 1)])
+        return bracket, minimize_scalar(
+            brent_objective,
+            bounds=bracket,
+            method="bounded",
+            options={"xatol": tolerance_deg, "maxiter": max_iterations},
         )
-        centre = float(iteration_best.get("raan_deg", initial_raan))
-        span = max((upper - lower) / max(samples - 1, 1), 1e-4)
-        lower = centre - span
-        upper = centre + span
 
-    baseline_value = baseline.get("centroid_abs_cross_track_km", math.inf)
-    best_value = best_result.get("centroid_abs_cross_track_km", math.inf) if best_result else math.inf
-    if (
-        isinstance(baseline_value, (int, float))
-        and isinstance(best_value, (int, float))
-        and float(best_value) < float(baseline_value)
-    ):
+    (lower, upper), refinement = refine(stencil, first_round[1:])
+
+    # Bounded Brent never leaves its bracket, so an optimum pressed against an
+    # edge means the true minimum lies outside the stencil.
+    edge_margin = 2.0 * tolerance_deg
+    coarse_scan = bool(min(refinement.x - lower, upper - refinement.x) <= edge_margin)
+    if coarse_scan:
+        LOGGER.info(
+            "RAAN optimum %.4f deg reached the bracket edge; rescanning %.1f-%.1f deg.",
+            refinement.x,
+            coarse_lower,
+            coarse_upper,
+        )
+        coarse = [
+            coarse_lower + (coarse_upper - coarse_lower) * index / (coarse_samples - 1)
+            for index in range(coarse_samples)
+        ]
+        coarse_results = _evaluate_raan_candidates(
+            scenario, coarse, candidate_arguments, workers, sweep
+        )
+        evaluations.extend(coarse_results)
+        (lower, upper), refinement = refine(coarse, coarse_results)
+
+    best_result = min(evaluations[1:], key=objective)
+    baseline_value = objective(baseline)
+    best_value = objective(best_result)
+    if best_value < baseline_value:
         optimised_raan = float(best_result.get("raan_deg", initial_raan))
     else:
         best_result = baseline
@@ -479,10 +520,21 @@ def _resolve_raan_alignment(
 
     summary: MutableMapping[str, object] = {
         "initial_raan_deg": float(initial_raan),
+        "analytic_raan_deg": None if analytic_raan is None else _normalise_raan_deg(analytic_raan),
         "optimised_raan_deg": optimised_raan,
         "target_midpoint_utc": _format_time(midpoint),
         "window_duration_s": window_duration,
         "time_step_s": time_step,
+        "solver": {
+            "method": "bounded_brent",
+            "sweep": sweep_mode,
+            "bracket_deg": [_normalise_raan_deg(lower), _normalise_raan_deg(upper)],
+            "coarse_scan": coarse_scan,
+            "tolerance_deg": tolerance_deg,
+            "converged": bool(refinement.success),
+            "evaluation_count": len(evaluations),
+            "workers": workers,
+        },
         "evaluations": evaluations,
         "best_evaluation": best_result,
     }
@@ -504,6 +556,103 @@ def _resolve_raan_alignment(
     return summary
 
 
+_LEGACY_RAAN_SOLVER_KEYS = {
+    "samples_per_iteration": "bracket_samples",
+    "iterations": "max_iterations",
+}
+
+
+def _migrate_raan_solver_keys(solver_config: Mapping[str, object]) -> Mapping[str, object]:
+    """Map the grid-search keys of the former RAAN solver onto the Brent ones."""
+
+    migrated = dict(solver_config)
+    for legacy, current in _LEGACY_RAAN_SOLVER_KEYS.items():
+        if legacy not in migrated:
+            continue
+        value = migrated.pop(legacy)
+        LOGGER.warning(
+            "raan_alignment.%s is deprecated; use raan_alignment.%s instead.", legacy, current
+        )
+        migrated.setdefault(current, value)
+    return migrated
+
+
+def _analytic_raan_guess(
+    scenario: Mapping[str, object],
+    classical: Mapping[str, object],
+    epoch_time: datetime,
+    midpoint: datetime,
+) -> Optional[float]:
+    r"""Return the RAAN [deg] that puts the sub-satellite point on the target meridian.
+
+    The argument of latitude :math:`u` at *midpoint* follows from the mean
+    anomaly and argument of perigee advanced with their secular :math:`J_2`
+    rates.  The satellite's right ascension is
+    :math:`\Omega + \operatorname{atan2}(\cos i \sin u, \cos u)`, and matching
+    it to the target's right ascension :math:`\theta_{\text{GMST}} + \lambda`
+    gives the RAAN at *midpoint*, which is then regressed back to the epoch.
+    """
+
+    semi_major_axis = _coerce_float(classical, "semi_major_axis_km", 0.0)
+    if semi_major_axis <= 0.0:
+        return None
+    eccentricity = min(max(_coerce_float(classical, "eccentricity", 0.0), 0.0), 0.99)
+    inclination = math.radians(_coerce_float(classical, "inclination_deg", 0.0))
+    arg_perigee = math.radians(_coerce_float(classical, "argument_of_perigee_deg", 0.0))
+    mean_anomaly = math.radians(_coerce_float(classical, "mean_anomaly_deg", 0.0))
+
+    metadata = scenario.get("metadata")
+    region = metadata.get("region") if isinstance(metadata, Mapping) else None
+    target_longitude = math.radians(
+        _coerce_float(region, "longitude_deg", 51.3890) if isinstance(region, Mapping) else 51.3890
+    )
+
+    mean_motion = math.sqrt(MU_EARTH_KM3_S2 / semi_major_axis**3)
+    semi_latus_rectum = semi_major_axis * (1.0 - eccentricity**2)
+    j2_factor = 1.5 * J2_COEFFICIENT * (EARTH_RADIUS_KM / semi_latus_rectum) ** 2 * mean_motion
+    cos_inc = math.cos(inclination)
+    raan_rate = -j2_factor * cos_inc
+    arg_perigee_rate = 0.5 * j2_factor * (5.0 * cos_inc**2 - 1.0)
+    mean_anomaly_rate = mean_motion + 0.5 * j2_factor * math.sqrt(1.0 - eccentricity**2) * (
+        3.0 * cos_inc**2 - 1.0
+    )
+
+    elapsed = (midpoint - epoch_time).total_seconds()
+    mean_anomaly_mid = math.fmod(mean_anomaly + mean_anomaly_rate * elapsed, 2.0 * math.pi)
+    true_anomaly = _eccentric_to_true_anomaly(
+        _solve_kepler(mean_anomaly_mid, eccentricity), eccentricity
+    )
+    argument_of_latitude = arg_perigee + arg_perigee_rate * elapsed + true_anomaly
+
+    in_plane_right_ascension = math.atan2(
+        cos_inc * math.sin(argument_of_latitude), math.cos(argument_of_latitude)
+    )
+    raan_mid = _greenwich_sidereal_angle(midpoint) + target_longitude - in_plane_right_ascension
+    return _normalise_raan_deg(math.degrees(raan_mid - raan_rate * elapsed))
+
+
+def _evaluate_raan_candidates(
+    scenario: Mapping[str, object],
+    candidates: Sequence[float],
+    arguments: Sequence[object],
+    workers: int,
+    sweep: Optional[perturbation_analysis.RaanSweep] = None,
+) -> list[MutableMapping[str, object]]:
+    """Evaluate independent RAAN *candidates*, in a process pool when *workers* > 1."""
+
+    if workers > 1 and len(candidates) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(candidates))) as executor:
+            futures = [
+                executor.submit(_evaluate_raan_candidate, scenario, candidate, *arguments)
+                for candidate in candidates
+            ]
+            return [future.result() for future in futures]
+    return [
+        _evaluate_raan_candidate(scenario, candidate, *arguments, sweep=sweep)
+        for candidate in candidates
+    ]
+
+
 def _raan_target_midpoint(scenario: Mapping[str, object]) -> Optional[datetime]:
     """Return the midpoint of the primary access window for RAAN alignment."""
 
@@ -551,54 +700,37 @@ def _evaluate_raan_candidate(
     primary_limit_km: float,
     waiver_limit_km: float,
     plane_limit_km: float | None,
+    *,
+    sweep: Optional[perturbation_analysis.RaanSweep] = None,
 ) -> MutableMapping[str, object]:
-    """Evaluate centroid cross-track performance for a RAAN candidate."""
+    """Evaluate centroid cross-track performance for a RAAN candidate.
 
-    scenario_copy = deepcopy(scenario)
-    orbital = scenario_copy.setdefault("orbital_elements", {})
-    classical = orbital.setdefault("classical", {})
-    normalised_raan = _normalise_raan_deg(raan_deg)
-    classical["raan_deg"] = normalised_raan
+    When *sweep* is given the candidate is obtained by rotating its stored
+    trajectory rather than by propagating the formation again.
+    """
 
-    settings = perturbation_analysis.PropagatorSettings(
-        start_time=start_time,
-        epoch_time=epoch_time,
-        stop_time=stop_time,
-        time_step_s=time_step_s,
-        drag_coefficient=2.2,
-        ballistic_coefficient_m2_per_kg=0.025,
-        solar_flux_index=perturbation_analysis.SOLAR_FLUX_BASE,
-        evaluation_time=evaluation_time,
-        primary_cross_track_limit_km=primary_limit_km,
-        waiver_cross_track_limit_km=waiver_limit_km,
-        plane_intersection_limit_km=plane_limit_km,
+    normalised_raan = _normalise_raan_deg(raan_deg)
+    settings = _raan_candidate_settings(
+        start_time,
+        stop_time,
+        epoch_time,
+        time_step_s,
+        evaluation_time,
+        primary_limit_km,
+        waiver_limit_km,
+        plane_limit_km,
     )
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        perturbation_analysis.propagate_constellation(
-            scenario_copy,
-            output_directory=Path(tmp_dir),
+    if sweep is not None:
+        series = sweep.cross_track(normalised_raan)
+    else:
+        series = perturbation_analysis.propagate_cross_track(
+            scenario,
             settings=settings,
-            monte_carlo={"enabled": False, "runs": 0},
+            raan_deg=normalised_raan,
         )
-        cross_track_path = Path(tmp_dir) / "deterministic_cross_track.csv"
-        samples = _load_cross_track_series(cross_track_path)
-
-    sample_time = None
-    sample_values: MutableMapping[str, float] = {}
-    best_diff = math.inf
-    for timestamp, values in samples:
-        if not values:
-            continue
-        diff = abs((timestamp - evaluation_time).total_seconds())
-        if diff < best_diff:
-            best_diff = diff
-            sample_time = timestamp
-            sample_values = values
-
-    if sample_time is None:
-        sample_time = evaluation_time
-        sample_values = {}
+    sample_time, values = series.nearest_sample(evaluation_time)
+    sample_values = {identifier: values[identifier] for identifier in sorted(values)}
 
     centroid = fmean(sample_values.values()) if sample_values else math.nan
     abs_values = {identifier: abs(value) for identifier, value in sample_values.items()}
@@ -657,32 +789,31 @@ def _evaluate_raan_candidate(
     return result
 
 
-def _load_cross_track_series(
-    csv_path: Path,
-) -> list[tuple[datetime, MutableMapping[str, float]]]:
-    """Return the cross-track series from *csv_path* as timestamped samples."""
-
-    samples: list[tuple[datetime, MutableMapping[str, float]]] = []
-    if not csv_path.exists():
-        return samples
-
-    with csv_path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            timestamp = _parse_time(row.get("time_iso"))
-            if timestamp is None:
-                continue
-            values: MutableMapping[str, float] = {}
-            for key, value in row.items():
-                if key == "time_iso":
-                    continue
-                try:
-                    values[key] = float(value)
-                except (TypeError, ValueError):
-                    continue
-            samples.append((timestamp, values))
+def _raan_candidate_settings(
+    start_time: datetime,
+    stop_time: datetime,
+    epoch_time: datetime,
+    time_step_s: float,
+    evaluation_time: datetime,
+    primary_limit_km: float,
+    waiver_limit_km: float,
+    plane_limit_km: float | None,
+) -> perturbation_analysis.PropagatorSettings:
+    """Return the propagation settings shared by every RAAN candidate."""
 
-    return samples
+    return perturbation_analysis.PropagatorSettings(
+        start_time=start_time,
+        epoch_time=epoch_time,
+        stop_time=stop_time,
+        time_step_s=time_step_s,
+        drag_coefficient=2.2,
+        ballistic_coefficient_m2_per_kg=0.025,
+        solar_flux_index=perturbation_analysis.SOLAR_FLUX_BASE,
+        evaluation_time=evaluation_time,
+        primary_cross_track_limit_km=primary_limit_km,
+        waiver_cross_track_limit_km=waiver_limit_km,
+        plane_intersection_limit_km=plane_limit_km,
+    )
 
 
 def _normalise_raan_deg(value: float) -> float:
@@ -845,6 +976,7 @@ def _apply_j2_drag(
     *,
     output_directory: Optional[Path | str] = None,
     raan_alignment: Optional[Mapping[str, object]] = None,
+    monte_carlo_workers: Optional[int] = None,
 ) -> tuple[
     MutableMapping[str, object],
     MutableMapping[str, str],
@@ -853,9 +985,17 @@ def _apply_j2_drag(
 
     del phases  # Phases are retained for compatibility with earlier signatures.
 
+    # The scenario's Monte Carlo block configures the dispersion study; the
+    # command-line worker count overrides the one it may carry.
+    monte_carlo = scenario.get("monte_carlo")
+    monte_carlo = dict(monte_carlo) if isinstance(monte_carlo, Mapping) else {}
+    if monte_carlo_workers:
+        monte_carlo["workers"] = monte_carlo_workers
+
     propagation_summary, artefacts = perturbation_analysis.propagate_constellation(
         scenario,
         output_directory=Path(output_directory) if output_directory else None,
+        monte_carlo=monte_carlo or None,
     )
 
     _update_centroid_alignment_metrics(
@@ -1210,7 +1350,7 @@ def _generate_state_history(
     scenario: Mapping[str, object],
     metadata: ScenarioMetadata,
     two_body: Mapping[str, float | Sequence[Mapping[str, float]]],
-) -> tuple[PropagatedStateHistory, GroundTrack]:
+) -> tuple[ColumnarStateHistory, ColumnarGroundTrack]:
     """Synthesise a representative propagation history for STK export."""
 
     classical = {}
@@ -1240,65 +1380,59 @@ def _generate_state_history(
     duration_seconds = max((stop_epoch - metadata.start_epoch).total_seconds(), step)
     sample_count = int(math.ceil(duration_seconds / step)) + 1
 
-    state_samples: list[StateSample] = []
-    ground_track_points: list[GroundTrackPoint] = []
-
     mean_motion = math.sqrt(MU_EARTH_KM3_S2 / (semi_major_axis**3))
     if not math.isfinite(mean_motion) or mean_motion <= 0.0:
         mean_motion = 0.0011635528346628863  # ~95-minute orbit fallback
 
-    for index in range(sample_count):
-        epoch = metadata.start_epoch + timedelta(seconds=index * step)
-        delta_t = (epoch - metadata.start_epoch).total_seconds()
-        mean_anomaly_current = mean_anomaly + mean_motion * delta_t
-        mean_anomaly_current = math.fmod(mean_anomaly_current, 2.0 * math.pi)
-        if mean_anomaly_current < 0.0:
-            mean_anomaly_current += 2.0 * math.pi
-
-        eccentric_anomaly = _solve_kepler(mean_anomaly_current, eccentricity)
-        true_anomaly = _eccentric_to_true_anomaly(eccentric_anomaly, eccentricity)
-
-        radius = semi_major_axis * (1.0 - eccentricity * math.cos(eccentric_anomaly))
-        semi_latus_rectum = semi_major_axis * (1.0 - eccentricity**2)
-        if semi_latus_rectum <= 0.0:
-            semi_latus_rectum = semi_major_axis
-        sqrt_mu_over_p = math.sqrt(MU_EARTH_KM3_S2 / semi_latus_rectum)
-
-        position_pqw = (
-            radius * math.cos(true_anomaly),
-            radius * math.sin(true_anomaly),
-            0.0,
-        )
-        velocity_pqw = (
-            -sqrt_mu_over_p * math.sin(true_anomaly),
-            sqrt_mu_over_p * (eccentricity + math.cos(true_anomaly)),
-            0.0,
-        )
-
-        position_eci = _pqw_to_eci(position_pqw, raan, argument_of_perigee, inclination)
-        velocity_eci = _pqw_to_eci(velocity_pqw, raan, argument_of_perigee, inclination)
-
-        state_samples.append(
-            StateSample(
-                epoch=epoch,
-                position_eci_km=position_eci,
-                velocity_eci_kms=velocity_eci,
-            )
-        )
+    # Offsets are rounded to whole microseconds, as the exported time stamps
+    # are, so states are evaluated at exactly the epochs written out.
+    step_us = step * 1_000_000.0
+    offsets_us = np.rint(np.arange(sample_count) * step_us).astype(np.int64)
+    epochs = epoch_array([metadata.start_epoch])[0] + offsets_us.astype("timedelta64[us]")
+    delta_t = offsets_us / 1_000_000.0
+    mean_anomaly_current = np.mod(mean_anomaly + mean_motion * delta_t, 2.0 * math.pi)
+
+    eccentric_anomaly = _solve_kepler_array(mean_anomaly_current, eccentricity)
+    true_anomaly = _eccentric_to_true_anomaly_array(eccentric_anomaly, eccentricity)
+
+    radius = semi_major_axis * (1.0 - eccentricity * np.cos(eccentric_anomaly))
+    semi_latus_rectum = semi_major_axis * (1.0 - eccentricity**2)
+    if semi_latus_rectum <= 0.0:
+        semi_latus_rectum = semi_major_axis
+    sqrt_mu_over_p = math.sqrt(MU_EARTH_KM3_S2 / semi_latus_rectum)
+
+    # The perifocal states lie in the P-Q plane, so only the first two columns
+    # of the rotation contribute.
+    rotation = _pqw_to_eci_matrix(raan, argument_of_perigee, inclination)
+    cos_true = np.cos(true_anomaly)
+    sin_true = np.sin(true_anomaly)
+    positions_eci = _rotate_in_plane(rotation, radius * cos_true, radius * sin_true)
+    velocities_eci = _rotate_in_plane(
+        rotation, -sqrt_mu_over_p * sin_true, sqrt_mu_over_p * (eccentricity + cos_true)
+    )
 
-        latitude, longitude, altitude = _eci_to_geodetic(position_eci, metadata.start_epoch, epoch)
-        ground_track_points.append(
-            GroundTrackPoint(
-                epoch=epoch,
-                latitude_deg=latitude,
-                longitude_deg=longitude,
-                altitude_km=altitude,
-            )
-        )
+    orientation = earth_orientation(epochs)
+    latitudes, longitudes, altitudes = _eci_to_geodetic_array(
+        positions_eci, orientation.cos_angles, orientation.sin_angles
+    )
 
+    epoch_tzinfo = timezone.utc if metadata.start_epoch.tzinfo is not None else None
     return (
-        PropagatedStateHistory(satellite_id=satellite_id, samples=state_samples),
-        GroundTrack(satellite_id=satellite_id, points=ground_track_points),
+        ColumnarStateHistory(
+            satellite_id=satellite_id,
+            epochs=epochs,
+            positions_eci_km=positions_eci,
+            velocities_eci_kms=velocities_eci,
+            epoch_tzinfo=epoch_tzinfo,
+        ),
+        ColumnarGroundTrack(
+            satellite_id=satellite_id,
+            epochs=epochs,
+            latitude_deg=latitudes,
+            longitude_deg=longitudes,
+            altitude_km=altitudes,
+            epoch_tzinfo=epoch_tzinfo,
+        ),
     )
 
 
@@ -1329,6 +1463,26 @@ def _solve_kepler(mean_anomaly: float, eccentricity: float) -> float:
     return eccentric_anomaly
 
 
+def _solve_kepler_array(mean_anomaly: np.ndarray, eccentricity: float) -> np.ndarray:
+    """Solve Kepler's equation element-wise with the iteration of :func:`_solve_kepler`."""
+
+    mean_anomaly = np.asarray(mean_anomaly, dtype=float)
+    if abs(eccentricity) < 1e-8:
+        return mean_anomaly.copy()
+
+    eccentric_anomaly = mean_anomaly.copy()
+    for _ in range(12):
+        delta = eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly) - mean_anomaly
+        derivative = 1.0 - eccentricity * np.cos(eccentric_anomaly)
+        correction = np.divide(
+            delta, derivative, out=np.zeros_like(delta), where=derivative != 0.0
+        )
+        eccentric_anomaly -= correction
+        if np.max(np.abs(correction), initial=0.0) < 1e-12:
+            break
+    return eccentric_anomaly
+
+
 def _eccentric_to_true_anomaly(eccentric_anomaly: float, eccentricity: float) -> float:
     """Convert eccentric anomaly to true anomaly."""
 
@@ -1341,13 +1495,27 @@ def _eccentric_to_true_anomaly(eccentric_anomaly: float, eccentricity: float) ->
     return true_anomaly
 
 
-def _pqw_to_eci(
-    vector: Sequence[float],
+def _eccentric_to_true_anomaly_array(
+    eccentric_anomaly: np.ndarray, eccentricity: float
+) -> np.ndarray:
+    """Convert an array of eccentric anomalies to true anomalies."""
+
+    if abs(eccentricity - 1.0) < 1e-8:
+        return np.asarray(eccentric_anomaly, dtype=float)
+
+    half_angle = 0.5 * np.asarray(eccentric_anomaly, dtype=float)
+    return 2.0 * np.arctan2(
+        math.sqrt(1.0 + eccentricity) * np.sin(half_angle),
+        math.sqrt(1.0 - eccentricity) * np.cos(half_angle),
+    )
+
+
+def _pqw_to_eci_matrix(
     raan: float,
     argument_of_perigee: float,
     inclination: float,
-) -> tuple[float, float, float]:
-    """Rotate a vector from the orbital plane into the inertial frame."""
+) -> np.ndarray:
+    """Return the ``3×3`` rotation from the perifocal frame into the inertial frame."""
 
     cos_omega = math.cos(raan)
     sin_omega = math.sin(raan)
@@ -1356,62 +1524,33 @@ def _pqw_to_eci(
     cos_inc = math.cos(inclination)
     sin_inc = math.sin(inclination)
 
-    x_p, y_p, z_p = vector
-
-    rotation_11 = cos_omega * cos_arg - sin_omega * sin_arg * cos_inc
-    rotation_12 = -cos_omega * sin_arg - sin_omega * cos_arg * cos_inc
-    rotation_21 = sin_omega * cos_arg + cos_omega * sin_arg * cos_inc
-    rotation_22 = -sin_omega * sin_arg + cos_omega * cos_arg * cos_inc
-    rotation_31 = sin_arg * sin_inc
-    rotation_32 = cos_arg * sin_inc
-
-    x = rotation_11 * x_p + rotation_12 * y_p
-    y = rotation_21 * x_p + rotation_22 * y_p
-    z = rotation_31 * x_p + rotation_32 * y_p
-
-    return (x, y, z)
-
-
-def _julian_date(epoch: datetime) -> float:
-    """Return the Julian date corresponding to *epoch* (UTC)."""
-
-    moment = epoch.astimezone(timezone.utc)
-    year = moment.year
-    month = moment.month
-    day = moment.day + (
-        moment.hour
-        + (moment.minute + (moment.second + moment.microsecond / 1_000_000.0) / 60.0) / 60.0
-    ) / 24.0
+    return np.array(
+        [
+            [
+                cos_omega * cos_arg - sin_omega * sin_arg * cos_inc,
+                -cos_omega * sin_arg - sin_omega * cos_arg * cos_inc,
+                sin_omega * sin_inc,
+            ],
+            [
+                sin_omega * cos_arg + cos_omega * sin_arg * cos_inc,
+                -sin_omega * sin_arg + cos_omega * cos_arg * cos_inc,
+                -cos_omega * sin_inc,
+            ],
+            [sin_arg * sin_inc, cos_arg * sin_inc, cos_inc],
+        ]
+    )
 
-    if month <= 2:
-        year -= 1
-        month += 12
 
-    a = math.floor(year / 100)
-    b = 2 - a + math.floor(a / 4)
+def _rotate_in_plane(rotation: np.ndarray, p_component: np.ndarray, q_component: np.ndarray) -> np.ndarray:
+    """Return ``(N, 3)`` inertial vectors for perifocal vectors with zero W component."""
 
-    jd = (
-        math.floor(365.25 * (year + 4716))
-        + math.floor(30.6001 * (month + 1))
-        + day
-        + b
-        - 1524.5
-    )
-    return jd
+    return p_component[:, np.newaxis] * rotation[:, 0] + q_component[:, np.newaxis] * rotation[:, 1]
 
 
 def _greenwich_sidereal_angle(epoch: datetime) -> float:
     """Compute the Greenwich mean sidereal angle for *epoch* in radians."""
 
-    jd = _julian_date(epoch)
-    t = (jd - 2_451_545.0) / 36_525.0
-    gmst_deg = (
-        280.46061837
-        + 360.98564736629 * (jd - 2_451_545.0)
-        + 0.000387933 * t**2
-        - (t**3) / 38_710_000.0
-    )
-    return math.radians(gmst_deg % 360.0)
+    return greenwich_sidereal_angle(epoch)
 
 
 def _eci_to_geodetic(
@@ -1422,43 +1561,63 @@ def _eci_to_geodetic(
     """Convert ECI coordinates to geodetic latitude, longitude, and altitude."""
 
     angle = _greenwich_sidereal_angle(epoch)
-    cos_angle = math.cos(angle)
-    sin_angle = math.sin(angle)
+    latitude, longitude, altitude = _eci_to_geodetic_array(
+        np.asarray(position_eci, dtype=float).reshape(1, 3),
+        np.array([math.cos(angle)]),
+        np.array([math.sin(angle)]),
+    )
+    return float(latitude[0]), float(longitude[0]), float(altitude[0])
+
+
+def _eci_to_geodetic_array(
+    positions_eci: np.ndarray,
+    cos_angle: np.ndarray,
+    sin_angle: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert ``(N, 3)`` ECI positions [km] to geodetic latitude, longitude [deg], and altitude [km].
+
+    *cos_angle* and *sin_angle* hold the cosine and sine of the Greenwich
+    sidereal angle of each row, as cached by
+    :class:`~src.constellation.earth_orientation.EarthOrientationGrid`.
+    Latitude follows Bowring's single-iteration formula.
+    """
 
-    x_eci, y_eci, z_eci = position_eci
+    positions = np.asarray(positions_eci, dtype=float)
+
+    x_eci, y_eci, z_ecef = positions[:, 0], positions[:, 1], positions[:, 2]
     x_ecef = cos_angle * x_eci + sin_angle * y_eci
     y_ecef = -sin_angle * x_eci + cos_angle * y_eci
-    z_ecef = z_eci
 
-    longitude = math.degrees(math.atan2(y_ecef, x_ecef))
+    longitude = np.degrees(np.arctan2(y_ecef, x_ecef))
     longitude = ((longitude + 180.0) % 360.0) - 180.0
 
-    p = math.hypot(x_ecef, y_ecef)
-    if p < 1.0e-9:
-        latitude = 90.0 if z_ecef >= 0.0 else -90.0
-        altitude = abs(z_ecef) - EARTH_RADIUS_KM * (1.0 - EARTH_FLATTENING)
-        return latitude, longitude, altitude
-
     a = EARTH_RADIUS_KM
     b = a * (1.0 - EARTH_FLATTENING)
-    theta = math.atan2(z_ecef * a, p * b)
-    sin_theta = math.sin(theta)
-    cos_theta = math.cos(theta)
+    p = np.hypot(x_ecef, y_ecef)
+    theta = np.arctan2(z_ecef * a, p * b)
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
 
-    latitude_rad = math.atan2(
+    latitude_rad = np.arctan2(
         z_ecef + EARTH_SECOND_ECCENTRICITY_SQUARED * b * sin_theta**3,
         p - EARTH_ECCENTRICITY_SQUARED * a * cos_theta**3,
     )
-    sin_lat = math.sin(latitude_rad)
-    cos_lat = math.cos(latitude_rad)
-    n = a / math.sqrt(1.0 - EARTH_ECCENTRICITY_SQUARED * sin_lat**2)
-
-    if abs(cos_lat) > 1.0e-12:
-        altitude = p / cos_lat - n
-    else:
-        altitude = z_ecef / sin_lat - n * (1.0 - EARTH_ECCENTRICITY_SQUARED)
+    sin_lat = np.sin(latitude_rad)
+    cos_lat = np.cos(latitude_rad)
+    n = a / np.sqrt(1.0 - EARTH_ECCENTRICITY_SQUARED * sin_lat**2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        altitude = np.where(
+            np.abs(cos_lat) > 1.0e-12,
+            p / cos_lat - n,
+            z_ecef / sin_lat - n * (1.0 - EARTH_ECCENTRICITY_SQUARED),
+        )
+    latitude = np.degrees(latitude_rad)
 
-    latitude = math.degrees(latitude_rad)
+    polar = p < 1.0e-9
+    if np.any(polar):
+        latitude = np.where(polar, np.where(z_ecef >= 0.0, 90.0, -90.0), latitude)
+        altitude = np.where(polar, np.abs(z_ecef) - b, altitude)
     return latitude, longitude, altitude
 
 
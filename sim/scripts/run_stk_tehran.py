@@ -37,21 +37,29 @@ try:  # pragma: no cover - pywin32 is optional for non-Windows environments
 except Exception:  # pragma: no cover - maintain portability on Linux/macOS
     win32com = None  # type: ignore
 
+from src.constellation.earth_orientation import EarthOrientationGrid
 from tools.stk_export import (
+    ColumnarGroundTrack,
+    ColumnarStateHistory,
+    ExportedFile,
     GroundTrack,
-    GroundTrackPoint,
     PropagatedStateHistory,
     ScenarioMetadata,
     SimulationResults,
-    StateSample,
     export_simulation_to_stk,
+    sanitize_stk_identifier,
 )
+from tools.oem_export import export_oem
 
 configuration = import_module("sim.scripts.configuration")
 run_scenario = import_module("sim.scripts.run_scenario")
 
 LOGGER = logging.getLogger(__name__)
 
+# Samples of different spacecraft closer in time than this are treated as
+# simultaneous when computing formation separations.
+EPOCH_MATCH_TOLERANCE = np.timedelta64(1, "ms")
+
 
 def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     """Return command-line arguments guiding the automation flow."""
@@ -99,6 +107,27 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
             "When omitted the configuration value is used."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to write the per-spacecraft ephemeris and ground-track files.",
+    )
+    parser.add_argument(
+        "--ephemeris-tolerance-m",
+        type=float,
+        default=None,
+        help=(
+            "Thin each ephemeris to the samples STK's order-7 Lagrange "
+            "interpolation needs to stay within this many metres."
+        ),
+    )
+    parser.add_argument(
+        "--oem",
+        choices=["kvn", "xml"],
+        default=None,
+        help="Also write the formation ephemerides as a CCSDS OEM in the given encoding.",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -124,6 +153,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     two_body = run_scenario._propagate_two_body(scenario_data, phases)
     metadata = run_scenario._build_scenario_metadata(scenario_data, two_body)
     metadata = _ensure_ephemeris_sampling(metadata)
+    if args.ephemeris_tolerance_m is not None:
+        metadata = replace(metadata, ephemeris_tolerance_km=args.ephemeris_tolerance_m / 1_000.0)
 
     LOGGER.debug("Scenario start: %s, stop: %s.", metadata.start_epoch, metadata.stop_epoch)
 
@@ -155,9 +186,29 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     export_dir.mkdir(parents=True, exist_ok=True)
 
     LOGGER.info("Exporting ephemerides to %s.", export_dir)
-    export_simulation_to_stk(sim_results, export_dir, metadata)
+    exported_files = export_simulation_to_stk(
+        sim_results, export_dir, metadata, workers=args.workers
+    )
+    LOGGER.info(
+        "Wrote %d ephemeris and ground-track files in %.2f s of file time.",
+        len(exported_files),
+        sum(exported.elapsed_s for exported in exported_files.values()),
+    )
+
+    if args.oem is not None:
+        suffix = ".xml" if args.oem == "xml" else ".oem"
+        oem_file = export_oem(
+            histories,
+            export_dir / f"{sanitize_stk_identifier(metadata.scenario_name, 'Scenario')}{suffix}",
+            xml=args.oem == "xml",
+        )
+        LOGGER.info("Wrote %d OEM state vectors to %s.", oem_file.point_count, oem_file.name)
 
     metrics = _summarise_formation_metrics(histories, metadata)
+    if metadata.ephemeris_tolerance_km is not None:
+        metrics["ephemeris_decimation"] = _summarise_ephemeris_decimation(
+            exported_files, metadata.ephemeris_tolerance_km
+        )
     _write_metrics(output_dir, metrics)
     _write_ground_tracks(output_dir, ground_tracks)
 
@@ -264,7 +315,7 @@ def _normalise_scenario(source: Mapping[str, object]) -> MutableMapping[str, obj
 
 
 def _ensure_ephemeris_sampling(metadata: ScenarioMetadata) -> ScenarioMetadata:
-    """Guarantee sufficient samples for cubic interpolation during STK export."""
+    """Guarantee sufficient samples for interpolation during STK export."""
 
     if metadata.stop_epoch is None:
         return metadata
@@ -356,73 +407,73 @@ def _derive_formation_specification(
 
 
 def _synthesise_formation_products(
-    base_history: PropagatedStateHistory,
-    base_ground_track: GroundTrack,
+    base_history: ColumnarStateHistory | PropagatedStateHistory,
+    base_ground_track: ColumnarGroundTrack | GroundTrack,
     metadata: ScenarioMetadata,
     formation_spec: FormationSpecification,
-) -> tuple[list[PropagatedStateHistory], list[GroundTrack]]:
-    """Apply RTN offsets to generate per-spacecraft histories and ground tracks."""
-
-    histories: list[PropagatedStateHistory] = []
-    ground_tracks: list[GroundTrack] = []
-
-    for satellite_id, offset in zip(formation_spec.satellite_ids, formation_spec.offsets_rtn_km):
-        samples: list[StateSample] = []
-        track_points: list[GroundTrackPoint] = []
-        for state_sample, track_point in zip(base_history.samples, base_ground_track.points):
-            new_position = _apply_rtn_offset(state_sample.position_eci_km, state_sample.velocity_eci_kms, offset)
-            samples.append(
-                StateSample(
-                    epoch=state_sample.epoch,
-                    position_eci_km=new_position,
-                    velocity_eci_kms=state_sample.velocity_eci_kms,
-                )
-            )
+) -> tuple[list[ColumnarStateHistory], list[ColumnarGroundTrack]]:
+    """Apply RTN offsets to generate per-spacecraft histories and ground tracks.
 
-            latitude, longitude, altitude = run_scenario._eci_to_geodetic(
-                new_position, metadata.start_epoch, state_sample.epoch
-            )
-            track_points.append(
-                GroundTrackPoint(
-                    epoch=track_point.epoch,
-                    latitude_deg=latitude,
-                    longitude_deg=longitude,
-                    altitude_km=altitude,
-                )
-            )
+    The RTN basis depends only on the base history, so it is built once for
+    every epoch and all spacecraft offsets are applied together; the ground
+    tracks then share one Earth-orientation grid.
+    """
 
-        histories.append(PropagatedStateHistory(satellite_id=satellite_id, samples=samples))
-        ground_tracks.append(GroundTrack(satellite_id=satellite_id, points=track_points))
+    base_history = ColumnarStateHistory.from_history(base_history)
+    base_ground_track = ColumnarGroundTrack.from_track(base_ground_track)
+
+    bases = _rtn_bases(base_history.positions_eci_km, base_history.velocities_eci_kms)
+    offsets = np.asarray(formation_spec.offsets_rtn_km, dtype=float).reshape(-1, 3)
+    positions = base_history.positions_eci_km + np.einsum("nij,sj->sni", bases, offsets)
+
+    orientation = EarthOrientationGrid(
+        metadata.start_epoch, base_history.offsets_seconds(metadata.start_epoch)
+    )
+
+    histories: list[ColumnarStateHistory] = []
+    ground_tracks: list[ColumnarGroundTrack] = []
+    for satellite_id, satellite_positions in zip(formation_spec.satellite_ids, positions):
+        latitudes, longitudes, altitudes = run_scenario._eci_to_geodetic_array(
+            satellite_positions, orientation.cos_angles, orientation.sin_angles
+        )
+        histories.append(
+            replace(base_history, satellite_id=satellite_id, positions_eci_km=satellite_positions)
+        )
+        ground_tracks.append(
+            replace(
+                base_ground_track,
+                satellite_id=satellite_id,
+                latitude_deg=latitudes,
+                longitude_deg=longitudes,
+                altitude_km=altitudes,
+            )
+        )
 
     return histories, ground_tracks
 
 
-def _apply_rtn_offset(
-    position_eci_km: Sequence[float],
-    velocity_eci_kms: Sequence[float],
-    offset_rtn_km: Sequence[float],
-) -> np.ndarray:
-    """Translate an inertial position vector by an RTN offset in kilometres."""
+def _rtn_bases(positions_eci_km: np.ndarray, velocities_eci_kms: np.ndarray) -> np.ndarray:
+    """Return ``(N, 3, 3)`` matrices whose columns are the radial, along-track and normal unit vectors.
 
-    r_vec = np.asarray(position_eci_km, dtype=float)
-    v_vec = np.asarray(velocity_eci_kms, dtype=float)
-    offset = np.asarray(offset_rtn_km, dtype=float)
+    The basis is zero where the position vanishes, leaving such samples
+    untranslated, and the normal falls back to the inertial Z axis where the
+    angular momentum vanishes.
+    """
 
-    r_norm = np.linalg.norm(r_vec)
-    if r_norm == 0.0:
-        return r_vec.copy()
+    positions = np.asarray(positions_eci_km, dtype=float).reshape(-1, 3)
+    velocities = np.asarray(velocities_eci_kms, dtype=float).reshape(-1, 3)
 
-    r_hat = r_vec / r_norm
-    h_vec = np.cross(r_vec, v_vec)
-    h_norm = np.linalg.norm(h_vec)
-    if h_norm == 0.0:
-        h_hat = np.array([0.0, 0.0, 1.0])
-    else:
-        h_hat = h_vec / h_norm
+    r_norm = np.linalg.norm(positions, axis=1, keepdims=True)
+    r_hat = np.divide(positions, r_norm, out=np.zeros_like(positions), where=r_norm > 0.0)
+    h_vec = np.cross(positions, velocities)
+    h_norm = np.linalg.norm(h_vec, axis=1, keepdims=True)
+    h_hat = np.divide(h_vec, h_norm, out=np.zeros_like(h_vec), where=h_norm > 0.0)
+    h_hat[h_norm[:, 0] == 0.0] = (0.0, 0.0, 1.0)
     t_hat = np.cross(h_hat, r_hat)
 
-    offset_vector = offset[0] * r_hat + offset[1] * t_hat + offset[2] * h_hat
-    return r_vec + offset_vector
+    bases = np.stack((r_hat, t_hat, h_hat), axis=2)
+    bases[r_norm[:, 0] == 0.0] = 0.0
+    return bases
 
 
 def _duplicate_contacts(nodes: Sequence[run_scenario.Node], satellite_ids: Sequence[str]):
@@ -435,35 +486,110 @@ def _duplicate_contacts(nodes: Sequence[run_scenario.Node], satellite_ids: Seque
 
 
 def _summarise_formation_metrics(
-    histories: Sequence[PropagatedStateHistory], metadata: ScenarioMetadata
+    histories: Sequence[ColumnarStateHistory | PropagatedStateHistory],
+    metadata: ScenarioMetadata,
 ) -> MutableMapping[str, object]:
-    """Report separation statistics across the formation."""
+    """Report separation statistics across the formation, overall and per spacecraft pair."""
 
     if not histories:
         return {"message": "No formation histories available."}
 
-    by_epoch: dict[datetime, list[np.ndarray]] = {}
-    for history in histories:
-        for sample in history.samples:
-            by_epoch.setdefault(sample.epoch, []).append(np.asarray(sample.position_eci_km, dtype=float))
-
-    separation_records: list[float] = []
-    for positions in by_epoch.values():
-        if len(positions) < 2:
-            continue
-        for idx, primary in enumerate(positions[:-1]):
-            for secondary in positions[idx + 1 :]:
-                separation_records.append(float(np.linalg.norm(primary - secondary)))
-
-    if not separation_records:
+    columns = [ColumnarStateHistory.from_history(history).ordered() for history in histories]
+    epochs, positions = _align_formation_positions(columns)
+    if len(columns) < 2 or not epochs.size:
         return {"message": "Insufficient separation samples to compute metrics."}
 
+    primary, secondary = np.triu_indices(len(columns), k=1)
+    separations = np.linalg.norm(positions[primary] - positions[secondary], axis=2)
+    minimum_indices = np.argmin(separations, axis=1)
+
+    pairs = [
+        {
+            "primary": columns[first].satellite_id,
+            "secondary": columns[second].satellite_id,
+            "mean_separation_km": float(np.mean(pair_separations)),
+            "min_separation_km": float(pair_separations[minimum_index]),
+            "max_separation_km": float(np.max(pair_separations)),
+            "time_of_min_separation_utc": _isoformat_epoch(epochs[minimum_index]),
+        }
+        for first, second, pair_separations, minimum_index in zip(
+            primary, secondary, separations, minimum_indices
+        )
+    ]
+
     return {
         "scenario_name": metadata.scenario_name,
-        "sample_count": len(separation_records),
-        "mean_separation_km": float(np.mean(separation_records)),
-        "min_separation_km": float(np.min(separation_records)),
-        "max_separation_km": float(np.max(separation_records)),
+        "sample_count": int(separations.size),
+        "epoch_count": int(epochs.size),
+        "mean_separation_km": float(np.mean(separations)),
+        "min_separation_km": float(np.min(separations)),
+        "max_separation_km": float(np.max(separations)),
+        "pairs": pairs,
+    }
+
+
+def _align_formation_positions(
+    histories: Sequence[ColumnarStateHistory],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stack the positions sampled simultaneously by every spacecraft.
+
+    Samples are matched to the epochs of the first history by nearest epoch
+    within :data:`EPOCH_MATCH_TOLERANCE`; epochs missing from any spacecraft
+    are dropped.  Returns the common epochs and an ``(n_sats, n_epochs, 3)``
+    position array.
+    """
+
+    reference = histories[0].epochs
+    if any(not history.epochs.size for history in histories):
+        return reference[:0], np.empty((len(histories), 0, 3))
+
+    matched = np.ones(reference.size, dtype=bool)
+    indices = []
+    for history in histories:
+        epochs = history.epochs
+        following = np.searchsorted(epochs, reference)
+        later = np.minimum(following, epochs.size - 1)
+        earlier = np.maximum(following - 1, 0)
+        nearest = np.where(
+            np.abs(epochs[earlier] - reference) <= np.abs(epochs[later] - reference),
+            earlier,
+            later,
+        )
+        matched &= np.abs(epochs[nearest] - reference) <= EPOCH_MATCH_TOLERANCE
+        indices.append(nearest)
+
+    positions = np.stack(
+        [history.positions_eci_km[index[matched]] for history, index in zip(histories, indices)]
+    )
+    return reference[matched], positions
+
+
+def _isoformat_epoch(epoch: np.datetime64) -> str:
+    """Format a UTC ``datetime64`` epoch as an ISO 8601 string with a ``Z`` suffix."""
+
+    value = epoch.astype("datetime64[us]").astype(datetime).replace(tzinfo=timezone.utc)
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _summarise_ephemeris_decimation(
+    exported_files: Mapping[str, ExportedFile], tolerance_km: float
+) -> MutableMapping[str, object]:
+    """Report the point count and reconstruction error of each decimated ephemeris."""
+
+    ephemerides = {
+        exported.name: {
+            "point_count": exported.point_count,
+            "max_error_m": exported.max_error_km * 1_000.0,
+        }
+        for exported in exported_files.values()
+        if exported.max_error_km is not None
+    }
+    return {
+        "tolerance_m": tolerance_km * 1_000.0,
+        "max_error_m": max(
+            (entry["max_error_m"] for entry in ephemerides.values()), default=0.0
+        ),
+        "ephemerides": ephemerides,
     }
 
 
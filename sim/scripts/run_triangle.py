@@ -30,6 +30,11 @@ def parse_args(args: Optional[Iterable[str]] = None) -> argparse.Namespace:
         type=Path,
         help="Directory in which to write simulation artefacts.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes sharing the dispersion Monte Carlo samples.",
+    )
     return parser.parse_args(args)
 
 
@@ -37,7 +42,11 @@ def main(args: Optional[Iterable[str]] = None) -> int:
     namespace = parse_args(args)
 
     output_dir = _resolve_output_directory(namespace.output_dir)
-    result = simulate_triangle_formation(namespace.config, output_directory=output_dir)
+    result = simulate_triangle_formation(
+        namespace.config,
+        output_directory=output_dir,
+        workers=namespace.workers,
+    )
 
     csv_bundle = export_triangle_time_series(result, output_dir)
     debug_outputs = _safe_generate_debug_plots(output_dir)
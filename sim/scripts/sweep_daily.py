@@ -4,15 +4,31 @@ from __future__ import annotations
 
 import argparse
 import csv
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, Mapping, MutableMapping, Optional
+from typing import Iterable, Iterator, Mapping, MutableMapping, Optional, Sequence
+
+from src.constellation.accumulators import StreamingAccumulator
 
 from . import configuration, perturbation_analysis
 
 
+RESULT_FIELDNAMES = (
+    "day_offset",
+    "date",
+    "window_start_utc",
+    "window_end_utc",
+    "window_duration_s",
+    "centroid_abs_cross_track_km",
+    "worst_vehicle_abs_cross_track_km",
+    "primary_compliant",
+    "waiver_compliant",
+)
+
+
 @dataclass
 class SweepResult:
     """Container summarising the compliance outcome for a single day."""
@@ -50,6 +66,28 @@ def parse_args(args: Optional[Iterable[str]] = None) -> argparse.Namespace:
         default=Path("artefacts/sweeps/tehran_30d.csv"),
         help="CSV file recording the sweep summary.",
     )
+    parser.add_argument(
+        "--continuous",
+        action="store_true",
+        help=(
+            "Propagate once across the whole sweep horizon and evaluate each day from"
+            " that single trajectory instead of re-initialising the orbit every day."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes evaluating independent days. Ignored with"
+            " --continuous, which integrates a single trajectory."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep the days already recorded in the output CSV and evaluate only the rest.",
+    )
     return parser.parse_args(args)
 
 
@@ -61,13 +99,27 @@ def main(args: Optional[Iterable[str]] = None) -> int:
     output_path = Path(namespace.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    results: list[SweepResult] = []
+    days = range(max(namespace.days, 0))
+    recorded = _read_results_csv(output_path) if namespace.resume else {}
+    completed = {day: recorded[day] for day in days if day in recorded}
+    pending = [day for day in days if day not in completed]
+    if completed:
+        print(f"Resuming with {len(completed)} of {len(days)} days already recorded in {output_path}.")
+
+    # Rewrite the journal with the retained days, then append each new day as
+    # soon as it completes so that an interrupted sweep can be resumed.
+    _write_results_csv(output_path, [completed[day] for day in sorted(completed)])
+    for sweep_result in _sweep_days(scenario, pending, namespace.workers, namespace.continuous):
+        completed[sweep_result.day_offset] = sweep_result
+        _append_result_csv(output_path, sweep_result)
+
+    results = [completed[day] for day in sorted(completed)]
     failures: list[SweepResult] = []
-
-    for day in range(max(namespace.days, 0)):
-        shifted = _shift_scenario(scenario, day)
-        sweep_result = _evaluate_day(shifted, day)
-        results.append(sweep_result)
+    centroid_statistics = StreamingAccumulator()
+    worst_statistics = StreamingAccumulator()
+    for sweep_result in results:
+        centroid_statistics.update([sweep_result.centroid_km])
+        worst_statistics.update([sweep_result.worst_km])
         if (
             not sweep_result.primary_compliant
             or sweep_result.centroid_km > 30.0
@@ -79,6 +131,13 @@ def main(args: Optional[Iterable[str]] = None) -> int:
     _write_results_csv(output_path, results)
 
     print(f"Recorded {len(results)} days to {output_path}.")
+    for label, statistics in (("Centroid", centroid_statistics), ("Worst vehicle", worst_statistics)):
+        if statistics.count:
+            summary = statistics.summary()
+            print(
+                f"  {label} |cross-track|: mean={summary['mean']:.3f} km,"
+                f" p95={summary['p95']:.3f} km, max={summary['max']:.3f} km"
+            )
     if failures:
         print("One or more days violated the 30/70 km limits. Suggested action:")
         print(
@@ -96,21 +155,46 @@ def main(args: Optional[Iterable[str]] = None) -> int:
     return 0
 
 
+def _sweep_days(
+    scenario: Mapping[str, object],
+    days: Sequence[int],
+    workers: int,
+    continuous: bool,
+) -> Iterator[SweepResult]:
+    """Yield the result of each day in *days* as it completes.
+
+    Independent days are evaluated in a process pool when *workers* > 1, in
+    which case results arrive in completion order.
+    """
+
+    if not days:
+        return
+    if continuous:
+        yield from _evaluate_days_continuous(scenario, days)
+        return
+    if workers <= 1 or len(days) == 1:
+        for day in days:
+            yield _evaluate_shifted_day(scenario, day)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(days))) as executor:
+        futures = [executor.submit(_evaluate_shifted_day, scenario, day) for day in days]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _evaluate_shifted_day(scenario: Mapping[str, object], day_offset: int) -> SweepResult:
+    """Shift *scenario* by *day_offset* days and evaluate it independently."""
+
+    return _evaluate_day(_shift_scenario(scenario, day_offset), day_offset)
+
+
 def _evaluate_day(
     scenario: MutableMapping[str, object],
     day_offset: int,
 ) -> SweepResult:
     """Propagate the scenario for a single day and extract compliance metrics."""
 
-    access_window = scenario.get("access_window")
-    midpoint = _parse_time(access_window.get("midpoint_utc")) if isinstance(access_window, Mapping) else None
-    start_time = _parse_time(access_window.get("start_utc")) if isinstance(access_window, Mapping) else None
-    end_time = _parse_time(access_window.get("end_utc")) if isinstance(access_window, Mapping) else None
-
-    midpoint_iso = _format_time(midpoint)
-    start_iso = _format_time(start_time)
-    end_iso = _format_time(end_time)
-
     propagation, _artefacts = perturbation_analysis.propagate_constellation(
         scenario,
         output_directory=None,
@@ -119,6 +203,39 @@ def _evaluate_day(
 
     cross_track = propagation.get("cross_track") if isinstance(propagation, Mapping) else {}
     evaluation = cross_track.get("evaluation") if isinstance(cross_track, Mapping) else {}
+    return _sweep_result(scenario, day_offset, evaluation)
+
+
+def _evaluate_days_continuous(
+    scenario: Mapping[str, object],
+    days: Sequence[int],
+) -> list[SweepResult]:
+    """Evaluate every day in *days* from a single continuous propagation."""
+
+    windows = perturbation_analysis.propagate_cross_track_windows(
+        scenario, [timedelta(days=day) for day in days]
+    )
+    return [
+        _sweep_result(_shift_scenario(scenario, day), day, evaluation)
+        for day, (_series, evaluation) in zip(days, windows)
+    ]
+
+
+def _sweep_result(
+    scenario: Mapping[str, object],
+    day_offset: int,
+    evaluation: Mapping[str, object],
+) -> SweepResult:
+    """Combine the day's access window with its cross-track *evaluation*."""
+
+    access_window = scenario.get("access_window")
+    midpoint = _parse_time(access_window.get("midpoint_utc")) if isinstance(access_window, Mapping) else None
+    start_time = _parse_time(access_window.get("start_utc")) if isinstance(access_window, Mapping) else None
+    end_time = _parse_time(access_window.get("end_utc")) if isinstance(access_window, Mapping) else None
+
+    midpoint_iso = _format_time(midpoint)
+    start_iso = _format_time(start_time)
+    end_iso = _format_time(end_time)
 
     centroid = float(evaluation.get("centroid_abs_cross_track_km", float("nan")))
     worst = float(evaluation.get("worst_vehicle_abs_cross_track_km", float("nan")))
@@ -147,34 +264,63 @@ def _evaluate_day(
 def _write_results_csv(path: Path, results: Iterable[SweepResult]) -> None:
     """Persist the sweep results to *path* using comma-separated values."""
 
-    fieldnames = [
-        "day_offset",
-        "date",
-        "window_start_utc",
-        "window_end_utc",
-        "window_duration_s",
-        "centroid_abs_cross_track_km",
-        "worst_vehicle_abs_cross_track_km",
-        "primary_compliant",
-        "waiver_compliant",
-    ]
     with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer = csv.DictWriter(handle, fieldnames=RESULT_FIELDNAMES)
         writer.writeheader()
         for result in results:
-            writer.writerow(
-                {
-                    "day_offset": result.day_offset,
-                    "date": result.date_iso,
-                    "window_start_utc": result.window_start,
-                    "window_end_utc": result.window_end,
-                    "window_duration_s": f"{result.window_duration_s:.1f}",
-                    "centroid_abs_cross_track_km": f"{result.centroid_km:.6f}",
-                    "worst_vehicle_abs_cross_track_km": f"{result.worst_km:.6f}",
-                    "primary_compliant": "true" if result.primary_compliant else "false",
-                    "waiver_compliant": "true" if result.waiver_compliant else "false",
-                }
-            )
+            writer.writerow(_result_row(result))
+
+
+def _append_result_csv(path: Path, result: SweepResult) -> None:
+    """Append a single day's *result* to the CSV written by :func:`_write_results_csv`."""
+
+    with path.open("a", encoding="utf-8", newline="") as handle:
+        csv.DictWriter(handle, fieldnames=RESULT_FIELDNAMES).writerow(_result_row(result))
+
+
+def _result_row(result: SweepResult) -> dict[str, object]:
+    """Return the CSV row representing *result*."""
+
+    return {
+        "day_offset": result.day_offset,
+        "date": result.date_iso,
+        "window_start_utc": result.window_start,
+        "window_end_utc": result.window_end,
+        "window_duration_s": f"{result.window_duration_s:.1f}",
+        "centroid_abs_cross_track_km": f"{result.centroid_km:.6f}",
+        "worst_vehicle_abs_cross_track_km": f"{result.worst_km:.6f}",
+        "primary_compliant": "true" if result.primary_compliant else "false",
+        "waiver_compliant": "true" if result.waiver_compliant else "false",
+    }
+
+
+def _read_results_csv(path: Path) -> dict[int, SweepResult]:
+    """Return the days recorded in a sweep CSV, skipping incomplete or malformed rows."""
+
+    if not path.exists():
+        return {}
+    results: dict[int, SweepResult] = {}
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            # A row cut short by an interruption lacks its trailing flags.
+            if {row.get("primary_compliant"), row.get("waiver_compliant")} - {"true", "false"}:
+                continue
+            try:
+                result = SweepResult(
+                    day_offset=int(row["day_offset"]),
+                    date_iso=row["date"],
+                    window_start=row["window_start_utc"],
+                    window_end=row["window_end_utc"],
+                    window_duration_s=float(row["window_duration_s"]),
+                    centroid_km=float(row["centroid_abs_cross_track_km"]),
+                    worst_km=float(row["worst_vehicle_abs_cross_track_km"]),
+                    primary_compliant=row["primary_compliant"] == "true",
+                    waiver_compliant=row["waiver_compliant"] == "true",
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            results[result.day_offset] = result
+    return results
 
 
 def _shift_scenario(
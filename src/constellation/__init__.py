@@ -6,10 +6,13 @@ when validating Systems Tool Kit (STK) data exchanges for the mission
 engineering studies documented in :mod:`docs`.
 """
 
-from . import frames, geometry, roe
+from . import accumulators, earth_orientation, frames, geometry, roe, sampling
 
 __all__ = [
+    "accumulators",
+    "earth_orientation",
     "frames",
     "geometry",
     "roe",
+    "sampling",
 ]
@@ -0,0 +1,198 @@
+r"""Mergeable streaming statistics for Monte Carlo and sweep aggregation.
+
+:class:`StreamingAccumulator` folds batches of samples into a bounded-memory
+summary that can be combined with summaries produced elsewhere, for example
+by parallel Monte Carlo workers.  It tracks
+
+* the count, mean, and second central moment :math:`M_2`, combined with the
+  pairwise update of Chan, Golub, and LeVeque so that
+
+  .. math::
+
+      \delta = \bar{x}_B - \bar{x}_A, \quad
+      \bar{x}_{AB} = \bar{x}_A + \delta \frac{n_B}{n_{AB}}, \quad
+      M_{2,AB} = M_{2,A} + M_{2,B} + \delta^2 \frac{n_A n_B}{n_{AB}};
+
+* the extrema; and
+* a deterministic compactor-stack quantile sketch in the manner of Munro and
+  Paterson.  Level :math:`h` holds items of weight :math:`2^h`; when a level
+  exceeds :math:`k` = ``sketch_size`` items it is sorted and every other
+  item is promoted to the next level, the starting offset alternating
+  between that level's compactions.  Unlike KLL, every level has the same
+  capacity and no offset is random.  Until the first compaction the sketch
+  holds every sample, so quantiles are exact and match
+  :func:`numpy.percentile` with linear interpolation.
+
+A compaction of level :math:`h` moves the rank of any value by at most
+:math:`2^h`, and at most :math:`n / (k\,2^h)` of them happen over :math:`n`
+samples, so with :math:`H` compacted levels the rank error of every quantile
+is bounded by :math:`H n / k`, a normalised error of at most
+:math:`H / k \le (\log_2(n / k) + 1) / k`, whatever the order of the input.
+The sketch keeps :math:`O(k \log_2(n / k))` items.  Compaction is
+deterministic, so merging the same summaries in the same order always
+reproduces the same statistics.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import MutableMapping
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+DEFAULT_SKETCH_SIZE = 2048
+
+
+@dataclass
+class StreamingAccumulator:
+    """Mergeable count, moments, extrema, and quantile sketch of a sample stream."""
+
+    sketch_size: int = DEFAULT_SKETCH_SIZE
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    levels: list[np.ndarray] = field(default_factory=list)
+    _compactions: list[int] = field(default_factory=list, init=False, repr=False)
+
+    def update(self, values: ArrayLike) -> None:
+        """Fold the finite entries of *values* into the summary."""
+
+        array = np.asarray(values, dtype=float).ravel()
+        array = array[np.isfinite(array)]
+        if not array.size:
+            return
+        mean = float(np.mean(array))
+        self._combine_moments(
+            int(array.size),
+            mean,
+            float(np.sum((array - mean) ** 2)),
+            float(np.min(array)),
+            float(np.max(array)),
+        )
+        self._add_to_level(0, array)
+
+    def merge(self, other: "StreamingAccumulator") -> None:
+        """Combine the samples summarised by *other* into this summary."""
+
+        if other.count == 0:
+            return
+        self._combine_moments(other.count, other.mean, other.m2, other.minimum, other.maximum)
+        for level, items in enumerate(other.levels):
+            if items.size:
+                self._add_to_level(level, items)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the samples (``nan`` when empty)."""
+
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the samples (``nan`` when empty)."""
+
+        return math.sqrt(self.variance) if self.count else math.nan
+
+    @property
+    def exact(self) -> bool:
+        """Whether the sketch still holds every sample."""
+
+        return len(self.levels) <= 1
+
+    def quantile(self, q: float) -> float:
+        """Return the linearly interpolated *q* quantile (``0 <= q <= 1``)."""
+
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must lie within [0, 1].")
+        if self.count == 0:
+            return math.nan
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(level.size, 2.0**height) for height, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        weights = weights[order]
+        # Each item stands for ``weight`` consecutive ranks; place it at the
+        # centre of that run so unit weights reproduce ranks 0..n-1 exactly.
+        ranks = np.cumsum(weights) - 0.5 * (weights + 1.0)
+        total = float(np.sum(weights))
+        position = q * (total - 1.0)
+
+        upper = int(np.searchsorted(ranks, position, side="left"))
+        if upper <= 0:
+            return float(items[0])
+        if upper >= items.size:
+            return float(items[-1])
+        lower = upper - 1
+        span = ranks[upper] - ranks[lower]
+        fraction = (position - ranks[lower]) / span if span > 0.0 else 0.0
+        below = float(items[lower])
+        above = float(items[upper])
+        difference = above - below
+        # Mirror numpy's interpolation so exact sketches agree bit-for-bit.
+        if fraction >= 0.5:
+            return above - difference * (1.0 - fraction)
+        return below + difference * fraction
+
+    def summary(self) -> MutableMapping[str, float]:
+        """Return the mean, standard deviation, 95th percentile, and extrema."""
+
+        return {
+            "mean": float(self.mean),
+            "std": float(self.std),
+            "p95": self.quantile(0.95),
+            "min": float(self.minimum),
+            "max": float(self.maximum),
+        }
+
+    def _combine_moments(
+        self, count: int, mean: float, m2: float, minimum: float, maximum: float
+    ) -> None:
+        """Fold a block summary into the running moments and extrema."""
+
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, mean, m2
+        else:
+            total = self.count + count
+            delta = mean - self.mean
+            self.mean += delta * count / total
+            self.m2 += m2 + delta * delta * self.count * count / total
+            self.count = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def _add_to_level(self, level: int, items: np.ndarray) -> None:
+        """Append *items* to sketch *level* and compact any overflowing levels."""
+
+        while len(self.levels) <= level:
+            self.levels.append(np.empty(0, dtype=float))
+            self._compactions.append(0)
+        self.levels[level] = np.concatenate((self.levels[level], items))
+        height = level
+        while self.levels[height].size > self.sketch_size:
+            ordered = np.sort(self.levels[height], kind="stable")
+            if ordered.size % 2:
+                # Keep the largest item back so promoted weight stays exact.
+                retained, ordered = ordered[-1:], ordered[:-1]
+            else:
+                retained = np.empty(0, dtype=float)
+            offset = self._compactions[height] % 2
+            self._compactions[height] += 1
+            self.levels[height] = retained
+            if len(self.levels) <= height + 1:
+                self.levels.append(np.empty(0, dtype=float))
+                self._compactions.append(0)
+            self.levels[height + 1] = np.concatenate(
+                (self.levels[height + 1], ordered[offset::2])
+            )
+            height += 1
+
+
+__all__ = ["DEFAULT_SKETCH_SIZE", "StreamingAccumulator"]
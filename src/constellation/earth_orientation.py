@@ -0,0 +1,271 @@
+r"""Earth-orientation service shared by the inertial/Earth-fixed conversions.
+
+The Greenwich mean sidereal angle follows the IAU 1982 expression
+
+.. math::
+
+    \theta_{\text{GMST}} = 280.46061837^\circ
+        + 360.98564736629^\circ\,d + 0.000387933^\circ\,T^2 - T^3 / 38\,710\,000^\circ,
+
+where :math:`d` counts days from J2000.0 and :math:`T = d / 36\,525`.  The day
+count is split into whole days and the fraction of a day taken from exact
+:class:`~datetime.timedelta` arithmetic, so the whole revolutions drop out
+before any rounding and the angle holds sub-nanoradian precision instead of
+inheriting the rounding of a floating-point Julian date.
+
+Over a run's time grid the angle is evaluated as a reference angle plus the
+instantaneous sidereal rate times the elapsed time,
+:math:`\theta(t) = \theta_k + \dot\theta_k (t - t_k)`, recalibrating the
+reference :math:`(t_k, \theta_k, \dot\theta_k)` at a fixed interval (one day by
+default).  The quadratic term changes the rate by about
+:math:`10^{-22}\,\text{rad s}^{-2}`, so the linearisation error is far below
+the precision of the expression itself.  :class:`EarthOrientationGrid` caches
+the angles, their cosines and sines, and the ECI-to-ECEF rotation matrices, and
+uniformly spaced grids are shared between callers through
+:func:`uniform_earth_orientation`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Sequence
+
+import numpy as np
+
+J2000_EPOCH = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+J2000_JULIAN_DATE = 2_451_545.0
+DAYS_PER_JULIAN_CENTURY = 36_525.0
+SECONDS_PER_DAY = 86_400.0
+DEFAULT_RECALIBRATION_INTERVAL_S = SECONDS_PER_DAY
+
+_GMST_OFFSET_DEG = 280.46061837
+_GMST_EXCESS_RATE_DEG_PER_DAY = 0.98564736629  # 360.98564736629 less one revolution
+_GMST_QUADRATIC_DEG = 0.000387933
+_GMST_CUBIC_DIVISOR_DEG = 38_710_000.0
+
+# A run shares one or two grids between its callers, while a long fine-step
+# grid holds its rotations and their sines and cosines (about 90 MB for 14
+# days at 1 s), so only a few are kept alive.
+_UNIFORM_GRID_CACHE_SIZE = 4
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _as_utc(epoch: datetime) -> datetime:
+    """Return *epoch* in UTC, treating naive datetimes as UTC."""
+
+    if epoch.tzinfo is None:
+        return epoch.replace(tzinfo=timezone.utc)
+    return epoch.astimezone(timezone.utc)
+
+
+def _days_since_j2000(epoch: datetime) -> tuple[int, float]:
+    """Return the whole days and the fraction of a day elapsed since J2000.0."""
+
+    delta = _as_utc(epoch) - J2000_EPOCH
+    return delta.days, (delta.seconds + delta.microseconds / 1_000_000.0) / SECONDS_PER_DAY
+
+
+def julian_date(epoch: datetime) -> float:
+    """Return the Julian date corresponding to *epoch* (UTC)."""
+
+    whole_days, fraction = _days_since_j2000(epoch)
+    return J2000_JULIAN_DATE + whole_days + fraction
+
+
+def greenwich_sidereal_angle(epoch: datetime) -> float:
+    """Return the Greenwich mean sidereal angle at *epoch* in radians, within ``[0, 2π)``."""
+
+    whole_days, fraction = _days_since_j2000(epoch)
+    days = whole_days + fraction
+    centuries = days / DAYS_PER_JULIAN_CENTURY
+    gmst_deg = (
+        _GMST_OFFSET_DEG
+        + 360.0 * fraction
+        + _GMST_EXCESS_RATE_DEG_PER_DAY * whole_days
+        + _GMST_EXCESS_RATE_DEG_PER_DAY * fraction
+        + _GMST_QUADRATIC_DEG * centuries**2
+        - centuries**3 / _GMST_CUBIC_DIVISOR_DEG
+    )
+    return math.radians(gmst_deg % 360.0)
+
+
+def greenwich_sidereal_rate(epoch: datetime) -> float:
+    """Return the rate of change of the Greenwich mean sidereal angle at *epoch* [rad s^-1]."""
+
+    whole_days, fraction = _days_since_j2000(epoch)
+    centuries = (whole_days + fraction) / DAYS_PER_JULIAN_CENTURY
+    rate_deg_per_day = (
+        360.0
+        + _GMST_EXCESS_RATE_DEG_PER_DAY
+        + 2.0 * _GMST_QUADRATIC_DEG * centuries / DAYS_PER_JULIAN_CENTURY
+        - 3.0 * centuries**2 / (_GMST_CUBIC_DIVISOR_DEG * DAYS_PER_JULIAN_CENTURY)
+    )
+    return math.radians(rate_deg_per_day) / SECONDS_PER_DAY
+
+
+@dataclass(frozen=True, eq=False)
+class EarthOrientationGrid:
+    """Cached Earth orientation at ``start + offsets_s`` seconds.
+
+    ``recalibration_interval_s`` sets how often the reference angle and rate
+    are re-evaluated; ``None`` keeps the reference at *start*.
+    """
+
+    start: datetime
+    offsets_s: np.ndarray
+    recalibration_interval_s: float | None = DEFAULT_RECALIBRATION_INTERVAL_S
+
+    @cached_property
+    def angles(self) -> np.ndarray:
+        """Greenwich mean sidereal angles [rad] within ``[0, 2π)``."""
+
+        offsets = np.asarray(self.offsets_s, dtype=float)
+        interval = self.recalibration_interval_s
+        if interval is None or interval <= 0.0 or not offsets.size:
+            knots = np.zeros(offsets.shape, dtype=np.int64)
+            interval = 0.0
+        else:
+            knots = np.floor(offsets / interval).astype(np.int64)
+
+        angles = np.empty(offsets.shape, dtype=float)
+        for knot in np.unique(knots):
+            selected = knots == knot
+            reference_s = float(knot) * interval
+            reference = self.start + timedelta(seconds=reference_s)
+            angles[selected] = greenwich_sidereal_angle(reference) + greenwich_sidereal_rate(
+                reference
+            ) * (offsets[selected] - reference_s)
+        angles = np.mod(angles, 2.0 * math.pi)
+        angles.setflags(write=False)
+        return angles
+
+    @cached_property
+    def cos_angles(self) -> np.ndarray:
+        """Cosines of :attr:`angles`."""
+
+        values = np.cos(self.angles)
+        values.setflags(write=False)
+        return values
+
+    @cached_property
+    def sin_angles(self) -> np.ndarray:
+        """Sines of :attr:`angles`."""
+
+        values = np.sin(self.angles)
+        values.setflags(write=False)
+        return values
+
+    @cached_property
+    def rotations(self) -> np.ndarray:
+        """``(T, 3, 3)`` rotation matrices taking inertial vectors into the Earth-fixed frame."""
+
+        rotations = np.zeros((self.angles.size, 3, 3), dtype=float)
+        rotations[:, 0, 0] = self.cos_angles
+        rotations[:, 0, 1] = self.sin_angles
+        rotations[:, 1, 0] = -self.sin_angles
+        rotations[:, 1, 1] = self.cos_angles
+        rotations[:, 2, 2] = 1.0
+        rotations.setflags(write=False)
+        return rotations
+
+    def inertial_to_ecef(self, positions: np.ndarray) -> np.ndarray:
+        """Rotate ``(T, ..., 3)`` inertial vectors sampled on the grid into ECEF."""
+
+        return self._rotate(positions, self.sin_angles)
+
+    def ecef_to_inertial(self, positions: np.ndarray) -> np.ndarray:
+        """Rotate ``(T, ..., 3)`` Earth-fixed vectors sampled on the grid into the inertial frame."""
+
+        return self._rotate(positions, -self.sin_angles)
+
+    def _rotate(self, positions: np.ndarray, sin_angles: np.ndarray) -> np.ndarray:
+        """Rotate vectors about :math:`z` by the grid angles with the given sine sign."""
+
+        array = np.asarray(positions, dtype=float)
+        flat = array.reshape(self.angles.size, -1, 3)
+        cos_angles = self.cos_angles[:, np.newaxis]
+        sin_angles = sin_angles[:, np.newaxis]
+        rotated = np.empty_like(flat)
+        rotated[..., 0] = cos_angles * flat[..., 0] + sin_angles * flat[..., 1]
+        rotated[..., 1] = cos_angles * flat[..., 1] - sin_angles * flat[..., 0]
+        rotated[..., 2] = flat[..., 2]
+        return rotated.reshape(array.shape)
+
+
+@lru_cache(maxsize=_UNIFORM_GRID_CACHE_SIZE)
+def uniform_earth_orientation(
+    start: datetime,
+    step_s: float,
+    count: int,
+    recalibration_interval_s: float | None = DEFAULT_RECALIBRATION_INTERVAL_S,
+) -> EarthOrientationGrid:
+    """Return the shared orientation grid of *count* epochs spaced *step_s* seconds from *start*."""
+
+    offsets = float(step_s) * np.arange(int(count), dtype=float)
+    offsets.setflags(write=False)
+    return EarthOrientationGrid(_as_utc(start), offsets, recalibration_interval_s)
+
+
+def _offsets_us(epochs: Sequence[datetime] | np.ndarray) -> tuple[datetime, np.ndarray]:
+    """Return the first of *epochs* in UTC and every epoch's whole-microsecond offset from it."""
+
+    if isinstance(epochs, np.ndarray) and np.issubdtype(epochs.dtype, np.datetime64):
+        times = epochs.astype("datetime64[us]", copy=False).reshape(-1)
+        start = times[0].astype(datetime).replace(tzinfo=timezone.utc)
+        return start, (times - times[0]).astype(np.int64)
+    # Subtracting datetimes is far cheaper than converting each to datetime64.
+    start = epochs[0]
+    offsets = np.fromiter(
+        ((epoch - start) // _MICROSECOND for epoch in epochs), dtype=np.int64, count=len(epochs)
+    )
+    return _as_utc(start), offsets
+
+
+def earth_orientation(
+    epochs: Sequence[datetime] | np.ndarray,
+    recalibration_interval_s: float | None = DEFAULT_RECALIBRATION_INTERVAL_S,
+) -> EarthOrientationGrid:
+    """Return the orientation grid for *epochs*, shared between callers when uniformly spaced.
+
+    *epochs* may be datetimes or a ``datetime64`` array of UTC instants.
+    """
+
+    if not len(epochs):
+        return EarthOrientationGrid(J2000_EPOCH, np.empty(0), recalibration_interval_s)
+    start, offsets_us = _offsets_us(epochs)
+    offsets = offsets_us / 1_000_000.0
+    steps = np.diff(offsets_us)
+    if steps.size and steps[0] > 0 and np.all(steps == steps[0]):
+        grid = uniform_earth_orientation(
+            start, float(steps[0]) / 1_000_000.0, offsets.size, recalibration_interval_s
+        )
+        # Multiples of a microsecond-rounded step are exact, but guard the
+        # cache against any drift from the epochs' own offsets.
+        if np.array_equal(grid.offsets_s, offsets):
+            return grid
+    return EarthOrientationGrid(start, offsets, recalibration_interval_s)
+
+
+def sidereal_angles(
+    epochs: Sequence[datetime] | np.ndarray,
+    recalibration_interval_s: float | None = DEFAULT_RECALIBRATION_INTERVAL_S,
+) -> np.ndarray:
+    """Return Greenwich mean sidereal angles [rad] for *epochs*."""
+
+    return earth_orientation(epochs, recalibration_interval_s).angles
+
+
+__all__ = [
+    "DEFAULT_RECALIBRATION_INTERVAL_S",
+    "EarthOrientationGrid",
+    "J2000_EPOCH",
+    "earth_orientation",
+    "greenwich_sidereal_angle",
+    "greenwich_sidereal_rate",
+    "julian_date",
+    "sidereal_angles",
+    "uniform_earth_orientation",
+]
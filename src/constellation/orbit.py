@@ -16,6 +16,7 @@ from typing import Sequence, Tuple
 
 import numpy as np
 
+from .earth_orientation import earth_orientation, greenwich_sidereal_angle, julian_date
 from .roe import MU_EARTH, OrbitalElements
 
 EARTH_ROTATION_RATE = 7.2921150e-5  # [rad s^-1]
@@ -285,8 +286,12 @@ def cartesian_to_classical(
     )
 
 
-def inertial_to_ecef(position: Sequence[float], epoch: datetime) -> np.ndarray:
-    """Rotate an inertial *position* vector into the Earth-fixed frame."""
+def inertial_to_ecef(position: Sequence[float] | np.ndarray, epoch: datetime) -> np.ndarray:
+    """Rotate inertial *position* vectors into the Earth-fixed frame.
+
+    *position* may be a single vector or any ``(..., 3)`` array of vectors that
+    share the same *epoch*.
+    """
 
     theta = greenwich_sidereal_angle(epoch)
     cos_theta = math.cos(theta)
@@ -295,40 +300,20 @@ def inertial_to_ecef(position: Sequence[float], epoch: datetime) -> np.ndarray:
         [[cos_theta, sin_theta, 0.0], [-sin_theta, cos_theta, 0.0], [0.0, 0.0, 1.0]],
         dtype=float,
     )
-    return rotation @ np.asarray(position, dtype=float)
-
+    return np.asarray(position, dtype=float) @ rotation.T
 
-def greenwich_sidereal_angle(epoch: datetime) -> float:
-    """Return the Greenwich sidereal angle at *epoch* in radians."""
-
-    jd = julian_date(epoch)
-    t_centuries = (jd - 2451545.0) / 36_525.0
-    gmst_seconds = (
-        67_310.54841
-        + (876_600.0 * 3_600.0 + 8_640_184.812866) * t_centuries
-        + 0.093104 * t_centuries**2
-        - 6.2e-6 * t_centuries**3
-    )
-    gmst_seconds = math.fmod(gmst_seconds, 86_400.0)
-    if gmst_seconds < 0.0:
-        gmst_seconds += 86_400.0
-    return gmst_seconds * (math.pi / 43_200.0)
 
+def inertial_to_ecef_series(
+    positions: Sequence[Sequence[float]] | np.ndarray, epochs: Sequence[datetime]
+) -> np.ndarray:
+    """Rotate ``(T, ..., 3)`` inertial *positions* sampled at the ``T`` *epochs* into ECEF.
 
-def julian_date(epoch: datetime) -> float:
-    """Return the Julian date corresponding to *epoch*."""
+    The sidereal angles come from the shared
+    :func:`~constellation.earth_orientation.earth_orientation` grid, so
+    repeated conversions over the same uniform epochs reuse cached rotations.
+    """
 
-    year = epoch.year
-    month = epoch.month
-    day = epoch.day + (epoch.hour + (epoch.minute + (epoch.second + epoch.microsecond / 1_000_000.0) / 60.0) / 60.0) / 24.0
-    if month <= 2:
-        year -= 1
-        month += 12
-
-    a = year // 100
-    b = 2 - a + a // 4
-    jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
-    return float(jd)
+    return earth_orientation(epochs).inertial_to_ecef(positions)
 
 
 def geodetic_coordinates(position_ecef: Sequence[float]) -> Tuple[float, float, float]:
@@ -368,6 +353,49 @@ def geodetic_coordinates(position_ecef: Sequence[float]) -> Tuple[float, float,
     return latitude, longitude, altitude
 
 
+def geodetic_coordinates_array(
+    positions_ecef: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised :func:`geodetic_coordinates` for a ``(..., 3)`` array of positions."""
+
+    positions = np.asarray(positions_ecef, dtype=float)
+    x = positions[..., 0]
+    y = positions[..., 1]
+    z = positions[..., 2]
+    longitude = np.arctan2(y, x)
+    p = np.hypot(x, y)
+
+    a = EARTH_EQUATORIAL_RADIUS_M
+    b = a * (1.0 - WGS84_FLATTENING)
+
+    theta = np.arctan2(z * a, p * b)
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
+
+    latitude = np.arctan2(
+        z + WGS84_SECOND_ECCENTRICITY_SQUARED * b * sin_theta**3,
+        p - WGS84_ECCENTRICITY_SQUARED * a * cos_theta**3,
+    )
+
+    sin_lat = np.sin(latitude)
+    cos_lat = np.cos(latitude)
+    normal = a / np.sqrt(1.0 - WGS84_ECCENTRICITY_SQUARED * sin_lat**2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        altitude = np.where(
+            np.abs(cos_lat) > 1.0e-12,
+            p / cos_lat - normal,
+            z / sin_lat - normal * (1.0 - WGS84_ECCENTRICITY_SQUARED),
+        )
+
+    polar = p < 1.0e-12
+    if np.any(polar):
+        latitude = np.where(polar, np.copysign(math.pi / 2.0, z), latitude)
+        altitude = np.where(polar, np.abs(z) - b, altitude)
+
+    return latitude, longitude, altitude
+
+
 def haversine_distance(latitude_1: float, longitude_1: float, latitude_2: float, longitude_2: float) -> float:
     """Return the great-circle distance between two geodetic coordinates."""
 
@@ -380,6 +408,23 @@ def haversine_distance(latitude_1: float, longitude_1: float, latitude_2: float,
     return 2.0 * EARTH_EQUATORIAL_RADIUS_M * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
 
 
+def haversine_distance_array(
+    latitude_1: np.ndarray,
+    longitude_1: np.ndarray,
+    latitude_2: float | np.ndarray,
+    longitude_2: float | np.ndarray,
+) -> np.ndarray:
+    """Vectorised :func:`haversine_distance` broadcasting over its arguments."""
+
+    delta_lat = np.subtract(latitude_2, latitude_1)
+    delta_lon = np.subtract(longitude_2, longitude_1)
+    a = (
+        np.sin(0.5 * delta_lat) ** 2
+        + np.cos(latitude_1) * np.cos(latitude_2) * np.sin(0.5 * delta_lon) ** 2
+    )
+    return 2.0 * EARTH_EQUATORIAL_RADIUS_M * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+
 __all__ = [
     "EARTH_EQUATORIAL_RADIUS_M",
     "EARTH_ROTATION_RATE",
@@ -388,10 +433,13 @@ __all__ = [
     "WGS84_SECOND_ECCENTRICITY_SQUARED",
     "classical_to_cartesian",
     "geodetic_coordinates",
+    "geodetic_coordinates_array",
     "greenwich_sidereal_angle",
     "cartesian_to_classical",
     "haversine_distance",
+    "haversine_distance_array",
     "inertial_to_ecef",
+    "inertial_to_ecef_series",
     "julian_date",
     "mean_to_true_anomaly",
     "propagate_kepler",
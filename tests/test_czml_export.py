@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.constellation.earth_orientation import EarthOrientationGrid
+from tools import ColumnarStateHistory, export_czml
+from tools._ephemeris_io import lagrange_interpolate
+
+START = datetime(2026, 3, 21, 6, 0, tzinfo=timezone.utc)
+
+
+def _circular_history(satellite_id: str, duration_s: float, step_s: float) -> ColumnarStateHistory:
+    offsets = np.arange(0.0, duration_s + step_s, step_s)
+    rate = 2.0 * np.pi / 5_700.0
+    phase = rate * offsets
+    radius = 6_878.0
+    positions = radius * np.column_stack((np.cos(phase), 0.6 * np.sin(phase), 0.8 * np.sin(phase)))
+    velocities = radius * rate * np.column_stack(
+        (-np.sin(phase), 0.6 * np.cos(phase), 0.8 * np.cos(phase))
+    )
+    return ColumnarStateHistory.from_offsets(satellite_id, START, offsets, positions, velocities)
+
+
+def test_czml_decimates_within_tolerance_inside_formation_windows(tmp_path: Path) -> None:
+    history = _circular_history("SAT-1", 7_200.0, 10.0)
+    windows = [
+        {"start": "2026-03-21T06:10:05Z", "end": "2026-03-21T06:40:00Z"},
+        {"start": "2026-03-21T07:20:00Z", "end": "2026-03-21T07:50:00Z"},
+        {"start": None, "end": None, "duration_s": 0.0},
+    ]
+
+    exported = export_czml(
+        [history],
+        tmp_path / "formation.czml",
+        document_name="Tehran",
+        formation_windows=windows,
+        tolerance_km=0.001,
+    )
+
+    document, packet = json.loads((tmp_path / "formation.czml").read_text(encoding="utf-8"))
+    assert document["clock"]["interval"] == (
+        "2026-03-21T06:10:05.000000Z/2026-03-21T07:50:00.000000Z"
+    )
+    assert (packet["id"], packet["name"]) == ("SAT_1", "SAT-1")
+    assert packet["availability"] == [
+        "2026-03-21T06:10:05.000000Z/2026-03-21T06:40:00.000000Z",
+        "2026-03-21T07:20:00.000000Z/2026-03-21T07:50:00.000000Z",
+    ]
+    assert exported.point_count < 0.1 * 2 * 181
+    assert exported.max_error_km <= 0.001
+
+    for interval in packet["position"]:
+        assert interval["referenceFrame"] == "FIXED"
+        assert (interval["interpolationAlgorithm"], interval["interpolationDegree"]) == ("LAGRANGE", 7)
+        samples = np.asarray(interval["cartesian"]).reshape(-1, 4)
+        epoch = np.datetime64(interval["epoch"].rstrip("Z"), "us")
+        start, end = (np.datetime64(value.rstrip("Z"), "us") for value in interval["interval"].split("/"))
+
+        # The samples bracket the window so the client can interpolate up to its bounds.
+        times = (history.epochs - epoch) / np.timedelta64(1, "s")
+        dense = (times >= 0.0) & (times <= samples[-1, 0])
+        assert epoch <= start and history.epochs[dense][-1] >= end
+
+        reference = epoch.astype(datetime).replace(tzinfo=timezone.utc)
+        expected = EarthOrientationGrid(reference, times[dense]).inertial_to_ecef(
+            history.positions_eci_km[dense]
+        )
+        reconstructed = lagrange_interpolate(samples[:, 0], samples[:, 1:], times[dense], 7)
+        assert np.max(np.linalg.norm(reconstructed / 1_000.0 - expected, axis=1)) <= 0.001
+
+
+def test_czml_without_windows_covers_the_whole_history(tmp_path: Path) -> None:
+    history = _circular_history("SAT 2", 600.0, 60.0)
+
+    exported = export_czml([history], tmp_path / "formation.czml")
+
+    document, packet = json.loads((tmp_path / "formation.czml").read_text(encoding="utf-8"))
+    assert exported.point_count == 11
+    assert exported.max_error_km is None
+    assert packet["availability"] == [
+        "2026-03-21T06:00:00.000000Z/2026-03-21T06:10:00.000000Z"
+    ]
+    (interval,) = packet["position"]
+    samples = np.asarray(interval["cartesian"]).reshape(-1, 4)
+    np.testing.assert_allclose(samples[:, 0], 60.0 * np.arange(11))
+    np.testing.assert_allclose(
+        np.linalg.norm(samples[:, 1:], axis=1),
+        1_000.0 * np.linalg.norm(history.positions_eci_km, axis=1),
+    )
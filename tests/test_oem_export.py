@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools import (
+    ColumnarStateHistory,
+    PropagatedStateHistory,
+    StateSample,
+    export_oem,
+)
+
+START = datetime(2026, 3, 21, 6, 0, tzinfo=timezone.utc)
+
+
+def _chunk(satellite_id: str, first: int, count: int) -> ColumnarStateHistory:
+    offsets = 60.0 * np.arange(first, first + count)
+    positions = np.column_stack((7_000.0 + offsets, 0.5 * offsets, -0.25 * offsets))
+    velocities = np.column_stack((np.zeros(count), 7.5 + 1e-3 * offsets, np.zeros(count)))
+    return ColumnarStateHistory.from_offsets(satellite_id, START, offsets, positions, velocities)
+
+
+def _kvn_segments(text: str) -> list[tuple[dict[str, str], np.ndarray, list[str]]]:
+    segments = []
+    for block in text.split("META_START\n")[1:]:
+        header, data = block.split("META_STOP\n")
+        metadata = dict(line.split(" = ") for line in header.splitlines())
+        rows = [line.split() for line in data.splitlines() if line]
+        segments.append(
+            (metadata, np.array([row[1:] for row in rows], dtype=float), [row[0] for row in rows])
+        )
+    return segments
+
+
+def test_oem_writes_one_segment_per_streamed_chunk(tmp_path: Path) -> None:
+    requested = []
+
+    def chunks():
+        for first in (0, 4):
+            requested.append(first)
+            yield _chunk("SAT-1", first, 5)
+        yield PropagatedStateHistory(
+            satellite_id="SAT 1",
+            samples=[
+                StateSample(
+                    epoch=START + timedelta(seconds=30),
+                    position_eci_km=[1.0, 2.0, 3.0],
+                    velocity_eci_kms=[4.0, 5.0, 6.0],
+                )
+            ],
+        )
+
+    exported = export_oem(chunks(), tmp_path / "formation.oem", creation_date=START)
+
+    assert requested == [0, 4]
+    assert (exported.name, exported.point_count) == ("formation.oem", 11)
+    text = (tmp_path / "formation.oem").read_text(encoding="utf-8")
+    assert text.startswith(
+        "CCSDS_OEM_VERS = 2.0\nCREATION_DATE = 2026-03-21T06:00:00.000000\n"
+    )
+
+    first, second, third = _kvn_segments(text)
+    assert first[0]["OBJECT_NAME"] == second[0]["OBJECT_NAME"] == "SAT_1"
+    assert third[0]["OBJECT_NAME"] == "SAT_1_2"
+    assert "INTERPOLATION" not in third[0]
+    assert first[0]["REF_FRAME"] == "TEME"
+    assert first[0]["INTERPOLATION_DEGREE"] == "4"
+    assert (second[0]["START_TIME"], second[0]["STOP_TIME"]) == (
+        "2026-03-21T06:04:00.000000",
+        "2026-03-21T06:08:00.000000",
+    )
+    assert second[2][0] == second[0]["START_TIME"]
+
+    expected = _chunk("SAT-1", 4, 5)
+    np.testing.assert_array_equal(
+        second[1], np.hstack((expected.positions_eci_km, expected.velocities_eci_kms))
+    )
+
+
+def test_oem_xml_encoding_parses(tmp_path: Path) -> None:
+    export_oem([_chunk("SAT-2", 0, 3)], tmp_path / "formation.xml", xml=True, originator="A&B")
+
+    root = ET.parse(tmp_path / "formation.xml").getroot()
+    assert (root.tag, root.get("version")) == ("oem", "2.0")
+    assert root.findtext("header/ORIGINATOR") == "A&B"
+    segment = root.find("body/segment")
+    assert segment.findtext("metadata/OBJECT_NAME") == "SAT_2"
+    vectors = segment.findall("data/stateVector")
+    assert [vector.findtext("EPOCH") for vector in vectors][-1] == "2026-03-21T06:02:00.000000"
+    assert float(vectors[1].findtext("X")) == 7_060.0
+
+
+def test_oem_rejects_repeated_epochs(tmp_path: Path) -> None:
+    history = _chunk("SAT-1", 0, 3)
+    repeated = ColumnarStateHistory(
+        "SAT-1",
+        history.epochs[[0, 1, 1]],
+        history.positions_eci_km,
+        history.velocities_eci_kms,
+    )
+    with pytest.raises(ValueError, match="strictly increasing"):
+        export_oem([repeated], tmp_path / "bad.oem")
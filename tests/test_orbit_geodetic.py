@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
 from src.constellation import orbit
@@ -65,3 +66,22 @@ def test_geodetic_coordinates_polar_limit() -> None:
     assert math.degrees(latitude_rad) == pytest.approx(90.0, abs=1e-9)
     assert math.degrees(longitude_rad) == pytest.approx(0.0, abs=1e-9)
     assert altitude == pytest.approx(2_000.0, abs=1e-6)
+
+
+def test_geodetic_coordinates_array_matches_scalar_conversion() -> None:
+    """The vectorised conversion should agree with the scalar reference, including the poles."""
+
+    polar_radius = orbit.EARTH_EQUATORIAL_RADIUS_M * (1.0 - WGS84_FLATTENING)
+    positions = [
+        geodetic_to_ecef(35.6892, 51.3890, 1_200.0),
+        geodetic_to_ecef(-12.0, 170.0, 550_000.0),
+        (0.0, 0.0, -(polar_radius + 2_000.0)),
+    ]
+
+    latitudes, longitudes, altitudes = orbit.geodetic_coordinates_array(np.array(positions))
+
+    for index, position in enumerate(positions):
+        latitude, longitude, altitude = orbit.geodetic_coordinates(position)
+        assert latitudes[index] == pytest.approx(latitude, abs=1e-12)
+        assert longitudes[index] == pytest.approx(longitude, abs=1e-12)
+        assert altitudes[index] == pytest.approx(altitude, abs=1e-6)
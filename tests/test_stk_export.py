@@ -8,6 +8,8 @@ import pytest
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from tools import (
+    ColumnarGroundTrack,
+    ColumnarStateHistory,
     FacilityDefinition,
     FormationMaintenanceEvent,
     GroundContactInterval,
@@ -216,3 +218,201 @@ def test_exporter_sanitises_object_names(tmp_path: Path) -> None:
 
     facility_path = tmp_path / "Facility_Test_Facility.fac"
     assert facility_path.exists()
+
+
+def test_columnar_products_export_identically_to_dataclasses(tmp_path: Path) -> None:
+    start_epoch = datetime(2024, 3, 2, 6, 0, 0)
+    offsets = np.array([0.0, 60.0, 30.0, 90.000001])
+    rng = np.random.default_rng(4)
+    positions = 7000.0 + rng.normal(size=(4, 3))
+    velocities = rng.normal(size=(4, 3))
+    latitudes, longitudes = rng.uniform(-60.0, 60.0, size=(2, 4))
+
+    columnar_history = ColumnarStateHistory.from_offsets(
+        "SAT-1", start_epoch, offsets, positions, velocities
+    )
+    columnar_track = ColumnarGroundTrack.from_offsets(
+        "SAT-1", start_epoch, offsets, latitudes, longitudes, 410.0
+    )
+    history = PropagatedStateHistory(satellite_id="SAT-1", samples=columnar_history.samples)
+    track = GroundTrack(satellite_id="SAT-1", points=columnar_track.points)
+    assert history.samples[3].epoch == start_epoch + timedelta(seconds=90.000001)
+    assert [sample.epoch for sample in columnar_history.ordered_samples()] == [
+        sample.epoch for sample in history.ordered_samples()
+    ]
+
+    metadata = ScenarioMetadata(scenario_name="Columnar", start_epoch=start_epoch)
+    for name, histories, tracks in (
+        ("columnar", [columnar_history], [columnar_track]),
+        ("dataclass", [history], [track]),
+    ):
+        export_simulation_to_stk(
+            SimulationResults(state_histories=histories, ground_tracks=tracks),
+            tmp_path / name,
+            metadata,
+        )
+
+    for filename in ("SAT_1.e", "SAT_1_groundtrack.gt", "SAT_1.sat", "Columnar.sc"):
+        assert (tmp_path / "columnar" / filename).read_bytes() == (
+            tmp_path / "dataclass" / filename
+        ).read_bytes()
+
+
+def test_block_writer_matches_per_row_formatting(tmp_path: Path) -> None:
+    start_epoch = datetime(2024, 3, 2, 6, 0, 0)
+    count = 10_000
+    offsets = 0.5 * np.arange(count)
+    rng = np.random.default_rng(9)
+    positions = rng.normal(scale=7000.0, size=(count, 3))
+    velocities = rng.normal(scale=7.5, size=(count, 3))
+    positions[0] = (-0.0, 1e-300, np.inf)
+    velocities[0] = (np.nan, -1e300, 5e-324)
+    latitudes = rng.uniform(-90.0, 90.0, size=count)
+    longitudes = rng.uniform(-180.0, 180.0, size=count)
+    altitudes = rng.uniform(300.0, 600.0, size=count)
+
+    export_simulation_to_stk(
+        SimulationResults(
+            state_histories=[
+                ColumnarStateHistory.from_offsets(
+                    "SAT-1", start_epoch, offsets, positions, velocities
+                )
+            ],
+            ground_tracks=[
+                ColumnarGroundTrack.from_offsets(
+                    "SAT-1", start_epoch, offsets, latitudes, longitudes, altitudes
+                )
+            ],
+        ),
+        tmp_path,
+        ScenarioMetadata(scenario_name="Blocks", start_epoch=start_epoch),
+    )
+
+    ephemeris = (tmp_path / "SAT_1.e").read_text(encoding="utf-8")
+    expected_rows = "".join(
+        f"        {t:.9f} {pos[0]: .14e} {pos[1]: .14e} {pos[2]: .14e} "
+        f"{vel[0]: .14e} {vel[1]: .14e} {vel[2]: .14e}\n"
+        for t, pos, vel in zip(offsets, positions, velocities)
+    )
+    assert "    BEGIN EphemerisTimePosVel\n" + expected_rows + "    END EphemerisTimePosVel\n" in ephemeris
+
+    track = (tmp_path / "SAT_1_groundtrack.gt").read_text(encoding="utf-8")
+    expected_points = "".join(
+        f"        {t:.9f} {lat:.9f} {lon:.9f} {alt:.6f}\n"
+        for t, lat, lon, alt in zip(offsets, latitudes, longitudes, altitudes)
+    )
+    assert "    BEGIN Points\n" + expected_points + "    END Points\n" in track
+
+
+def test_parallel_export_matches_serial_and_reports_file_timings(tmp_path: Path) -> None:
+    start_epoch = datetime(2024, 3, 2, 6, 0, 0)
+    offsets = 30.0 * np.arange(20)
+    rng = np.random.default_rng(12)
+    histories = [
+        ColumnarStateHistory.from_offsets(
+            f"SAT-{index}",
+            start_epoch,
+            offsets,
+            rng.normal(scale=7000.0, size=(offsets.size, 3)),
+            rng.normal(scale=7.5, size=(offsets.size, 3)),
+        )
+        for index in range(3)
+    ]
+    tracks = [
+        ColumnarGroundTrack.from_offsets(
+            history.satellite_id, start_epoch, offsets, 1.0, 2.0, 400.0
+        )
+        for history in histories
+    ]
+    metadata = ScenarioMetadata(
+        scenario_name="Parallel", start_epoch=start_epoch, ephemeris_step_seconds=10.0
+    )
+    results = SimulationResults(state_histories=histories, ground_tracks=tracks)
+
+    serial = export_simulation_to_stk(results, tmp_path / "serial", metadata)
+    parallel = export_simulation_to_stk(results, tmp_path / "parallel", metadata, workers=3)
+
+    expected = [f"SAT_{index}.e" for index in range(3)] + [
+        f"SAT_{index}_groundtrack.gt" for index in range(3)
+    ]
+    assert list(serial) == list(parallel) == expected
+    assert all(exported.elapsed_s >= 0.0 for exported in parallel.values())
+    assert [exported.point_count for exported in parallel.values()] == [58, 58, 58, 20, 20, 20]
+    for path in sorted((tmp_path / "serial").iterdir()):
+        assert (tmp_path / "parallel" / path.name).read_bytes() == path.read_bytes()
+
+
+def test_ephemeris_decimation_stays_within_lagrange_tolerance(tmp_path: Path) -> None:
+    start_epoch = datetime(2024, 3, 2, 6, 0, 0)
+    offsets = np.arange(5_400, dtype=float)
+    mean_motion = np.sqrt(398_600.4418 / 6_878.0**3)
+    phase = mean_motion * offsets
+    positions = 6_878.0 * np.column_stack(
+        (np.cos(phase), 0.2 * np.sin(phase), 0.98 * np.sin(phase))
+    )
+    velocities = np.gradient(positions, offsets, axis=0)
+    metadata = ScenarioMetadata(
+        scenario_name="Decimated", start_epoch=start_epoch, ephemeris_tolerance_km=1e-3
+    )
+
+    exported = export_simulation_to_stk(
+        SimulationResults(
+            state_histories=[
+                ColumnarStateHistory.from_offsets(
+                    "SAT-1", start_epoch, offsets, positions, velocities
+                )
+            ]
+        ),
+        tmp_path,
+        metadata,
+    )["SAT_1.e"]
+
+    lines = (tmp_path / "SAT_1.e").read_text(encoding="utf-8").splitlines()
+    begin = lines.index("    BEGIN EphemerisTimePosVel") + 1
+    end = lines.index("    END EphemerisTimePosVel")
+    rows = np.array([[float(value) for value in line.split()] for line in lines[begin:end]])
+    assert rows.shape[0] == exported.point_count < offsets.size // 10
+    assert rows[0, 0] == 0.0 and rows[-1, 0] == offsets[-1]
+    assert 0.0 < exported.max_error_km <= 1e-3
+
+    # Reconstruct with an independent degree-7 fit over the centred 8-point window.
+    errors = []
+    for time_offset, position in zip(offsets[::7], positions[::7]):
+        interval = np.searchsorted(rows[:, 0], time_offset, side="right") - 1
+        first = int(np.clip(interval - 3, 0, rows.shape[0] - 8))
+        window = rows[first : first + 8]
+        scaled = window[:, 0] - window[0, 0]
+        reconstructed = [
+            np.polyval(np.polyfit(scaled, window[:, axis], 7), time_offset - window[0, 0])
+            for axis in (1, 2, 3)
+        ]
+        errors.append(np.linalg.norm(np.array(reconstructed) - position))
+    assert max(errors) <= 1.01e-3
+
+
+def test_lagrange_resampling_is_accurate_bounded_and_chunk_invariant(monkeypatch) -> None:
+    from tools import _ephemeris_io, stk_export
+
+    mean_motion = np.sqrt(398_600.4418 / 6_878.0**3)
+    times = 60.0 * np.arange(40)
+    phase = mean_motion * times
+    positions = 6_878.0 * np.column_stack((np.cos(phase), np.sin(phase), np.zeros_like(phase)))
+    velocities = 6_878.0 * mean_motion * np.column_stack(
+        (-np.sin(phase), np.cos(phase), np.zeros_like(phase))
+    )
+
+    new_times, new_positions, new_velocities = stk_export._resample_ephemeris(
+        times, positions, velocities, 25.0
+    )
+    assert new_times[0] == times[0] and new_times[-1] == times[-1]
+    assert np.all(np.diff(new_times) > 0.0) and np.diff(new_times).max() == 25.0
+    new_phase = mean_motion * new_times
+    truth = 6_878.0 * np.column_stack((np.cos(new_phase), np.sin(new_phase)))
+    assert np.abs(new_positions[:, :2] - truth).max() < 1e-6
+
+    monkeypatch.setattr(_ephemeris_io, "LAGRANGE_CHUNK_SIZE", 7)
+    _, chunked_positions, chunked_velocities = stk_export._resample_ephemeris(
+        times, positions, velocities, 25.0
+    )
+    np.testing.assert_array_equal(chunked_positions, new_positions)
+    np.testing.assert_array_equal(chunked_velocities, new_velocities)
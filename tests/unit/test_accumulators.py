@@ -0,0 +1,96 @@
+"""Tests for the mergeable statistics in :mod:`constellation.accumulators`."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from constellation.accumulators import StreamingAccumulator
+
+
+def test_merged_shards_match_numpy_while_sketch_is_exact() -> None:
+    """Merged shard summaries should equal the statistics of the pooled samples."""
+
+    values = np.random.default_rng(11).normal(3.0, 2.0, size=1_003)
+
+    merged = StreamingAccumulator()
+    for chunk in np.array_split(values, 7):
+        shard = StreamingAccumulator()
+        shard.update(chunk)
+        merged.merge(shard)
+
+    assert merged.exact
+    summary = merged.summary()
+    assert summary["p95"] == np.percentile(values, 95.0)
+    assert summary["mean"] == pytest.approx(np.mean(values), rel=1e-12)
+    assert summary["std"] == pytest.approx(np.std(values), rel=1e-12)
+    assert summary["min"] == np.min(values)
+    assert summary["max"] == np.max(values)
+    for q in (0.0, 0.01, 0.5, 0.99, 1.0):
+        assert merged.quantile(q) == pytest.approx(np.quantile(values, q), rel=1e-12)
+
+
+def test_compacted_sketch_bounds_memory_and_rank_error() -> None:
+    """Large streams should compact into a small sketch with a small rank error."""
+
+    values = np.random.default_rng(5).lognormal(size=200_000)
+    accumulator = StreamingAccumulator(sketch_size=512)
+    for chunk in np.array_split(values, 40):
+        accumulator.update(chunk)
+
+    assert not accumulator.exact
+    assert sum(level.size for level in accumulator.levels) < 512 * len(accumulator.levels)
+    assert accumulator.count == values.size
+    assert accumulator.mean == pytest.approx(np.mean(values), rel=1e-12)
+    ordered = np.sort(values)
+    for q in (0.05, 0.5, 0.95):
+        rank = np.searchsorted(ordered, accumulator.quantile(q)) / values.size
+        assert abs(rank - q) < 0.01
+
+
+def test_sorted_stream_stays_within_the_compactor_rank_error_bound() -> None:
+    """Adversarially ordered input should respect the deterministic rank-error bound."""
+
+    ascending = np.arange(1_000_000, dtype=float)
+    probabilities = np.linspace(0.0, 1.0, 1_001)
+    for values in (ascending, ascending[::-1]):
+        accumulator = StreamingAccumulator(sketch_size=512)
+        for chunk in np.array_split(values, 1_000):
+            accumulator.update(chunk)
+
+        estimates = [accumulator.quantile(q) for q in probabilities]
+        error = np.abs(
+            np.searchsorted(ascending, estimates)
+            - np.searchsorted(ascending, np.quantile(values, probabilities))
+        ) / values.size
+        compacted_levels = len(accumulator.levels) - 1
+        assert compacted_levels > 0
+        assert np.max(error) <= compacted_levels / accumulator.sketch_size
+        assert np.max(error) < 0.005
+
+
+def test_merge_order_is_deterministic_and_ignores_non_finite_values() -> None:
+    """Replaying the same merges should reproduce the summary exactly."""
+
+    rng = np.random.default_rng(2)
+    chunks = [rng.normal(size=700) for _ in range(6)]
+    chunks[2][:3] = (np.nan, np.inf, -np.inf)
+
+    def build() -> StreamingAccumulator:
+        merged = StreamingAccumulator(sketch_size=256)
+        for chunk in chunks:
+            shard = StreamingAccumulator(sketch_size=256)
+            shard.update(chunk)
+            merged.merge(shard)
+        return merged
+
+    first, second = build(), build()
+    assert first.count == 6 * 700 - 3
+    assert first.summary() == second.summary()
+
+    empty = StreamingAccumulator()
+    assert math.isnan(empty.quantile(0.5))
+    with pytest.raises(ValueError):
+        first.quantile(1.5)
@@ -0,0 +1,83 @@
+"""Tests for the shared sidereal-angle service in :mod:`constellation.earth_orientation`."""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+from fractions import Fraction
+
+import numpy as np
+
+from constellation import earth_orientation
+
+
+def _exact_gmst(epoch: datetime) -> float:
+    """Evaluate the IAU 1982 expression in rational arithmetic."""
+
+    delta = epoch - earth_orientation.J2000_EPOCH
+    days = Fraction(delta.days) + Fraction(delta.seconds * 1_000_000 + delta.microseconds, 86_400_000_000)
+    centuries = days / 36_525
+    gmst_deg = (
+        Fraction("280.46061837")
+        + Fraction("360.98564736629") * days
+        + Fraction("0.000387933") * centuries**2
+        - centuries**3 / 38_710_000
+    )
+    return math.radians(float(gmst_deg % 360))
+
+
+def test_sidereal_angle_matches_rational_evaluation() -> None:
+    """The split day count should avoid the rounding of a floating-point Julian date."""
+
+    for epoch in (
+        datetime(2026, 3, 21, 7, 40, tzinfo=timezone.utc),
+        datetime(1999, 12, 31, 23, 59, 59, 999_999, tzinfo=timezone.utc),
+        datetime(2031, 7, 4, 16, 5, 12, 345_678, tzinfo=timezone.utc),
+    ):
+        assert abs(earth_orientation.greenwich_sidereal_angle(epoch) - _exact_gmst(epoch)) < 1e-13
+
+
+def test_uniform_grid_is_cached_and_tracks_per_epoch_angles() -> None:
+    """Reference-plus-rate angles should agree with direct evaluation across recalibrations."""
+
+    start = datetime(2026, 3, 21, 7, 35, 10, tzinfo=timezone.utc)
+    epochs = [start + timedelta(seconds=60.0 * index) for index in range(3 * 1_440)]
+
+    grid = earth_orientation.earth_orientation(epochs)
+    assert earth_orientation.earth_orientation(list(epochs)) is grid
+    naive = np.array([epoch.replace(tzinfo=None) for epoch in epochs], dtype="datetime64[us]")
+    assert earth_orientation.earth_orientation(naive) is grid
+
+    jittered = naive.copy()
+    jittered[1] += np.timedelta64(1, "us")
+    irregular = earth_orientation.earth_orientation(jittered)
+    assert irregular is not grid
+    assert irregular.offsets_s[1] == 60.000001
+    np.testing.assert_array_equal(irregular.offsets_s[2:], grid.offsets_s[2:])
+
+    direct = np.array([earth_orientation.greenwich_sidereal_angle(epoch) for epoch in epochs])
+    for interval in (earth_orientation.DEFAULT_RECALIBRATION_INTERVAL_S, None):
+        angles = earth_orientation.earth_orientation(epochs, interval).angles
+        wrapped = np.mod(angles - direct + math.pi, 2.0 * math.pi) - math.pi
+        assert np.max(np.abs(wrapped)) < 1e-12
+
+    positions = np.random.default_rng(4).normal(0.0, 7.0e6, size=(len(epochs), 2, 3))
+    np.testing.assert_allclose(
+        grid.ecef_to_inertial(grid.inertial_to_ecef(positions)), positions, rtol=0.0, atol=1e-8
+    )
+    np.testing.assert_allclose(
+        grid.inertial_to_ecef(positions),
+        np.einsum("tij,tkj->tki", grid.rotations, positions),
+        rtol=0.0,
+        atol=1e-8,
+    )
+
+
+def test_uniform_grid_cache_holds_only_a_few_grids() -> None:
+    """Large cached rotation arrays should not accumulate across many distinct grids."""
+
+    start = datetime(2026, 3, 21, 7, 35, 10, tzinfo=timezone.utc)
+    for count in range(2, 12):
+        earth_orientation.uniform_earth_orientation(start, 10.0, count)
+
+    assert earth_orientation.uniform_earth_orientation.cache_info().currsize <= 4
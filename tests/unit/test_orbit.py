@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import math
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
+from constellation import orbit
 from constellation.orbit import cartesian_to_classical, classical_to_cartesian
 from constellation.roe import OrbitalElements
 
@@ -56,3 +59,18 @@ def test_cartesian_conversion_handles_near_circular_case() -> None:
     assert recovered.inclination == pytest.approx(elements.inclination, rel=1e-9)
     assert _angle_close(recovered.raan, elements.raan, tol=1e-6)
     assert _angle_close(recovered.mean_anomaly, elements.mean_anomaly, tol=1e-6)
+
+
+def test_inertial_to_ecef_series_matches_per_epoch_rotation() -> None:
+    """Rotating a state history at once should match rotating each epoch separately."""
+
+    start = datetime(2026, 3, 21, 6, 0, 0, tzinfo=timezone.utc)
+    epochs = [start + timedelta(seconds=30.0 * index) for index in range(5)]
+    positions = np.random.default_rng(0).normal(0.0, 7.0e6, size=(5, 2, 3))
+
+    rotated = orbit.inertial_to_ecef_series(positions, epochs)
+
+    for index, epoch in enumerate(epochs):
+        np.testing.assert_allclose(
+            rotated[index], orbit.inertial_to_ecef(positions[index], epoch), rtol=0.0, atol=1e-6
+        )
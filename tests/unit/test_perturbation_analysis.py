@@ -0,0 +1,402 @@
+"""Regression tests for the high-fidelity propagator in :mod:`sim.scripts.perturbation_analysis`."""
+
+from __future__ import annotations
+
+import importlib
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.constellation.roe import OrbitalElements
+
+perturbation_analysis = importlib.import_module("sim.scripts.perturbation_analysis")
+
+
+def _settings() -> object:
+    start = datetime(2026, 3, 21, 9, 20, tzinfo=timezone.utc)
+    return perturbation_analysis.PropagatorSettings(
+        start_time=start,
+        epoch_time=start,
+        stop_time=start + timedelta(minutes=10),
+        time_step_s=10.0,
+        drag_coefficient=2.2,
+        ballistic_coefficient_m2_per_kg=0.025,
+        solar_flux_index=perturbation_analysis.SOLAR_FLUX_BASE,
+    )
+
+
+def _leader_elements() -> OrbitalElements:
+    return OrbitalElements(
+        semi_major_axis=6_880_150.0,
+        eccentricity=0.00012,
+        inclination=math.radians(97.7),
+        raan=math.radians(18.88),
+        arg_perigee=math.radians(87.0),
+        mean_anomaly=math.radians(309.45),
+    )
+
+
+def test_vectorised_rk4_matches_per_vehicle_stepping() -> None:
+    """Stepping a 24-vehicle array at once should equal stepping each vehicle alone."""
+
+    formation = [
+        {
+            "identifier": f"SAT-{index:02d}",
+            "radial_offset_km": 0.01 * index,
+            "along_track_offset_km": 5.0 * index,
+            "cross_track_offset_km": -0.1 * index,
+            "drag_coefficient": 2.0 + 0.02 * index,
+        }
+        for index in range(24)
+    ]
+    settings = _settings()
+    states = perturbation_analysis._initial_states(_leader_elements(), formation, 2.2)
+    positions, velocities, drag_factors = perturbation_analysis._state_arrays(states)
+
+    batch_positions, batch_velocities = positions, velocities
+    for _ in range(30):
+        batch_positions, batch_velocities = perturbation_analysis._rk4_step(
+            batch_positions, batch_velocities, drag_factors, settings.time_step_s, settings
+        )
+
+    for index in range(len(formation)):
+        single_position = positions[index : index + 1]
+        single_velocity = velocities[index : index + 1]
+        for _ in range(30):
+            single_position, single_velocity = perturbation_analysis._rk4_step(
+                single_position,
+                single_velocity,
+                drag_factors[index : index + 1],
+                settings.time_step_s,
+                settings,
+            )
+        np.testing.assert_allclose(batch_positions[index], single_position[0], rtol=0.0, atol=1e-6)
+        np.testing.assert_allclose(batch_velocities[index], single_velocity[0], rtol=0.0, atol=1e-9)
+
+
+def test_acceleration_includes_drag_opposing_relative_velocity() -> None:
+    """Drag should act against the velocity relative to the rotating atmosphere."""
+
+    settings = _settings()
+    position = np.array([[6_778_137.0, 0.0, 0.0]])
+    velocity = np.array([[0.0, 7_668.0, 0.0]])
+
+    with_drag = perturbation_analysis._acceleration(position, velocity, np.array([0.1]), settings)
+    without_drag = perturbation_analysis._acceleration(position, velocity, np.array([0.0]), settings)
+
+    drag = with_drag - without_drag
+    assert drag[0, 1] < 0.0
+    assert drag[0, 0] == pytest.approx(0.0, abs=1e-15)
+    assert drag[0, 2] == pytest.approx(0.0, abs=1e-15)
+
+
+def test_ensemble_monte_carlo_matches_serial_reference() -> None:
+    """Ensemble propagation should reproduce the per-run reference loop."""
+
+    settings = _settings()
+    settings.evaluation_time = settings.start_time + timedelta(minutes=5)
+    samples = np.random.default_rng(7).normal(0.0, (5.0, math.radians(0.01), 0.05), size=(4, 3))
+    arguments = (
+        _leader_elements(),
+        perturbation_analysis.DEFAULT_FORMATION,
+        settings,
+        math.radians(35.6892),
+        math.radians(51.3890),
+        samples,
+        0.0,
+        settings.evaluation_time,
+    )
+
+    ensemble = perturbation_analysis._propagate_monte_carlo_ensemble(*arguments)
+    serial = perturbation_analysis._propagate_monte_carlo_serial(*arguments)
+
+    for field in (
+        "vehicle_max_abs_km",
+        "vehicle_min_abs_km",
+        "vehicle_evaluation_km",
+        "relative_max_abs_km",
+        "relative_min_abs_km",
+        "plane_distance_km",
+    ):
+        np.testing.assert_allclose(getattr(ensemble, field), getattr(serial, field), rtol=1e-9)
+
+
+def test_monte_carlo_summary_is_independent_of_worker_count() -> None:
+    """Spawned shard seeds should make the summary identical for any worker count."""
+
+    settings = _settings()
+    arguments = (
+        _leader_elements(),
+        perturbation_analysis.DEFAULT_FORMATION,
+        settings,
+        math.radians(35.6892),
+        math.radians(51.3890),
+    )
+    config = {"runs": 500, "seed": 99, "batch_size": 125}
+
+    single = perturbation_analysis._run_monte_carlo(
+        *arguments, perturbation_analysis._normalise_monte_carlo({**config, "workers": 1})
+    )
+    pooled = perturbation_analysis._run_monte_carlo(
+        *arguments, perturbation_analysis._normalise_monte_carlo({**config, "workers": 2})
+    )
+
+    assert single == pooled
+    assert single["runs"] == 500
+
+
+def test_binomial_intervals_match_reference_values() -> None:
+    """Wilson and Clopper–Pearson bounds should match tabulated reference values."""
+
+    lower, upper = perturbation_analysis._binomial_interval(0, 200, 0.95, "wilson")
+    assert lower == 0.0
+    assert upper == pytest.approx(0.018845, abs=1e-6)
+
+    lower, upper = perturbation_analysis._binomial_interval(0, 100, 0.95, "clopper_pearson")
+    assert lower == 0.0
+    assert upper == pytest.approx(0.036217, abs=1e-6)
+
+    lower, upper = perturbation_analysis._binomial_interval(50, 100, 0.95, "wilson")
+    assert lower == pytest.approx(0.403832, abs=1e-6)
+    assert upper == pytest.approx(0.596168, abs=1e-6)
+
+
+def test_adaptive_monte_carlo_stops_once_intervals_are_narrow() -> None:
+    """A study whose compliance is clearly settled should stop well before its budget."""
+
+    settings = _settings()
+    arguments = (
+        _leader_elements(),
+        perturbation_analysis.DEFAULT_FORMATION,
+        settings,
+        math.radians(35.6892),
+        math.radians(51.3890),
+    )
+    config = {
+        "seed": 5,
+        "batch_size": 250,
+        "adaptive": {"enabled": True, "half_width": 0.01, "max_runs": 2000, "batch_size": 40},
+    }
+
+    summary = perturbation_analysis._run_monte_carlo(
+        *arguments, perturbation_analysis._normalise_monte_carlo({**config, "workers": 1})
+    )
+    pooled = perturbation_analysis._run_monte_carlo(
+        *arguments, perturbation_analysis._normalise_monte_carlo({**config, "workers": 2})
+    )
+
+    assert summary == pooled
+    assert summary["stopping"]["converged"]
+    assert summary["stopping"]["check_interval"] == 40
+    assert summary["runs"] < 250
+    assert summary["runs"] % 40 == 0
+    for key in ("primary_fraction", "waiver_fraction"):
+        assert summary["confidence_intervals"][key]["half_width"] <= 0.01
+
+
+def test_linearised_surrogate_tracks_nonlinear_ensemble() -> None:
+    """Mapping samples through the dispersion sensitivities should match the full dynamics."""
+
+    settings = _settings()
+    settings.evaluation_time = settings.start_time + timedelta(minutes=5)
+    samples = np.random.default_rng(3).normal(0.0, (5.0, math.radians(0.01), 0.05), size=(16, 3))
+    arguments = (
+        _leader_elements(),
+        perturbation_analysis.DEFAULT_FORMATION,
+        settings,
+        math.radians(35.6892),
+        math.radians(51.3890),
+        samples,
+        0.0,
+        settings.evaluation_time,
+    )
+
+    surrogate = perturbation_analysis._propagate_monte_carlo_linearised(*arguments)
+    ensemble = perturbation_analysis._propagate_monte_carlo_ensemble(*arguments)
+
+    for field in ("vehicle_max_abs_km", "vehicle_min_abs_km", "vehicle_evaluation_km"):
+        np.testing.assert_allclose(getattr(surrogate, field), getattr(ensemble, field), atol=1e-3)
+    np.testing.assert_allclose(surrogate.relative_max_abs_km, ensemble.relative_max_abs_km, atol=1e-3)
+
+
+def test_cross_track_summary_reports_extrema_passes_and_relative_series() -> None:
+    """The post-pass should locate first extrema, count sign changes, and skip undefined offsets."""
+
+    start = datetime(2026, 3, 21, 9, 20, tzinfo=timezone.utc)
+    epochs = [start + timedelta(seconds=10.0 * index) for index in range(5)]
+    cross_track = np.array(
+        [
+            [-3.0, 4.0],
+            [-1.0, 2.0],
+            [0.0, -2.0],
+            [2.0, -5.0],
+            [3.0, 1.0],
+        ]
+    )
+    relative = np.array([np.nan, 0.4, -0.1, 0.3, np.nan])
+
+    metrics, relative_summary = perturbation_analysis._cross_track_summary(
+        ["FSAT-LDR", "FSAT-DP1"], epochs, cross_track, relative, 0.6, 0.9
+    )
+
+    leader, deputy = metrics["vehicles"]
+    assert leader["pass_count"] == 1
+    assert deputy["pass_count"] == 2
+    assert leader["max_abs_cross_track_km"] == 3.0
+    assert leader["time_of_max_abs_cross_track"] == "2026-03-21T09:20:00Z"
+    assert deputy["min_abs_cross_track_km"] == 1.0
+    assert deputy["time_of_min_abs_cross_track"] == "2026-03-21T09:20:40Z"
+    assert metrics["centroid"]["min_abs_cross_track_km"] == pytest.approx(0.5)
+    assert metrics["centroid"]["time_of_min_abs_cross_track"] == "2026-03-21T09:20:00Z"
+    assert metrics["overall_min_abs_cross_track_km"] == 1.0
+
+    assert relative_summary["max_abs_km"] == pytest.approx(0.4)
+    assert relative_summary["min_abs_km"] == pytest.approx(0.1)
+    assert relative_summary["time_of_min"] == "2026-03-21T09:20:20Z"
+    assert [stamp for stamp, _ in relative_summary["series"]] == [
+        "2026-03-21T09:20:10Z",
+        "2026-03-21T09:20:20Z",
+        "2026-03-21T09:20:30Z",
+    ]
+
+
+def test_propagate_cross_track_applies_raan_override_in_memory(tmp_path) -> None:
+    """The in-memory series should match the CSV artefact of a re-configured scenario."""
+
+    elements = _leader_elements()
+    classical = {
+        "semi_major_axis_km": elements.semi_major_axis / 1_000.0,
+        "eccentricity": elements.eccentricity,
+        "inclination_deg": math.degrees(elements.inclination),
+        "raan_deg": 10.0,
+        "argument_of_perigee_deg": math.degrees(elements.arg_perigee),
+        "mean_anomaly_deg": math.degrees(elements.mean_anomaly),
+    }
+    scenario = {"orbital_elements": {"classical": classical}}
+    settings = _settings()
+
+    series = perturbation_analysis.propagate_cross_track(
+        scenario, settings=settings, raan_deg=18.88
+    )
+    assert classical["raan_deg"] == 10.0
+
+    reference = {"orbital_elements": {"classical": {**classical, "raan_deg": 18.88}}}
+    perturbation_analysis.propagate_constellation(
+        reference,
+        output_directory=tmp_path,
+        settings=settings,
+        monte_carlo={"enabled": False, "runs": 0},
+    )
+    rows = (tmp_path / "deterministic_cross_track.csv").read_text().splitlines()
+    header = rows[0].split(",")[1:]
+    expected = np.array([[float(value) for value in row.split(",")[1:]] for row in rows[1:]])
+    columns = [series.identifiers.index(identifier) for identifier in header]
+
+    assert len(series.epochs) == expected.shape[0]
+    np.testing.assert_allclose(series.cross_track_km[:, columns], expected, atol=1e-6)
+
+    sample_time, values = series.nearest_sample(settings.start_time + timedelta(seconds=44.0))
+    assert sample_time == settings.start_time + timedelta(seconds=40.0)
+    assert values[header[0]] == pytest.approx(expected[4, 0], abs=1e-6)
+
+
+def test_raan_sweep_rotation_matches_repropagation() -> None:
+    """Rotating the stored trajectory should reproduce a propagation at the new RAAN."""
+
+    elements = _leader_elements()
+    scenario = {
+        "orbital_elements": {
+            "classical": {
+                "semi_major_axis_km": elements.semi_major_axis / 1_000.0,
+                "eccentricity": elements.eccentricity,
+                "inclination_deg": math.degrees(elements.inclination),
+                "raan_deg": math.degrees(elements.raan),
+                "argument_of_perigee_deg": math.degrees(elements.arg_perigee),
+                "mean_anomaly_deg": math.degrees(elements.mean_anomaly),
+            }
+        }
+    }
+    settings = _settings()
+    sweep = perturbation_analysis.prepare_raan_sweep(scenario, settings=settings)
+
+    for raan_deg in (18.88, 21.5, 200.0):
+        rotated = sweep.cross_track(raan_deg)
+        propagated = perturbation_analysis.propagate_cross_track(
+            scenario, settings=settings, raan_deg=raan_deg
+        )
+        assert rotated.identifiers == propagated.identifiers
+        np.testing.assert_allclose(rotated.cross_track_km, propagated.cross_track_km, atol=1e-6)
+        np.testing.assert_allclose(rotated.altitude_m, propagated.altitude_m, atol=1e-3)
+
+
+def test_cross_track_windows_slice_one_continuous_propagation() -> None:
+    """Shifted windows should be slices of a single propagation spanning all of them."""
+
+    elements = _leader_elements()
+    scenario = {
+        "orbital_elements": {
+            "classical": {
+                "semi_major_axis_km": elements.semi_major_axis / 1_000.0,
+                "eccentricity": elements.eccentricity,
+                "inclination_deg": math.degrees(elements.inclination),
+                "raan_deg": math.degrees(elements.raan),
+                "argument_of_perigee_deg": math.degrees(elements.arg_perigee),
+                "mean_anomaly_deg": math.degrees(elements.mean_anomaly),
+            }
+        }
+    }
+    settings = _settings()
+    settings.evaluation_time = settings.start_time + timedelta(minutes=5, seconds=5)
+    shift = timedelta(minutes=3)
+
+    windows = perturbation_analysis.propagate_cross_track_windows(
+        scenario, [timedelta(0), shift], settings=settings
+    )
+    summary, _ = perturbation_analysis.propagate_constellation(
+        scenario, settings=settings, monte_carlo={"enabled": False, "runs": 0}
+    )
+    assert windows[0][1] == summary["cross_track"]["evaluation"]
+
+    extended = perturbation_analysis.PropagatorSettings(
+        **{**vars(settings), "stop_time": settings.stop_time + shift}
+    )
+    reference = perturbation_analysis.propagate_cross_track(scenario, settings=extended)
+    series, evaluation = windows[1]
+    offset = int(shift.total_seconds() / settings.time_step_s)
+    assert series.epochs == reference.epochs[offset:]
+    np.testing.assert_allclose(
+        series.cross_track_km, reference.cross_track_km[offset:], rtol=0.0, atol=1e-9
+    )
+    assert evaluation["time_utc"] == "2026-03-21T09:28:05Z"
+
+
+def test_linearised_study_propagates_its_surrogate_once(monkeypatch) -> None:
+    """Shards should share one set of sensitivities and only the first should spot-check."""
+
+    calls = []
+    original = perturbation_analysis._linearised_sensitivities
+
+    def counting_sensitivities(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(perturbation_analysis, "_linearised_sensitivities", counting_sensitivities)
+    settings = _settings()
+    config = perturbation_analysis._normalise_monte_carlo(
+        {"runs": 500, "seed": 11, "batch_size": 125, "mode": "linearised", "spot_checks": 3}
+    )
+
+    summary = perturbation_analysis._run_monte_carlo(
+        _leader_elements(),
+        perturbation_analysis.DEFAULT_FORMATION,
+        settings,
+        math.radians(35.6892),
+        math.radians(51.3890),
+        config,
+    )
+
+    assert len(calls) == 1
+    assert summary["runs"] == 500
+    assert summary["surrogate_validation"]["spot_checks"] == 3
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
 from tools import render_debug_plots
+from tools.stk_export import (
+    ColumnarGroundTrack,
+    ColumnarStateHistory,
+    ScenarioMetadata,
+    SimulationResults,
+    export_simulation_to_stk,
+)
 
 
 def test_render_3d_outputs_vector_svg(tmp_path: Path) -> None:
@@ -74,3 +82,54 @@ def test_render_3d_outputs_vector_svg(tmp_path: Path) -> None:
 
     html_payload = html_path.read_text(encoding="utf-8")
     assert "plotly" in html_payload
+
+
+def test_stk_readers_round_trip_exported_files(tmp_path: Path) -> None:
+    """Exported ephemerides and ground tracks should load back with their epochs."""
+
+    start = datetime(2025, 3, 20, 6, 0, 0, 500_000, tzinfo=timezone.utc)
+    offsets = np.array([0.0, 30.25, 60.000001, 90.5])
+    positions = np.array(
+        [[7000.0, 1.5, -2.0], [6999.0, 2.5, -1.0], [6998.5, 3.0, 0.0], [6998.0, 3.5, 1.0]]
+    )
+    velocities = np.full((4, 3), 7.5)
+    export_simulation_to_stk(
+        SimulationResults(
+            state_histories=[
+                ColumnarStateHistory.from_offsets("SAT-1", start, offsets, positions, velocities)
+            ],
+            ground_tracks=[
+                ColumnarGroundTrack.from_offsets(
+                    "SAT-1",
+                    start,
+                    offsets,
+                    [35.1, 35.2, 35.3, 35.4],
+                    [51.0, 51.1, 51.2, 51.3],
+                    520.0,
+                )
+            ],
+        ),
+        tmp_path,
+        ScenarioMetadata(scenario_name="Readers", start_epoch=start),
+    )
+    track_path = tmp_path / "SAT_1_groundtrack.gt"
+    track_text = track_path.read_text(encoding="utf-8")
+    malformed_rows = "# comment\n\n        12.0 bad 1.0 2.0\n        13.0 1.0\n"
+    track_text = track_text.replace("    BEGIN Points\n", "    BEGIN Points\n" + malformed_rows)
+    track_path.write_text(track_text, encoding="utf-8")
+
+    ephemerides = render_debug_plots._load_stk_ephemerides(tmp_path)  # noqa: SLF001
+    groundtracks = render_debug_plots._load_stk_groundtracks(tmp_path)  # noqa: SLF001
+
+    expected_times = pd.Series(
+        pd.to_datetime([start + pd.Timedelta(seconds=offset) for offset in offsets], utc=True),
+        name="time_utc",
+    ).astype("datetime64[ns, UTC]")
+    ephemeris = ephemerides["SAT_1"]
+    pd.testing.assert_series_equal(ephemeris["time_utc"], expected_times)
+    np.testing.assert_array_equal(ephemeris[["x_m", "y_m", "z_m"]].to_numpy(), positions * 1000.0)
+
+    track = groundtracks["SAT_1"]
+    pd.testing.assert_series_equal(track["time_utc"], expected_times)
+    np.testing.assert_array_equal(track["latitude_deg"].to_numpy(), [35.1, 35.2, 35.3, 35.4])
+    np.testing.assert_array_equal(track["altitude_m"].to_numpy(), np.full(4, 520_000.0))
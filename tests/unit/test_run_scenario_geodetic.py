@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
 import importlib
@@ -17,7 +18,7 @@ def test_greenwich_sidereal_angle_matches_reference_value() -> None:
 
     epoch = datetime(2026, 3, 21, 7, 40, tzinfo=timezone.utc)
     angle = run_scenario._greenwich_sidereal_angle(epoch)
-    assert angle == pytest.approx(5.128507946572053, rel=1e-12, abs=0.0)
+    assert angle == pytest.approx(5.128507946241594, rel=1e-12, abs=0.0)
 
 
 def test_eci_to_geodetic_recovers_tehran_coordinates() -> None:
@@ -42,7 +43,7 @@ def test_eci_to_geodetic_recovers_tehran_coordinates() -> None:
     y_ecef = (normal + altitude_km) * cos_lat * sin_lon
     z_ecef = (normal * (1.0 - e2) + altitude_km) * sin_lat
 
-    greenwich_angle = 5.128507946572053
+    greenwich_angle = 5.128507946241594
     cos_angle = math.cos(greenwich_angle)
     sin_angle = math.sin(greenwich_angle)
     x_eci = cos_angle * x_ecef - sin_angle * y_ecef
@@ -54,3 +55,33 @@ def test_eci_to_geodetic_recovers_tehran_coordinates() -> None:
     assert lat_deg == pytest.approx(35.6892, abs=1e-4)
     assert lon_deg == pytest.approx(51.3890, abs=1e-4)
     assert alt_km == pytest.approx(altitude_km, rel=5e-4)
+
+
+def test_vectorised_kepler_solution_matches_scalar_iteration() -> None:
+    """The array Kepler solver should reproduce the scalar solver at every sample."""
+
+    mean_anomaly = np.linspace(-math.pi, 3.0 * math.pi, 257)
+    for eccentricity in (0.0, 0.001, 0.3):
+        solved = run_scenario._solve_kepler_array(mean_anomaly, eccentricity)
+        true_anomaly = run_scenario._eccentric_to_true_anomaly_array(solved, eccentricity)
+        for index, value in enumerate(mean_anomaly):
+            expected = run_scenario._solve_kepler(float(value), eccentricity)
+            assert solved[index] == pytest.approx(expected, abs=1e-11)
+            assert true_anomaly[index] == pytest.approx(
+                run_scenario._eccentric_to_true_anomaly(expected, eccentricity), abs=1e-11
+            )
+
+
+def test_vectorised_geodetic_conversion_handles_polar_rows() -> None:
+    """Rows on the rotation axis should map to the poles without numerical warnings."""
+
+    b = run_scenario.EARTH_RADIUS_KM * (1.0 - run_scenario.EARTH_FLATTENING)
+    positions = np.array([[0.0, 0.0, b + 500.0], [0.0, 0.0, -(b + 20.0)], [7000.0, 0.0, 0.0]])
+    latitude, longitude, altitude = run_scenario._eci_to_geodetic_array(
+        positions, np.ones(3), np.zeros(3)
+    )
+
+    assert latitude.tolist() == [90.0, -90.0, 0.0]
+    assert altitude[:2] == pytest.approx([500.0, 20.0])
+    assert altitude[2] == pytest.approx(7000.0 - run_scenario.EARTH_RADIUS_KM)
+    assert longitude[2] == pytest.approx(0.0)
@@ -0,0 +1,31 @@
+"""Tests for the Monte Carlo configuration forwarded by :mod:`sim.scripts.run_scenario`."""
+
+from __future__ import annotations
+
+import importlib
+
+from sim.scripts import configuration
+
+run_scenario = importlib.import_module("sim.scripts.run_scenario")
+
+
+def test_scenario_adaptive_monte_carlo_block_stops_early() -> None:
+    """A scenario-level adaptive block should reach the dispersion study and stop it early."""
+
+    scenario = dict(configuration.load_scenario("tehran_daily_pass"))
+    scenario["monte_carlo"] = {
+        "seed": 5,
+        "batch_size": 50,
+        "mode": "linearised",
+        "adaptive": {"enabled": True, "half_width": 0.05, "max_runs": 2000},
+    }
+
+    summary, _ = run_scenario._apply_j2_drag({}, [], scenario, monte_carlo_workers=1)
+
+    monte_carlo = summary["monte_carlo"]
+    assert monte_carlo["stopping"]["adaptive"]
+    assert monte_carlo["stopping"]["converged"]
+    assert monte_carlo["stopping"]["max_runs"] == 2000
+    assert monte_carlo["runs"] < 2000
+    assert summary["settings"]["monte_carlo_runs"] == monte_carlo["runs"]
+    assert summary["settings"]["monte_carlo_max_runs"] == 2000
@@ -0,0 +1,54 @@
+"""Regression tests for the RAAN alignment solver in :mod:`sim.scripts.run_scenario`."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+from sim.scripts import configuration
+
+run_scenario = importlib.import_module("sim.scripts.run_scenario")
+
+
+def test_raan_alignment_refines_analytic_seed_with_few_evaluations() -> None:
+    """The analytic seed should sit near the optimum and Brent should settle quickly."""
+
+    scenario = configuration.load_scenario("tehran_daily_pass")
+    alignment = run_scenario._resolve_raan_alignment(scenario)
+
+    optimised = alignment["optimised_raan_deg"]
+    assert alignment["analytic_raan_deg"] == pytest.approx(optimised, abs=0.05)
+    assert alignment["solver"]["converged"]
+    assert alignment["solver"]["evaluation_count"] == len(alignment["evaluations"]) <= 20
+    assert scenario["orbital_elements"]["classical"]["raan_deg"] == optimised
+
+    centroid = alignment["centroid_abs_cross_track_km"]
+    values = [
+        evaluation["centroid_abs_cross_track_km"] for evaluation in alignment["evaluations"]
+    ]
+    assert centroid == min(values)
+    assert not alignment["solver"]["coarse_scan"]
+
+
+def test_raan_alignment_rescans_full_circle_when_seed_misses(monkeypatch, caplog) -> None:
+    """A seed far from the optimum should trigger the coarse scan and still converge."""
+
+    reference = run_scenario._resolve_raan_alignment(
+        configuration.load_scenario("tehran_daily_pass")
+    )
+    monkeypatch.setattr(
+        run_scenario,
+        "_analytic_raan_guess",
+        lambda *arguments: reference["analytic_raan_deg"] + 60.0,
+    )
+
+    scenario = configuration.load_scenario("tehran_daily_pass")
+    scenario["raan_alignment"] = {"samples_per_iteration": 5}
+    alignment = run_scenario._resolve_raan_alignment(scenario)
+
+    assert "samples_per_iteration is deprecated" in caplog.text
+    assert alignment["solver"]["coarse_scan"]
+    assert alignment["optimised_raan_deg"] == pytest.approx(
+        reference["optimised_raan_deg"], abs=1e-3
+    )
@@ -0,0 +1,98 @@
+"""Tests for the formation synthesis in :mod:`sim.scripts.run_stk_tehran`."""
+
+from __future__ import annotations
+
+import importlib
+from datetime import datetime, timezone
+
+import numpy as np
+
+from tools.stk_export import ColumnarGroundTrack, ColumnarStateHistory, ScenarioMetadata
+
+run_stk_tehran = importlib.import_module("sim.scripts.run_stk_tehran")
+run_scenario = importlib.import_module("sim.scripts.run_scenario")
+
+
+def _base_products() -> tuple[ColumnarStateHistory, ColumnarGroundTrack, ScenarioMetadata]:
+    start = datetime(2026, 3, 21, 6, 0, tzinfo=timezone.utc)
+    offsets = 60.0 * np.arange(6)
+    phase = 0.0011 * offsets
+    positions = 6_878.0 * np.column_stack((np.cos(phase), 0.6 * np.sin(phase), 0.8 * np.sin(phase)))
+    velocities = 7.6 * np.column_stack((-np.sin(phase), 0.6 * np.cos(phase), 0.8 * np.cos(phase)))
+    history = ColumnarStateHistory.from_offsets("SAT", start, offsets, positions, velocities)
+    track = ColumnarGroundTrack.from_offsets("SAT", start, offsets, 0.0, 0.0, 0.0)
+    return history, track, ScenarioMetadata(scenario_name="Tehran", start_epoch=start)
+
+
+def test_formation_offsets_follow_the_rtn_frame_of_each_sample() -> None:
+    """Radial, along-track and normal offsets should land on the per-sample RTN axes."""
+
+    history, track, metadata = _base_products()
+    spec = run_stk_tehran.FormationSpecification(
+        satellite_ids=("SAT-1", "SAT-2", "SAT-3"),
+        offsets_rtn_km=((2.0, 0.0, 0.0), (0.0, 3.0, 0.0), (0.0, 0.0, -4.0)),
+        side_length_km=6.0,
+    )
+
+    histories, tracks = run_stk_tehran._synthesise_formation_products(
+        history, track, metadata, spec
+    )
+
+    base = history.positions_eci_km
+    r_hat = base / np.linalg.norm(base, axis=1, keepdims=True)
+    h_hat = np.cross(base, history.velocities_eci_kms)
+    h_hat /= np.linalg.norm(h_hat, axis=1, keepdims=True)
+    t_hat = np.cross(h_hat, r_hat)
+    for synthesised, expected in zip(histories, (2.0 * r_hat, 3.0 * t_hat, -4.0 * h_hat)):
+        np.testing.assert_allclose(synthesised.positions_eci_km - base, expected, atol=1e-9)
+        np.testing.assert_array_equal(synthesised.velocities_eci_kms, history.velocities_eci_kms)
+        np.testing.assert_array_equal(synthesised.epochs, history.epochs)
+
+    assert [track.satellite_id for track in tracks] == ["SAT-1", "SAT-2", "SAT-3"]
+    for synthesised, satellite_track in zip(histories, tracks):
+        for sample, point in zip(synthesised.samples, satellite_track.points):
+            expected_point = run_scenario._eci_to_geodetic(
+                sample.position_eci_km, metadata.start_epoch, sample.epoch
+            )
+            np.testing.assert_allclose(
+                (point.latitude_deg, point.longitude_deg, point.altitude_km),
+                expected_point,
+                rtol=0.0,
+                atol=1e-9,
+            )
+
+
+def test_formation_metrics_align_jittered_epochs_and_report_pairs() -> None:
+    """Microsecond epoch jitter should not split samples, and pairs report their minima."""
+
+    start = datetime(2026, 3, 21, 6, 0, tzinfo=timezone.utc)
+    offsets = 10.0 * np.arange(5)
+    base = np.column_stack((7_000.0 + offsets, np.zeros(5), np.zeros(5)))
+    velocities = np.zeros((5, 3))
+    gaps = np.array([[3.0, 2.0, 1.0, 2.0, 3.0]]).T * np.array([[0.0, 1.0, 0.0]])
+    histories = [
+        ColumnarStateHistory.from_offsets("SAT-1", start, offsets, base, velocities),
+        ColumnarStateHistory.from_offsets(
+            "SAT-2", start, offsets + 3e-6, base + gaps, velocities
+        ),
+        ColumnarStateHistory.from_offsets(
+            "SAT-3", start, offsets[:4], base[:4] - 2.0 * gaps[:4], velocities[:4]
+        ),
+    ]
+
+    metrics = run_stk_tehran._summarise_formation_metrics(
+        histories, ScenarioMetadata(scenario_name="Tehran", start_epoch=start)
+    )
+
+    assert metrics["epoch_count"] == 4
+    assert metrics["sample_count"] == 12
+    assert metrics["min_separation_km"] == 1.0
+    assert metrics["max_separation_km"] == 9.0
+    first_pair, second_pair, third_pair = metrics["pairs"]
+    assert (first_pair["primary"], first_pair["secondary"]) == ("SAT-1", "SAT-2")
+    assert first_pair["min_separation_km"] == 1.0
+    assert first_pair["max_separation_km"] == 3.0
+    assert first_pair["mean_separation_km"] == 2.0
+    assert first_pair["time_of_min_separation_utc"] == "2026-03-21T06:00:20Z"
+    assert (second_pair["secondary"], second_pair["min_separation_km"]) == ("SAT-3", 2.0)
+    assert (third_pair["primary"], third_pair["max_separation_km"]) == ("SAT-2", 9.0)
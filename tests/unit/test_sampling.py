@@ -0,0 +1,56 @@
+"""Tests for the dispersion samplers in :mod:`constellation.sampling`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+from constellation.sampling import SAMPLERS, standard_normal_samples
+
+
+def test_pseudo_random_sampler_matches_generator_stream() -> None:
+    """Plain sampling should reproduce the generator's standard-normal stream."""
+
+    draws = standard_normal_samples(np.random.default_rng(21), 64, 3)
+    expected = np.random.default_rng(21).standard_normal((64, 3))
+    np.testing.assert_array_equal(draws, expected)
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS)
+def test_antithetic_samples_mirror_the_first_half(sampler: str) -> None:
+    """Antithetic pairing should negate the leading half of the draws."""
+
+    draws = standard_normal_samples(
+        np.random.default_rng(4), 10, 2, sampler=sampler, antithetic=True
+    )
+    assert draws.shape == (10, 2)
+    np.testing.assert_array_equal(draws[5:], -draws[:5])
+    assert np.all(np.isfinite(draws))
+
+
+def test_latin_hypercube_stratifies_each_marginal() -> None:
+    """Each Latin hypercube marginal should occupy every probability stratum once."""
+
+    count = 50
+    draws = standard_normal_samples(
+        np.random.default_rng(8), count, 4, sampler="latin_hypercube"
+    )
+    strata = np.floor(ndtr(draws) * count).astype(int)
+    for column in strata.T:
+        assert sorted(column) == list(range(count))
+
+
+def test_sobol_sampler_reduces_moment_error() -> None:
+    """Scrambled Sobol' draws should reproduce the unit-normal moments closely."""
+
+    draws = standard_normal_samples(np.random.default_rng(2), 1024, 3, sampler="sobol")
+    assert np.max(np.abs(draws.mean(axis=0))) < 5e-3
+    assert np.max(np.abs(draws.std(axis=0) - 1.0)) < 2e-2
+
+
+def test_unknown_sampler_is_rejected() -> None:
+    """Unrecognised sampler names should raise a ValueError."""
+
+    with pytest.raises(ValueError):
+        standard_normal_samples(np.random.default_rng(0), 4, 1, sampler="halton")
@@ -0,0 +1,47 @@
+"""Tests for the resumable journal of :mod:`sim.scripts.sweep_daily`."""
+
+from __future__ import annotations
+
+import importlib
+
+sweep_daily = importlib.import_module("sim.scripts.sweep_daily")
+
+
+def _result(day: int) -> object:
+    return sweep_daily.SweepResult(
+        day_offset=day,
+        date_iso=f"2026-03-{21 + day:02d}",
+        window_start="",
+        window_end="",
+        window_duration_s=90.0,
+        centroid_km=10.0 + day,
+        worst_km=20.0 + day,
+        primary_compliant=True,
+        waiver_compliant=True,
+    )
+
+
+def test_resume_skips_recorded_days_and_discards_truncated_rows(tmp_path, monkeypatch) -> None:
+    """Only missing days should be evaluated, and the journal should end up in day order."""
+
+    output = tmp_path / "sweep.csv"
+    sweep_daily._write_results_csv(output, [_result(0), _result(2)])
+    with output.open("a", encoding="utf-8") as handle:
+        handle.write("3,2026-03-24,,,90.0,13.000000,23.0")
+
+    evaluated: list[int] = []
+
+    def fake_evaluation(_scenario: object, day: int) -> object:
+        evaluated.append(day)
+        return _result(day)
+
+    monkeypatch.setattr(sweep_daily, "_evaluate_shifted_day", fake_evaluation)
+    status = sweep_daily.main(
+        ["tehran_triangle", "--days", "4", "--resume", "--output", str(output)]
+    )
+
+    assert status == 0
+    assert evaluated == [1, 3]
+    recorded = sweep_daily._read_results_csv(output)
+    assert list(recorded) == [0, 1, 2, 3]
+    assert recorded[3] == _result(3)
@@ -6,6 +6,8 @@ from datetime import datetime
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
+import pytest
 
 from sim.formation import simulate_triangle_formation
 
@@ -141,3 +143,49 @@ def test_passive_stability_without_station_keeping() -> None:
     areas = np.asarray(result.triangle_area_m2, dtype=float)
     area_drift = float(np.max(np.abs(areas - areas[0])))
     assert area_drift <= 1.2e7
+
+
+def test_dispersion_samples_are_independent_of_worker_count(tmp_path) -> None:
+    """Sharded dispersion samples should not depend on the number of worker processes."""
+
+    from sim.formation import triangle
+
+    formation = json.loads(Path("config/scenarios/tehran_triangle.json").read_text())["formation"]
+    satellite_ids = ("SAT-1", "SAT-2", "SAT-3")
+
+    serial_path, pooled_path = tmp_path / "serial.csv", tmp_path / "pooled.csv"
+    serial, _ = triangle._run_injection_recovery_monte_carlo(
+        satellite_ids, formation, 1, sample_path=serial_path
+    )
+    pooled, _ = triangle._run_injection_recovery_monte_carlo(
+        satellite_ids, formation, 2, sample_path=pooled_path
+    )
+    samples = pd.read_csv(serial_path)
+    assert len(samples) == 3 * formation["monte_carlo"]["samples"]
+    assert serial == pooled
+    assert serial_path.read_bytes() == pooled_path.read_bytes()
+
+    serial, _ = triangle._run_atmospheric_drag_dispersion_monte_carlo(
+        formation, 6_878_137.0, 1.70, 1, sample_path=serial_path
+    )
+    pooled, _ = triangle._run_atmospheric_drag_dispersion_monte_carlo(
+        formation, 6_878_137.0, 1.70, 2, sample_path=pooled_path
+    )
+    samples = pd.read_csv(serial_path)
+    assert samples["sample_id"].tolist() == list(range(formation["drag_dispersion"]["samples"]))
+    assert serial == pooled
+    assert serial_path.read_bytes() == pooled_path.read_bytes()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["pooled.csv", "serial.csv"]
+
+
+def test_injection_recovery_rejects_antithetic_sampling() -> None:
+    """Mirrored injection errors share their magnitudes, so antithetic pairs are refused."""
+
+    from sim.formation import triangle
+
+    formation = json.loads(Path("config/scenarios/tehran_triangle.json").read_text())["formation"]
+    formation = {**formation, "monte_carlo": {**formation["monte_carlo"], "antithetic": True}}
+
+    with pytest.raises(ValueError, match="Antithetic"):
+        triangle._run_injection_recovery_monte_carlo(("SAT-1", "SAT-2", "SAT-3"), formation, 1)
+    assert triangle._dispersion_sampler({"antithetic": True}) == ("pseudo_random", True)
@@ -5,23 +5,33 @@ from .stk_export import (
     SimulationResults,
     PropagatedStateHistory,
     StateSample,
+    ColumnarStateHistory,
     GroundTrack,
     GroundTrackPoint,
+    ColumnarGroundTrack,
     GroundContactInterval,
     FacilityDefinition,
     FormationMaintenanceEvent,
+    ExportedFile,
     export_simulation_to_stk,
 )
+from .oem_export import export_oem
+from .czml_export import export_czml
 
 __all__ = [
     "ScenarioMetadata",
     "SimulationResults",
     "PropagatedStateHistory",
     "StateSample",
+    "ColumnarStateHistory",
     "GroundTrack",
     "GroundTrackPoint",
+    "ColumnarGroundTrack",
     "GroundContactInterval",
     "FacilityDefinition",
     "FormationMaintenanceEvent",
+    "ExportedFile",
     "export_simulation_to_stk",
+    "export_oem",
+    "export_czml",
 ]
@@ -0,0 +1,152 @@
+"""Epoch conversion, block writing and Lagrange helpers shared by the ephemeris exporters.
+
+The STK, OEM and CZML exporters all write long state histories a block of rows
+at a time and describe them with the same sliding-window Lagrange
+interpolation, so the pieces they have in common live here rather than in any
+one exporter.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone, tzinfo
+from typing import List, Optional
+
+import numpy as np
+
+# Rows are formatted a block at a time: repeating the row template and applying
+# it to the flattened block with a single ``%`` keeps the per-value cost at the
+# float formatting itself, and ``%`` shares the f-string float formatting so the
+# text is byte-identical to formatting each row separately.
+ROWS_PER_BLOCK = 8_192
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Interpolation declared in the exported headers, which viewers apply when
+# loading the file.
+LAGRANGE_ORDER = 7
+LAGRANGE_CHUNK_SIZE = 65_536
+
+
+def naive_utc(epoch: datetime) -> datetime:
+    """Return *epoch* as a naive UTC datetime (naive inputs are taken as UTC)."""
+
+    if epoch.tzinfo is None:
+        return epoch
+    return epoch.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def epochs_to_datetimes(epochs: np.ndarray, epoch_tzinfo: Optional[tzinfo]) -> List[datetime]:
+    """Convert ``datetime64`` epochs back to datetimes carrying *epoch_tzinfo*."""
+
+    values = epochs.astype("datetime64[us]").astype(object).tolist()
+    if epoch_tzinfo is None:
+        return values
+    return [value.replace(tzinfo=epoch_tzinfo) for value in values]
+
+
+def write_rows(stream, row_format: str, columns: np.ndarray) -> None:
+    """Write each row of the 2-D *columns* array to *stream* using *row_format*."""
+
+    for start in range(0, columns.shape[0], ROWS_PER_BLOCK):
+        block = columns[start : start + ROWS_PER_BLOCK]
+        stream.write((row_format * block.shape[0]) % tuple(block.ravel().tolist()))
+
+
+def _lagrange_window_starts(
+    sample_times: np.ndarray, query_times: np.ndarray, order: int
+) -> np.ndarray:
+    """Return the first sample of the ``order + 1`` point window centred on each query."""
+
+    interval = np.searchsorted(sample_times, query_times, side="right") - 1
+    return np.clip(interval - (order - 1) // 2, 0, sample_times.size - order - 1)
+
+
+def lagrange_interpolate(
+    sample_times: np.ndarray,
+    samples: np.ndarray,
+    query_times: np.ndarray,
+    order: int = LAGRANGE_ORDER,
+) -> np.ndarray:
+    """Evaluate the sliding-window Lagrange interpolant of *samples* at *query_times*.
+
+    Each query uses the ``order + 1`` samples centred on the interval that
+    contains it, shifted inwards at the ends of the series, and queries are
+    processed in chunks so memory stays bounded for long histories.
+    """
+
+    sample_times = np.asarray(sample_times, dtype=float)
+    samples = np.asarray(samples, dtype=float)
+    query_times = np.asarray(query_times, dtype=float)
+    if sample_times.size < order + 1:
+        raise ValueError(
+            f"Lagrange interpolation of order {order} requires at least {order + 1} samples."
+        )
+
+    window = np.arange(order + 1)
+    result = np.empty((query_times.size,) + samples.shape[1:], dtype=float)
+    for start in range(0, query_times.size, LAGRANGE_CHUNK_SIZE):
+        queries = query_times[start : start + LAGRANGE_CHUNK_SIZE]
+        first = _lagrange_window_starts(sample_times, queries, order)
+        indices = first[:, np.newaxis] + window
+        origin = sample_times[first]
+        nodes = sample_times[indices] - origin[:, np.newaxis]
+        distances = (queries - origin)[:, np.newaxis] - nodes
+
+        weights = np.ones_like(nodes)
+        for j in range(order + 1):
+            for k in range(order + 1):
+                if k != j:
+                    weights[:, j] *= distances[:, k] / (nodes[:, j] - nodes[:, k])
+        result[start : start + queries.size] = np.einsum(
+            "mj,mj...->m...", weights, samples[indices]
+        )
+    return result
+
+
+def decimate_ephemeris(
+    times: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    tolerance_km: float,
+    order: int = LAGRANGE_ORDER,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Thin an ephemeris to samples whose Lagrange reconstruction stays within *tolerance_km*.
+
+    Starting from ``order + 1`` evenly spread samples, every interval that
+    holds a dense sample reconstructed further than the tolerance from its
+    position is bisected at the dense sample nearest its midpoint, and the
+    check is repeated until the whole trajectory is within tolerance.  Kept
+    samples reconstruct exactly, so the refinement always terminates.  The
+    achieved maximum position error is returned with the thinned arrays.
+    """
+
+    if not tolerance_km > 0.0:
+        raise ValueError("The ephemeris tolerance must be positive.")
+    if times.size <= order + 1:
+        return times, positions, velocities, 0.0
+
+    kept = np.unique(np.linspace(0, times.size - 1, order + 1).round().astype(np.int64))
+    while True:
+        errors = np.linalg.norm(
+            lagrange_interpolate(times[kept], positions[kept], times, order) - positions,
+            axis=1,
+        )
+        failing = np.flatnonzero(errors > tolerance_km)
+        if not failing.size:
+            break
+        intervals = np.unique(np.searchsorted(kept, failing, side="right") - 1)
+        kept = np.union1d(kept, (kept[intervals] + kept[intervals + 1]) // 2)
+
+    return times[kept], positions[kept], velocities[kept], float(errors.max())
+
+
+__all__ = [
+    "LAGRANGE_CHUNK_SIZE",
+    "LAGRANGE_ORDER",
+    "ROWS_PER_BLOCK",
+    "WRITE_BUFFER_BYTES",
+    "decimate_ephemeris",
+    "epochs_to_datetimes",
+    "lagrange_interpolate",
+    "naive_utc",
+    "write_rows",
+]
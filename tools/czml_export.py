@@ -0,0 +1,234 @@
+"""Export state histories as CZML for client-side interpolation in web viewers.
+
+Each spacecraft becomes a CZML packet whose position is a sampled Cartesian
+property in the Earth-fixed frame, rotated with the repository's Earth
+orientation so it matches the exported ground tracks.  The samples carry the
+Lagrange interpolation hints of the STK ephemerides and may be thinned with the
+same error-bounded decimation, so the viewer reconstructs the trajectory from a
+sparse set of points instead of embedding every simulation step.  When
+formation windows are supplied the packets are only available inside them and
+each window is a separate interval, keeping interpolation from bridging the
+gaps between passes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ``constellation`` is installed alongside ``tools``; a repository checkout
+# reaches it through the ``src`` directory instead.
+try:
+    from constellation.earth_orientation import EarthOrientationGrid
+except ModuleNotFoundError:  # pragma: no cover - depends on the import path
+    from src.constellation.earth_orientation import EarthOrientationGrid
+
+from ._ephemeris_io import LAGRANGE_ORDER, decimate_ephemeris, epochs_to_datetimes, naive_utc
+from .stk_export import ColumnarStateHistory, ExportedFile, StateHistory, unique_stk_names
+
+CZML_VERSION = "1.0"
+
+# Point and path colours cycled over the spacecraft, as RGBA bytes.
+_PALETTE = (
+    (31, 119, 180, 255),
+    (255, 127, 14, 255),
+    (44, 160, 44, 255),
+    (214, 39, 40, 255),
+    (148, 103, 189, 255),
+)
+
+
+def _format_czml_epoch(epoch: np.datetime64) -> str:
+    """Format a ``datetime64`` UTC epoch as an ISO 8601 string with a ``Z`` suffix."""
+
+    return str(np.datetime_as_string(np.datetime64(epoch, "us"), unit="us", timezone="UTC"))
+
+
+def _czml_interval(start: np.datetime64, end: np.datetime64) -> str:
+    return f"{_format_czml_epoch(start)}/{_format_czml_epoch(end)}"
+
+
+def _parse_window_epoch(value: object) -> np.datetime64:
+    if isinstance(value, datetime):
+        epoch = value
+    else:
+        text = str(value).strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        epoch = datetime.fromisoformat(text)
+    return np.datetime64(naive_utc(epoch), "us")
+
+
+def _window_bounds(
+    formation_windows: Sequence[Mapping[str, object]],
+) -> List[Tuple[np.datetime64, np.datetime64]]:
+    """Return the ``(start, end)`` epochs of the windows that define both ends."""
+
+    bounds = []
+    for window in formation_windows:
+        start, end = window.get("start"), window.get("end")
+        if not start or not end:
+            continue
+        bounds.append((_parse_window_epoch(start), _parse_window_epoch(end)))
+    return sorted(bounds)
+
+
+def _position_interval(
+    history: ColumnarStateHistory,
+    start: np.datetime64,
+    end: np.datetime64,
+    tolerance_km: Optional[float],
+) -> Tuple[Optional[Dict[str, object]], int, Optional[float]]:
+    """Return the sampled position covering ``[start, end]`` with its sample count and error.
+
+    The samples either side of the interval are kept so the client can
+    interpolate right up to its bounds.  ``None`` is returned when fewer than
+    two samples are available.
+    """
+
+    first = max(int(np.searchsorted(history.epochs, start, side="right")) - 1, 0)
+    last = min(int(np.searchsorted(history.epochs, end, side="left")) + 1, history.epochs.size)
+    epochs = history.epochs[first:last]
+    if epochs.size < 2:
+        return None, 0, None
+
+    reference = epochs_to_datetimes(epochs[:1], timezone.utc)[0]
+    times = (epochs - epochs[0]) / np.timedelta64(1, "s")
+    positions = EarthOrientationGrid(reference, times).inertial_to_ecef(
+        history.positions_eci_km[first:last]
+    )
+    degree = min(LAGRANGE_ORDER, epochs.size - 1)
+
+    max_error_km = None
+    if tolerance_km is not None:
+        # CZML carries positions only, so no velocity columns are thinned alongside.
+        times, positions, _, max_error_km = decimate_ephemeris(
+            times, positions, np.empty((times.size, 0)), tolerance_km, degree
+        )
+
+    interval = {
+        "interval": _czml_interval(start, end),
+        "epoch": _format_czml_epoch(epochs[0]),
+        "referenceFrame": "FIXED",
+        "interpolationAlgorithm": "LAGRANGE",
+        "interpolationDegree": degree,
+        "cartesian": np.column_stack((times, 1_000.0 * positions)).ravel().tolist(),
+    }
+    return interval, times.size, max_error_km
+
+
+def export_czml(
+    histories: Iterable[StateHistory],
+    output_path: Path | str,
+    *,
+    document_name: str = "Formation",
+    formation_windows: Sequence[Mapping[str, object]] = (),
+    tolerance_km: Optional[float] = None,
+) -> ExportedFile:
+    """Write *histories* to a CZML document for interpolation in the browser.
+
+    Parameters
+    ----------
+    histories:
+        Inertial state histories, per-sample or columnar, one per spacecraft.
+    output_path:
+        Destination file; its parent directory is created if necessary.
+    document_name:
+        Name of the CZML document packet.
+    formation_windows:
+        Mappings with ``start`` and ``end`` epochs, as in the
+        ``formation_windows`` metric of the triangle simulation.  When given,
+        the spacecraft are available only inside these windows; otherwise over
+        their whole history.
+    tolerance_km:
+        Thin each interval to the samples the order-7 Lagrange interpolation
+        needs to reconstruct the trajectory within this position error.
+        ``None`` keeps every sample.
+
+    Returns
+    -------
+    ExportedFile
+        Summary holding the file name, the number of position samples written,
+        the seconds spent producing them and, when decimated, the largest
+        reconstruction error in kilometres.
+    """
+
+    started = time.perf_counter()
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    columnar = [ColumnarStateHistory.from_history(history).ordered() for history in histories]
+    names = unique_stk_names(history.satellite_id for history in columnar)
+    windows = _window_bounds(formation_windows)
+
+    packets: List[Dict[str, object]] = []
+    point_count = 0
+    errors: List[float] = []
+    span_start: Optional[np.datetime64] = None
+    span_end: Optional[np.datetime64] = None
+    for index, history in enumerate(columnar):
+        if np.any(np.diff(history.epochs) <= np.timedelta64(0, "us")):
+            raise ValueError(
+                f"CZML samples for {history.satellite_id} must be strictly increasing."
+            )
+        if history.epochs.size < 2:
+            continue
+        bounds = windows or [(history.epochs[0], history.epochs[-1])]
+
+        intervals = []
+        for start, end in bounds:
+            interval, count, max_error_km = _position_interval(history, start, end, tolerance_km)
+            if interval is None:
+                continue
+            intervals.append(interval)
+            point_count += count
+            if max_error_km is not None:
+                errors.append(max_error_km)
+            span_start = start if span_start is None else min(span_start, start)
+            span_end = end if span_end is None else max(span_end, end)
+        if not intervals:
+            continue
+
+        colour = list(_PALETTE[index % len(_PALETTE)])
+        packets.append(
+            {
+                "id": names[history.satellite_id],
+                "name": history.satellite_id,
+                "availability": [interval["interval"] for interval in intervals],
+                "position": intervals,
+                "point": {"pixelSize": 8, "color": {"rgba": colour}},
+                "path": {
+                    "width": 1,
+                    "leadTime": 0,
+                    "material": {"solidColor": {"color": {"rgba": colour}}},
+                },
+            }
+        )
+
+    document: Dict[str, object] = {"id": "document", "name": document_name, "version": CZML_VERSION}
+    if span_start is not None and span_end is not None:
+        document["clock"] = {
+            "interval": _czml_interval(span_start, span_end),
+            "currentTime": _format_czml_epoch(span_start),
+            "multiplier": 60,
+            "range": "LOOP_STOP",
+            "step": "SYSTEM_CLOCK_MULTIPLIER",
+        }
+
+    with path.open("w", encoding="utf-8") as stream:
+        json.dump([document, *packets], stream, separators=(",", ":"))
+
+    return ExportedFile(
+        path.name,
+        point_count,
+        elapsed_s=time.perf_counter() - started,
+        max_error_km=max(errors) if errors else None,
+    )
+
+
+__all__ = ["CZML_VERSION", "export_czml"]
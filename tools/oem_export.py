@@ -0,0 +1,195 @@
+"""Streaming export of state histories as CCSDS Orbit Ephemeris Messages.
+
+The writer follows CCSDS 502.0-B-2 and emits either the keyword-value (KVN)
+or the XML encoding of an OEM.  Every state history it receives becomes one
+segment, written as soon as it arrives, so a simulator can hand over a long
+trajectory as an iterator of :class:`~tools.stk_export.ColumnarStateHistory`
+chunks and only one chunk is held in memory at a time.  Object names use the
+STK identifier sanitisation so both exports name a spacecraft identically.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+import time
+from typing import Dict, Iterable, Optional, TextIO
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from ._ephemeris_io import (
+    LAGRANGE_ORDER,
+    ROWS_PER_BLOCK,
+    WRITE_BUFFER_BYTES,
+    naive_utc,
+    write_rows,
+)
+from .stk_export import ColumnarStateHistory, ExportedFile, StateHistory, unique_stk_names
+
+OEM_VERSION = "2.0"
+
+_KVN_ROW_FORMAT = "%s % .14e % .14e % .14e % .14e % .14e % .14e\n"
+_XML_ROW_FORMAT = (
+    "        <stateVector>\n"
+    "          <EPOCH>%s</EPOCH>\n"
+    "          <X>%.14e</X>\n"
+    "          <Y>%.14e</Y>\n"
+    "          <Z>%.14e</Z>\n"
+    "          <X_DOT>%.14e</X_DOT>\n"
+    "          <Y_DOT>%.14e</Y_DOT>\n"
+    "          <Z_DOT>%.14e</Z_DOT>\n"
+    "        </stateVector>\n"
+)
+
+
+def _format_oem_epochs(epochs: np.ndarray) -> np.ndarray:
+    """Format ``datetime64`` UTC epochs with the OEM ``YYYY-MM-DDThh:mm:ss.ffffff`` layout."""
+
+    return np.datetime_as_string(np.asarray(epochs, dtype="datetime64[us]"), unit="us")
+
+
+def _segment_metadata(
+    history: ColumnarStateHistory, object_name: str, central_body: str
+) -> Dict[str, str]:
+    """Return the ordered metadata keywords describing the segment of *history*."""
+
+    start, stop = _format_oem_epochs(history.epochs[[0, -1]])
+    metadata = {
+        "OBJECT_NAME": object_name,
+        "OBJECT_ID": object_name,
+        "CENTER_NAME": central_body,
+        "REF_FRAME": history.frame,
+        "TIME_SYSTEM": "UTC",
+        "START_TIME": str(start),
+        "STOP_TIME": str(stop),
+    }
+    if history.epochs.size > 1:
+        metadata["INTERPOLATION"] = "LAGRANGE"
+        metadata["INTERPOLATION_DEGREE"] = str(min(LAGRANGE_ORDER, history.epochs.size - 1))
+    return metadata
+
+
+def _write_states(stream: TextIO, row_format: str, history: ColumnarStateHistory) -> None:
+    """Write the state vectors of *history* a block at a time using *row_format*."""
+
+    for start in range(0, history.epochs.size, ROWS_PER_BLOCK):
+        stop = start + ROWS_PER_BLOCK
+        epochs = _format_oem_epochs(history.epochs[start:stop])
+        block = np.empty((epochs.size, 7), dtype=object)
+        block[:, 0] = epochs
+        block[:, 1:4] = history.positions_eci_km[start:stop]
+        block[:, 4:] = history.velocities_eci_kms[start:stop]
+        write_rows(stream, row_format, block)
+
+
+def _write_kvn_segment(
+    stream: TextIO, metadata: Dict[str, str], history: ColumnarStateHistory
+) -> None:
+    stream.write("\nMETA_START\n")
+    for keyword, value in metadata.items():
+        stream.write(f"{keyword} = {value}\n")
+    stream.write("META_STOP\n\n")
+    _write_states(stream, _KVN_ROW_FORMAT, history)
+
+
+def _write_xml_segment(
+    stream: TextIO, metadata: Dict[str, str], history: ColumnarStateHistory
+) -> None:
+    stream.write("    <segment>\n      <metadata>\n")
+    for keyword, value in metadata.items():
+        stream.write(f"        <{keyword}>{escape(value)}</{keyword}>\n")
+    stream.write("      </metadata>\n      <data>\n")
+    _write_states(stream, _XML_ROW_FORMAT, history)
+    stream.write("      </data>\n    </segment>\n")
+
+
+def export_oem(
+    histories: Iterable[StateHistory],
+    output_path: Path | str,
+    *,
+    originator: str = "formation-sat-exporter",
+    central_body: str = "EARTH",
+    xml: bool = False,
+    creation_date: Optional[datetime] = None,
+) -> ExportedFile:
+    """Write *histories* to an OEM file, one segment per history.
+
+    Parameters
+    ----------
+    histories:
+        State histories in any order, per-sample or columnar.  A generator of
+        :class:`~tools.stk_export.ColumnarStateHistory` chunks is consumed
+        lazily and each chunk is written before the next is requested, so the
+        file can describe trajectories that never fit in memory at once.
+        Consecutive chunks of one spacecraft should share their boundary
+        sample for consumers to interpolate across the whole span.
+    output_path:
+        Destination file; its parent directory is created if necessary.
+    originator:
+        Value of the ``ORIGINATOR`` header keyword.
+    central_body:
+        ``CENTER_NAME`` of every segment.  The reference frame is taken from
+        each history.
+    xml:
+        Emit the CCSDS NDM/XML encoding instead of KVN.
+    creation_date:
+        ``CREATION_DATE`` of the message; defaults to the current UTC time.
+
+    Returns
+    -------
+    ExportedFile
+        Summary holding the file name, the number of state vectors written
+        and the seconds spent writing them.
+    """
+
+    started = time.perf_counter()
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    created = _format_oem_epochs(
+        np.datetime64(naive_utc(creation_date or datetime.now(timezone.utc)), "us")
+    )
+
+    object_names: Dict[str, str] = {}
+    point_count = 0
+    with path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as stream:
+        if xml:
+            stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            stream.write(f'<oem id="CCSDS_OEM_VERS" version="{OEM_VERSION}">\n')
+            stream.write("  <header>\n")
+            stream.write(f"    <CREATION_DATE>{created}</CREATION_DATE>\n")
+            stream.write(f"    <ORIGINATOR>{escape(originator)}</ORIGINATOR>\n")
+            stream.write("  </header>\n  <body>\n")
+        else:
+            stream.write(f"CCSDS_OEM_VERS = {OEM_VERSION}\n")
+            stream.write(f"CREATION_DATE = {created}\n")
+            stream.write(f"ORIGINATOR = {originator}\n")
+
+        for state_history in histories:
+            history = ColumnarStateHistory.from_history(state_history).ordered()
+            if not history.epochs.size:
+                continue
+            if np.any(np.diff(history.epochs) <= np.timedelta64(0, "us")):
+                raise ValueError(
+                    f"OEM samples for {history.satellite_id} must be strictly increasing."
+                )
+            if history.satellite_id not in object_names:
+                # Names are assigned in order of first appearance, so extending
+                # the mapping one spacecraft at a time reproduces the batch one.
+                object_names = unique_stk_names([*object_names, history.satellite_id])
+            metadata = _segment_metadata(
+                history, object_names[history.satellite_id], central_body
+            )
+            if xml:
+                _write_xml_segment(stream, metadata, history)
+            else:
+                _write_kvn_segment(stream, metadata, history)
+            point_count += history.epochs.size
+
+        if xml:
+            stream.write("  </body>\n</oem>\n")
+
+    return ExportedFile(path.name, point_count, elapsed_s=time.perf_counter() - started)
+
+
+__all__ = ["OEM_VERSION", "export_oem"]
@@ -12,11 +12,11 @@ import numpy as np
 from src.constellation.orbit import (
     propagate_kepler,
     propagate_perturbed,
-    inertial_to_ecef,
     geodetic_coordinates,
     OrbitalElements,
     classical_to_cartesian,
 )
+from src.constellation.earth_orientation import uniform_earth_orientation
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
@@ -104,6 +104,7 @@ def main():
     records = []
 
     current_elements = {sat_id: elements for sat_id in satellite_ids}
+    earth_rotations = uniform_earth_orientation(epoch, args.time_step_s, num_steps).rotations
 
     for i in range(num_steps):
         dt = args.time_step_s
@@ -123,7 +124,7 @@ def main():
             sat_pos_inertial = ref_pos + offset_vec
             
             # Convert to ECEF and then to geodetic
-            sat_pos_ecef = inertial_to_ecef(sat_pos_inertial, current_time)
+            sat_pos_ecef = earth_rotations[i] @ sat_pos_inertial
             lat, lon, alt = geodetic_coordinates(sat_pos_ecef)
 
             records.append({
@@ -10,10 +10,10 @@ remains available for exploratory analysis via Plotly.
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import logging
 import math
-from datetime import timedelta
 from pathlib import Path
 from typing import Iterable, List, Tuple, Optional, Dict
 
@@ -169,54 +169,100 @@ def _cartesian_from_lat_lon(
 
 
 def _parse_stk_epoch(value: str) -> pd.Timestamp:
-    """Parse an STK timestamp expressed as ``DD Mon YYYY HH:MM:SS.sss``."""
+    """Parse an STK timestamp expressed as ``DD Mon YYYY HH:MM:SS.sss``.
 
+    A trailing ``UTCG`` time-scale designator, as written by the exporter, is
+    accepted.
+    """
+
+    value = value.strip()
+    if value.endswith("UTCG"):
+        value = value[: -len("UTCG")].rstrip()
     timestamp = pd.to_datetime(value + "Z", utc=True, format="%d %b %Y %H:%M:%S.%fZ")
     if pd.isna(timestamp):
         raise ValueError(f"Failed to parse STK timestamp: {value}")
     return timestamp
 
 
+def _header_epoch(header: str) -> Optional[pd.Timestamp]:
+    """Return the ``ScenarioEpoch`` declared in an STK file header, if any."""
+
+    epoch: Optional[pd.Timestamp] = None
+    for line in header.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("ScenarioEpoch"):
+            epoch = _parse_stk_epoch(stripped.split("ScenarioEpoch", 1)[1].strip())
+    return epoch
+
+
+def _read_stk_data_block(
+    path: Path, begin: str, end: str, column_count: int
+) -> Tuple[str, np.ndarray]:
+    """Return the header of an STK file and the leading columns of its data block.
+
+    The block between the *begin* and *end* markers is located once in the
+    file contents and parsed by pandas' C reader.  Blank and ``#`` comment
+    lines are ignored, and rows with fewer than *column_count* numeric values
+    are dropped.
+    """
+
+    content = path.read_bytes()
+    begin_index = content.find(begin.encode("utf-8"))
+    if begin_index < 0:
+        return content.decode("utf-8"), np.empty((0, column_count))
+
+    header = content[:begin_index].decode("utf-8")
+    start = content.find(b"\n", begin_index)
+    start = len(content) if start < 0 else start + 1
+    stop = content.find(end.encode("utf-8"), start)
+    block = content[start:] if stop < 0 else content[start:stop]
+    if not block.strip():
+        return header, np.empty((0, column_count))
+
+    frame = pd.read_csv(
+        io.BytesIO(block),
+        sep=r"\s+",
+        header=None,
+        names=range(column_count),
+        usecols=range(column_count),
+        index_col=False,
+        comment="#",
+        engine="c",
+    )
+    values = frame.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    return header, values[~np.isnan(values).any(axis=1)]
+
+
+def _offset_timestamps(epoch: pd.Timestamp, offsets_s: np.ndarray) -> pd.DatetimeIndex:
+    """Return ``epoch + offsets_s`` as timestamps rounded to whole microseconds."""
+
+    microseconds = np.rint(offsets_s * 1_000_000.0).astype(np.int64)
+    return epoch + pd.to_timedelta(microseconds, unit="us")
+
+
 def _load_stk_ephemerides(stk_dir: Path) -> dict[str, pd.DataFrame]:
     """Read all STK ephemeris files available in the directory."""
 
     ephemerides: dict[str, pd.DataFrame] = {}
     for ephemeris_file in sorted(stk_dir.glob("*.e")):
         name = ephemeris_file.stem
-        with ephemeris_file.open("r", encoding="utf-8") as handle:
-            epoch: Optional[pd.Timestamp] = None
-            rows: list[tuple[pd.Timestamp, float, float, float]] = []
-            for line in handle:
-                stripped = line.strip()
-                if stripped.startswith("ScenarioEpoch"):
-                    epoch = _parse_stk_epoch(stripped.split("ScenarioEpoch", 1)[1].strip())
-                elif stripped.startswith("BEGIN EphemerisTimePosVel"):
-                    break
-
-            if epoch is None:
-                LOGGER.warning("%s missing ScenarioEpoch; skipping ephemeris import.", ephemeris_file)
-                continue
-
-            for line in handle:
-                stripped = line.strip()
-                if stripped.startswith("END EphemerisTimePosVel"):
-                    break
-                if not stripped or stripped.startswith("#"):
-                    continue
-                parts = stripped.split()
-                if len(parts) < 4:
-                    continue
-                try:
-                    offset = float(parts[0])
-                    x_km, y_km, z_km = map(float, parts[1:4])
-                except ValueError:
-                    continue
-                timestamp = epoch + timedelta(seconds=offset)
-                rows.append((timestamp, x_km * 1000.0, y_km * 1000.0, z_km * 1000.0))
+        header, values = _read_stk_data_block(
+            ephemeris_file, "BEGIN EphemerisTimePosVel", "END EphemerisTimePosVel", 4
+        )
+        epoch = _header_epoch(header)
+        if epoch is None:
+            LOGGER.warning("%s missing ScenarioEpoch; skipping ephemeris import.", ephemeris_file)
+            continue
 
-        if rows:
-            df = pd.DataFrame(rows, columns=["time_utc", "x_m", "y_m", "z_m"])
-            ephemerides[name] = df
+        if values.size:
+            ephemerides[name] = pd.DataFrame(
+                {
+                    "time_utc": _offset_timestamps(epoch, values[:, 0]),
+                    "x_m": values[:, 1] * 1000.0,
+                    "y_m": values[:, 2] * 1000.0,
+                    "z_m": values[:, 3] * 1000.0,
+                }
+            )
 
     return ephemerides
 
@@ -239,52 +285,28 @@ def _load_stk_groundtracks(stk_dir: Path) -> dict[str, pd.DataFrame]:
     epoch_cache: dict[str, Optional[pd.Timestamp]] = {}
     for gt_file in sorted(stk_dir.glob("*groundtrack.gt")):
         name = gt_file.stem.replace("_groundtrack", "")
-        with gt_file.open("r", encoding="utf-8") as handle:
-            epoch: Optional[pd.Timestamp] = None
-            rows: list[tuple[pd.Timestamp, float, float, float]] = []
-            for line in handle:
-                stripped = line.strip()
-                if stripped.startswith("ScenarioEpoch"):
-                    epoch = _parse_stk_epoch(stripped.split("ScenarioEpoch", 1)[1].strip())
-                elif stripped.startswith("BEGIN Points"):
-                    break
-
-            if epoch is None:
-                if name not in epoch_cache:
-                    epoch_cache[name] = _infer_epoch_from_ephemeris(name)
-                epoch = epoch_cache[name]
-            if epoch is None:
-                LOGGER.warning(
-                    "%s missing ScenarioEpoch and no matching ephemeris epoch found; skipping ground track import.",
-                    gt_file,
-                )
-                continue
-
-            for line in handle:
-                stripped = line.strip()
-                if stripped.startswith("END Points"):
-                    break
-                if not stripped or stripped.startswith("#"):
-                    continue
-                parts = stripped.split()
-                if len(parts) < 4:
-                    continue
-                try:
-                    offset = float(parts[0])
-                    latitude = float(parts[1])
-                    longitude = float(parts[2])
-                    altitude_km = float(parts[3])
-                except ValueError:
-                    continue
-                timestamp = epoch + timedelta(seconds=offset)
-                rows.append((timestamp, latitude, longitude, altitude_km * 1000.0))
+        header, values = _read_stk_data_block(gt_file, "BEGIN Points", "END Points", 4)
+        epoch = _header_epoch(header)
+        if epoch is None:
+            if name not in epoch_cache:
+                epoch_cache[name] = _infer_epoch_from_ephemeris(name)
+            epoch = epoch_cache[name]
+        if epoch is None:
+            LOGGER.warning(
+                "%s missing ScenarioEpoch and no matching ephemeris epoch found; skipping ground track import.",
+                gt_file,
+            )
+            continue
 
-        if rows:
-            df = pd.DataFrame(
-                rows,
-                columns=["time_utc", "latitude_deg", "longitude_deg", "altitude_m"],
+        if values.size:
+            groundtracks[name] = pd.DataFrame(
+                {
+                    "time_utc": _offset_timestamps(epoch, values[:, 0]),
+                    "latitude_deg": values[:, 1],
+                    "longitude_deg": values[:, 2],
+                    "altitude_m": values[:, 3] * 1000.0,
+                }
             )
-            groundtracks[name] = df
 
     return groundtracks
 
@@ -4,25 +4,34 @@ The implementation focuses on compatibility with STK 11.2 textual formats.
 Where the upstream simulation does not provide samples in the TEME frame, the
 exporter assumes the caller has already converted the state vectors. This
 assumption is stated inline to encourage explicit validation by mission
-analysts. NumPy and SciPy are used to guarantee monotonically sampled time
-series that satisfy the STK ephemeris specification.
+analysts. NumPy is used to guarantee monotonically sampled time series that
+satisfy the STK ephemeris specification.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import cached_property
+import logging
 from pathlib import Path
 import re
 import string
-from typing import Iterable, List, Optional, Sequence
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
 
 import numpy as np
 
-try:  # pragma: no cover - SciPy is optional at runtime
-    from scipy.interpolate import interp1d
-except Exception:  # pragma: no cover - fall back to NumPy interpolation
-    interp1d = None  # type: ignore
+from ._ephemeris_io import (
+    LAGRANGE_ORDER,
+    WRITE_BUFFER_BYTES,
+    decimate_ephemeris,
+    epochs_to_datetimes,
+    lagrange_interpolate,
+    naive_utc,
+    write_rows,
+)
 
 # The poliastro import is retained for future frame transformations. The
 # exporter currently expects TEME-compatible inputs and documents this
@@ -33,6 +42,8 @@ try:  # pragma: no cover - optional import depending on user environment
 except Exception:  # pragma: no cover - optional dependency handling
     TEME = None  # type: ignore
 
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class StateSample:
@@ -105,6 +116,263 @@ class GroundTrack:
         return ordered
 
 
+def epoch_array(epochs: Iterable[datetime]) -> np.ndarray:
+    """Return *epochs* as a ``datetime64[us]`` array of UTC instants."""
+
+    return np.array([naive_utc(epoch) for epoch in epochs], dtype="datetime64[us]")
+
+
+def _epochs_from_offsets(start_epoch: datetime, offsets_s: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Return ``datetime64[us]`` epochs *offsets_s* seconds after *start_epoch*.
+
+    Offsets are rounded to whole microseconds, as :class:`~datetime.timedelta` does.
+    """
+
+    microseconds = np.rint(np.asarray(offsets_s, dtype=float) * 1_000_000.0).astype(np.int64)
+    return np.datetime64(naive_utc(start_epoch), "us") + microseconds.astype("timedelta64[us]")
+
+
+def _epoch_offsets(epochs: np.ndarray, start_epoch: datetime) -> np.ndarray:
+    """Return the seconds elapsed from *start_epoch* to each ``datetime64`` epoch."""
+
+    return (epochs - np.datetime64(naive_utc(start_epoch), "us")) / np.timedelta64(1, "s")
+
+
+def _epoch_tzinfo(epoch: Optional[datetime]) -> Optional[tzinfo]:
+    """Return UTC for timezone-aware *epoch* and ``None`` for naive ones."""
+
+    return timezone.utc if epoch is not None and epoch.tzinfo is not None else None
+
+
+def _stable_order(epochs: np.ndarray) -> Optional[np.ndarray]:
+    """Return the stable sorting permutation of *epochs*, or ``None`` if already sorted."""
+
+    if epochs.size < 2 or not np.any(epochs[1:] < epochs[:-1]):
+        return None
+    return np.argsort(epochs, kind="stable")
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnarStateHistory:
+    """Array-backed state history for an individual spacecraft.
+
+    ``epochs`` holds ``datetime64[us]`` UTC instants and ``positions_eci_km``
+    and ``velocities_eci_kms`` the matching ``(N, 3)`` vectors, with the unit
+    and frame conventions of :class:`StateSample`.  ``epoch_tzinfo`` is
+    attached to the datetimes handed out by the :class:`StateSample` adapter
+    (``None`` keeps them naive).
+    """
+
+    satellite_id: str
+    epochs: np.ndarray
+    positions_eci_km: np.ndarray
+    velocities_eci_kms: np.ndarray
+    frame: str = "TEME"
+    epoch_tzinfo: Optional[tzinfo] = timezone.utc
+
+    def __post_init__(self) -> None:
+        epochs = np.asarray(self.epochs, dtype="datetime64[us]").reshape(-1)
+        positions = np.asarray(self.positions_eci_km, dtype=float)
+        velocities = np.asarray(self.velocities_eci_kms, dtype=float)
+        if positions.shape != (epochs.size, 3):
+            raise ValueError("Positions must form an (N, 3) array in kilometres.")
+        if velocities.shape != (epochs.size, 3):
+            raise ValueError("Velocities must form an (N, 3) array in kilometres per second.")
+        object.__setattr__(self, "epochs", epochs)
+        object.__setattr__(self, "positions_eci_km", positions)
+        object.__setattr__(self, "velocities_eci_kms", velocities)
+
+    @classmethod
+    def from_offsets(
+        cls,
+        satellite_id: str,
+        start_epoch: datetime,
+        offsets_s: Sequence[float] | np.ndarray,
+        positions_eci_km: np.ndarray,
+        velocities_eci_kms: np.ndarray,
+        frame: str = "TEME",
+    ) -> "ColumnarStateHistory":
+        """Build a history sampled *offsets_s* seconds after *start_epoch*."""
+
+        return cls(
+            satellite_id=satellite_id,
+            epochs=_epochs_from_offsets(start_epoch, offsets_s),
+            positions_eci_km=positions_eci_km,
+            velocities_eci_kms=velocities_eci_kms,
+            frame=frame,
+            epoch_tzinfo=_epoch_tzinfo(start_epoch),
+        )
+
+    @classmethod
+    def from_history(
+        cls, history: Union["PropagatedStateHistory", "ColumnarStateHistory"]
+    ) -> "ColumnarStateHistory":
+        """Return *history* in columnar form, converting :class:`PropagatedStateHistory` samples."""
+
+        if isinstance(history, ColumnarStateHistory):
+            return history
+        samples = list(history.samples)
+        return cls(
+            satellite_id=history.satellite_id,
+            epochs=epoch_array(sample.epoch for sample in samples),
+            positions_eci_km=np.array(
+                [sample.position_eci_km for sample in samples], dtype=float
+            ).reshape(-1, 3),
+            velocities_eci_kms=np.array(
+                [sample.velocity_eci_kms for sample in samples], dtype=float
+            ).reshape(-1, 3),
+            frame=samples[0].frame if samples else "TEME",
+            epoch_tzinfo=_epoch_tzinfo(samples[0].epoch if samples else None),
+        )
+
+    @cached_property
+    def samples(self) -> List[StateSample]:
+        """The history as :class:`StateSample` objects, for dataclass-based consumers."""
+
+        return [
+            StateSample(epoch=epoch, position_eci_km=position, velocity_eci_kms=velocity, frame=self.frame)
+            for epoch, position, velocity in zip(
+                epochs_to_datetimes(self.epochs, self.epoch_tzinfo),
+                self.positions_eci_km,
+                self.velocities_eci_kms,
+            )
+        ]
+
+    def ordered_samples(self) -> List[StateSample]:
+        """Return samples sorted by epoch to enforce STK monotonicity requirements."""
+
+        return self.ordered().samples
+
+    def ordered(self) -> "ColumnarStateHistory":
+        """Return the history with its samples stably sorted by epoch."""
+
+        order = _stable_order(self.epochs)
+        if order is None:
+            return self
+        return replace(
+            self,
+            epochs=self.epochs[order],
+            positions_eci_km=self.positions_eci_km[order],
+            velocities_eci_kms=self.velocities_eci_kms[order],
+        )
+
+    def offsets_seconds(self, start_epoch: datetime) -> np.ndarray:
+        """Return the seconds elapsed from *start_epoch* to each sample."""
+
+        return _epoch_offsets(self.epochs, start_epoch)
+
+    def latest_epoch(self) -> datetime:
+        """Return the latest sample epoch."""
+
+        return epochs_to_datetimes(self.epochs.max(keepdims=True), self.epoch_tzinfo)[0]
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnarGroundTrack:
+    """Array-backed ground track with ``datetime64[us]`` UTC epochs.
+
+    Latitude and longitude are in degrees and altitude in kilometres, as in
+    :class:`GroundTrackPoint`.
+    """
+
+    satellite_id: str
+    epochs: np.ndarray
+    latitude_deg: np.ndarray
+    longitude_deg: np.ndarray
+    altitude_km: np.ndarray
+    epoch_tzinfo: Optional[tzinfo] = timezone.utc
+
+    def __post_init__(self) -> None:
+        epochs = np.asarray(self.epochs, dtype="datetime64[us]").reshape(-1)
+        object.__setattr__(self, "epochs", epochs)
+        for name in ("latitude_deg", "longitude_deg", "altitude_km"):
+            values = np.broadcast_to(np.asarray(getattr(self, name), dtype=float), epochs.shape)
+            object.__setattr__(self, name, values)
+
+    @classmethod
+    def from_offsets(
+        cls,
+        satellite_id: str,
+        start_epoch: datetime,
+        offsets_s: Sequence[float] | np.ndarray,
+        latitude_deg: np.ndarray,
+        longitude_deg: np.ndarray,
+        altitude_km: np.ndarray,
+    ) -> "ColumnarGroundTrack":
+        """Build a ground track sampled *offsets_s* seconds after *start_epoch*."""
+
+        return cls(
+            satellite_id=satellite_id,
+            epochs=_epochs_from_offsets(start_epoch, offsets_s),
+            latitude_deg=latitude_deg,
+            longitude_deg=longitude_deg,
+            altitude_km=altitude_km,
+            epoch_tzinfo=_epoch_tzinfo(start_epoch),
+        )
+
+    @classmethod
+    def from_track(
+        cls, track: Union["GroundTrack", "ColumnarGroundTrack"]
+    ) -> "ColumnarGroundTrack":
+        """Return *track* in columnar form, converting :class:`GroundTrack` points."""
+
+        if isinstance(track, ColumnarGroundTrack):
+            return track
+        points = list(track.points)
+        return cls(
+            satellite_id=track.satellite_id,
+            epochs=epoch_array(point.epoch for point in points),
+            latitude_deg=np.array([point.latitude_deg for point in points], dtype=float),
+            longitude_deg=np.array([point.longitude_deg for point in points], dtype=float),
+            altitude_km=np.array([point.altitude_km for point in points], dtype=float),
+            epoch_tzinfo=_epoch_tzinfo(points[0].epoch if points else None),
+        )
+
+    @cached_property
+    def points(self) -> List[GroundTrackPoint]:
+        """The track as :class:`GroundTrackPoint` objects, for dataclass-based consumers."""
+
+        return [
+            GroundTrackPoint(
+                epoch=epoch, latitude_deg=latitude, longitude_deg=longitude, altitude_km=altitude
+            )
+            for epoch, latitude, longitude, altitude in zip(
+                epochs_to_datetimes(self.epochs, self.epoch_tzinfo),
+                self.latitude_deg.tolist(),
+                self.longitude_deg.tolist(),
+                self.altitude_km.tolist(),
+            )
+        ]
+
+    def ordered_points(self) -> List[GroundTrackPoint]:
+        """Return points sorted by epoch."""
+
+        return self.ordered().points
+
+    def ordered(self) -> "ColumnarGroundTrack":
+        """Return the track with its points stably sorted by epoch."""
+
+        order = _stable_order(self.epochs)
+        if order is None:
+            return self
+        return replace(
+            self,
+            epochs=self.epochs[order],
+            latitude_deg=self.latitude_deg[order],
+            longitude_deg=self.longitude_deg[order],
+            altitude_km=self.altitude_km[order],
+        )
+
+    def offsets_seconds(self, start_epoch: datetime) -> np.ndarray:
+        """Return the seconds elapsed from *start_epoch* to each point."""
+
+        return _epoch_offsets(self.epochs, start_epoch)
+
+
+StateHistory = Union[PropagatedStateHistory, ColumnarStateHistory]
+GroundTrackData = Union[GroundTrack, ColumnarGroundTrack]
+
+
 @dataclass(frozen=True)
 class GroundContactInterval:
     """Visibility interval between a spacecraft and a facility."""
@@ -149,14 +417,36 @@ class ScenarioMetadata:
     coordinate_frame: str = "TEME"
     ephemeris_step_seconds: Optional[float] = None
     animation_step_seconds: Optional[float] = None
+    # When set, ephemerides are decimated to the sparsest samples whose
+    # order-7 Lagrange reconstruction stays within this distance.
+    ephemeris_tolerance_km: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ExportedFile:
+    """Summary of an ephemeris or ground-track file written by the exporter.
+
+    ``max_error_km`` is the largest position error of the Lagrange
+    reconstruction against the dense trajectory when the ephemeris was
+    decimated, and ``None`` otherwise.
+    """
+
+    name: str
+    point_count: int
+    elapsed_s: float = 0.0
+    max_error_km: Optional[float] = None
 
 
 @dataclass(frozen=True)
 class SimulationResults:
-    """Container aggregating all artefacts required for STK export."""
+    """Container aggregating all artefacts required for STK export.
+
+    State histories and ground tracks may mix the per-sample dataclasses with
+    their columnar counterparts.
+    """
 
-    state_histories: Sequence[PropagatedStateHistory]
-    ground_tracks: Sequence[GroundTrack] = field(default_factory=list)
+    state_histories: Sequence[StateHistory]
+    ground_tracks: Sequence[GroundTrackData] = field(default_factory=list)
     ground_contacts: Sequence[GroundContactInterval] = field(default_factory=list)
     facilities: Sequence[FacilityDefinition] = field(default_factory=list)
     events: Sequence[FormationMaintenanceEvent] = field(default_factory=list)
@@ -179,9 +469,8 @@ def _format_epoch(epoch: datetime) -> str:
     return f"{base}.{fractional_nanoseconds:09d} UTCG"
 
 
-def _offset_seconds(start: datetime, epoch: datetime) -> float:
-    delta = epoch - start
-    return delta.total_seconds()
+_EPHEMERIS_ROW_FORMAT = "        %.9f % .14e % .14e % .14e % .14e % .14e % .14e\n"
+_GROUND_TRACK_ROW_FORMAT = "        %.9f %.9f %.9f %.6f\n"
 
 
 def _resample_ephemeris(
@@ -190,28 +479,28 @@ def _resample_ephemeris(
     velocities: np.ndarray,
     step: float,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Resample vectors to satisfy STK guidance on ephemeris spacing."""
+    """Resample vectors to satisfy STK guidance on ephemeris spacing.
+
+    States are interpolated with the sliding-window Lagrange scheme declared in
+    the ephemeris header, so the resampled values match what STK reconstructs
+    from the original samples.  The grid advances by *step* from the first
+    sample and closes on the last one; it never extends past the sampled span.
+    """
 
     if times.size < 2:
         raise ValueError("At least two samples are required for interpolation.")
 
-    new_times = np.arange(times[0], times[-1] + 0.5 * step, step, dtype=float)
-
-    if interp1d is not None:
-        interpolator_pos = interp1d(times, positions, axis=0, kind="cubic", fill_value="extrapolate")
-        interpolator_vel = interp1d(times, velocities, axis=0, kind="cubic", fill_value="extrapolate")
-        resampled_positions = interpolator_pos(new_times)
-        resampled_velocities = interpolator_vel(new_times)
-        return new_times, resampled_positions, resampled_velocities
-
-    # Fall back to NumPy's linear interpolation when SciPy is unavailable. The
-    # linear interpolation maintains monotonicity and still produces valid STK
-    # ephemeris data for moderate cadence adjustments.
-    resampled_positions = np.empty((new_times.size, positions.shape[1]))
-    resampled_velocities = np.empty((new_times.size, velocities.shape[1]))
-    for axis in range(positions.shape[1]):
-        resampled_positions[:, axis] = np.interp(new_times, times, positions[:, axis])
-        resampled_velocities[:, axis] = np.interp(new_times, times, velocities[:, axis])
+    span = times[-1] - times[0]
+    count = int(np.floor(span / step + 1e-9)) + 1
+    new_times = times[0] + step * np.arange(count, dtype=float)
+    if times[-1] - new_times[-1] > 1e-9 * step:
+        new_times = np.append(new_times, times[-1])
+    else:
+        new_times[-1] = min(new_times[-1], times[-1])
+
+    order = min(LAGRANGE_ORDER, times.size - 1)
+    resampled_positions = lagrange_interpolate(times, positions, new_times, order)
+    resampled_velocities = lagrange_interpolate(times, velocities, new_times, order)
     return new_times, resampled_positions, resampled_velocities
 
 
@@ -263,7 +552,9 @@ def export_simulation_to_stk(
     sim_results: SimulationResults,
     output_path: Path | str,
     scenario_metadata: ScenarioMetadata,
-) -> None:
+    *,
+    workers: Optional[int] = None,
+) -> Dict[str, ExportedFile]:
     """Serialise simulation artefacts into STK textual products.
 
     Parameters
@@ -277,15 +568,30 @@ def export_simulation_to_stk(
     scenario_metadata:
         Scenario-level configuration controlling naming, timing, and coordinate
         frame assumptions.
+    workers:
+        Number of processes used to resample and write the per-asset
+        ephemeris and ground-track files. ``None`` or ``1`` writes them in
+        process.
+
+    Returns
+    -------
+    dict
+        :class:`ExportedFile` summaries of the ephemeris and ground-track
+        files, keyed by file name, with the seconds spent producing each and
+        the reconstruction error of decimated ephemerides.
 
     Notes
     -----
     * State vectors are assumed to be expressed in the TEME frame. Analysts can
       extend the exporter by leveraging :mod:`poliastro` transforms if other
       frames are needed.
-    * When `ephemeris_step_seconds` is provided, SciPy's interpolation routines
-      are used to densify the ephemeris in accordance with STK guidance on
-      maximum sample spacing for high-accuracy propagation.
+    * When `ephemeris_step_seconds` is provided, the ephemeris is resampled to
+      that cadence with the order-7 Lagrange interpolation STK applies, in
+      accordance with STK guidance on maximum sample spacing for high-accuracy
+      propagation.
+    * When `ephemeris_tolerance_km` is provided, each ephemeris is thinned to
+      the samples STK needs to reconstruct it with its order-7 Lagrange
+      interpolation within that tolerance.
     """
 
     output_dir = Path(output_path)
@@ -300,6 +606,7 @@ def export_simulation_to_stk(
         central_body=scenario_metadata.central_body,
         coordinate_frame=scenario_metadata.coordinate_frame,
         ephemeris_step_seconds=scenario_metadata.ephemeris_step_seconds,
+        ephemeris_tolerance_km=scenario_metadata.ephemeris_tolerance_km,
     )
 
     satellite_names: list[str] = []
@@ -317,22 +624,22 @@ def export_simulation_to_stk(
     event_map = unique_stk_names(event_names)
 
     sanitised_histories = [
-        PropagatedStateHistory(
+        replace(
+            ColumnarStateHistory.from_history(history),
             satellite_id=satellite_map.get(
                 history.satellite_id,
                 sanitize_stk_identifier(history.satellite_id),
             ),
-            samples=history.samples,
         )
         for history in sim_results.state_histories
     ]
 
     sanitised_tracks = [
-        GroundTrack(
+        replace(
+            ColumnarGroundTrack.from_track(track),
             satellite_id=satellite_map.get(
                 track.satellite_id, sanitize_stk_identifier(track.satellite_id)
             ),
-            points=track.points,
         )
         for track in sim_results.ground_tracks
     ]
@@ -389,17 +696,18 @@ def export_simulation_to_stk(
     # the exported ephemerides.
     if safe_metadata.stop_epoch is None:
         latest_state_epoch = max(
-            sample.epoch
-            for history in sanitised_results.state_histories
-            for sample in history.samples
+            history.latest_epoch()
+            for history in sanitised_histories
+            if history.epochs.size
         )
         stop_epoch = latest_state_epoch
     else:
         stop_epoch = safe_metadata.stop_epoch
 
-    _write_ephemerides(sanitised_results, output_dir, safe_metadata)
+    exported_files = _write_asset_files(
+        sanitised_results, output_dir, safe_metadata, max(int(workers or 1), 1)
+    )
     _write_satellite_objects(sanitised_results, output_dir, safe_metadata)
-    _write_ground_tracks(sanitised_results, output_dir, safe_metadata)
     _write_facilities(sanitised_results, output_dir, safe_metadata)
     _write_ground_contacts(sanitised_results, output_dir)
     _write_events(sanitised_results, output_dir)
@@ -409,58 +717,114 @@ def export_simulation_to_stk(
         safe_metadata,
         stop_epoch,
     )
+    return exported_files
 
 
-def _write_ephemerides(
+def _write_asset_files(
     sim_results: SimulationResults,
     output_dir: Path,
     scenario_metadata: ScenarioMetadata,
-) -> None:
-    for history in sim_results.state_histories:
-        samples = history.ordered_samples()
-        times = np.array([
-            _offset_seconds(scenario_metadata.start_epoch, sample.epoch)
-            for sample in samples
-        ], dtype=float)
-        if np.any(np.diff(times) <= 0):
-            raise ValueError(
-                f"Ephemeris samples for {history.satellite_id} must be strictly increasing."
-            )
+    workers: int,
+) -> Dict[str, ExportedFile]:
+    """Write every ephemeris and ground-track file and return their summaries.
 
-        positions = np.vstack([sample.position_eci_km for sample in samples])
-        velocities = np.vstack([sample.velocity_eci_kms for sample in samples])
+    The files are independent, so with ``workers > 1`` they are produced
+    across a process pool; formatting the rows holds the GIL, which rules out
+    threads.  The summaries keep the order of the serial export.
+    """
 
-        if scenario_metadata.ephemeris_step_seconds:
-            times, positions, velocities = _resample_ephemeris(
-                times,
-                positions,
-                velocities,
-                scenario_metadata.ephemeris_step_seconds,
-            )
+    tasks = [
+        (_write_ephemeris, history, output_dir, scenario_metadata)
+        for history in sim_results.state_histories
+    ] + [
+        (_write_ground_track, track, output_dir, scenario_metadata)
+        for track in sim_results.ground_tracks
+    ]
 
-        ephemeris_path = output_dir / f"{history.satellite_id}.e"
-        with ephemeris_path.open("w", encoding="utf-8") as stream:
-            stream.write("stk.v.11.0\n")
-            stream.write("WrittenBy    formation-sat-exporter\n\n")
-            stream.write("BEGIN Ephemeris\n")
-            stream.write(f"    NumberOfEphemerisPoints {positions.shape[0]}\n")
-            stream.write(f"    ScenarioEpoch {_format_epoch(scenario_metadata.start_epoch)}\n")
-            stream.write("    InterpolationMethod     Lagrange\n")
-            stream.write("    InterpolationOrder      7\n")
-            stream.write(f"    CentralBody             {scenario_metadata.central_body}\n")
-            stream.write(f"    CoordinateSystem        {scenario_metadata.coordinate_frame}\n")
-            stream.write("    DistanceUnit            Kilometers\n")
-            stream.write("\n")
-            stream.write("    BEGIN EphemerisTimePosVel\n")
-            for t, pos, vel in zip(times, positions, velocities):
-                line = (
-                    f"        {t:.9f} "
-                    f"{pos[0]: .14e} {pos[1]: .14e} {pos[2]: .14e} "
-                    f"{vel[0]: .14e} {vel[1]: .14e} {vel[2]: .14e}\n"
-                )
-                stream.write(line)
-            stream.write("    END EphemerisTimePosVel\n")
-            stream.write("END Ephemeris\n")
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(_timed_write, *task) for task in tasks]
+            results = [future.result() for future in futures]
+    else:
+        results = [_timed_write(*task) for task in tasks]
+
+    for exported in results:
+        LOGGER.debug(
+            "Wrote %s (%d points) in %.3f s.",
+            exported.name,
+            exported.point_count,
+            exported.elapsed_s,
+        )
+    return {exported.name: exported for exported in results}
+
+
+def _timed_write(
+    writer: Callable[[object, Path, ScenarioMetadata], ExportedFile],
+    product: object,
+    output_dir: Path,
+    scenario_metadata: ScenarioMetadata,
+) -> ExportedFile:
+    """Run *writer* for one asset and record the elapsed seconds in its summary."""
+
+    started = time.perf_counter()
+    exported = writer(product, output_dir, scenario_metadata)
+    return replace(exported, elapsed_s=time.perf_counter() - started)
+
+
+def _write_ephemeris(
+    state_history: StateHistory,
+    output_dir: Path,
+    scenario_metadata: ScenarioMetadata,
+) -> ExportedFile:
+    history = ColumnarStateHistory.from_history(state_history).ordered()
+    times = history.offsets_seconds(scenario_metadata.start_epoch)
+    if np.any(np.diff(times) <= 0):
+        raise ValueError(
+            f"Ephemeris samples for {history.satellite_id} must be strictly increasing."
+        )
+
+    positions = history.positions_eci_km
+    velocities = history.velocities_eci_kms
+
+    if scenario_metadata.ephemeris_step_seconds:
+        times, positions, velocities = _resample_ephemeris(
+            times,
+            positions,
+            velocities,
+            scenario_metadata.ephemeris_step_seconds,
+        )
+
+    max_error_km = None
+    if scenario_metadata.ephemeris_tolerance_km is not None:
+        times, positions, velocities, max_error_km = decimate_ephemeris(
+            times,
+            positions,
+            velocities,
+            scenario_metadata.ephemeris_tolerance_km,
+        )
+
+    ephemeris_path = output_dir / f"{history.satellite_id}.e"
+    with ephemeris_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as stream:
+        stream.write("stk.v.11.0\n")
+        stream.write("WrittenBy    formation-sat-exporter\n\n")
+        stream.write("BEGIN Ephemeris\n")
+        stream.write(f"    NumberOfEphemerisPoints {positions.shape[0]}\n")
+        stream.write(f"    ScenarioEpoch {_format_epoch(scenario_metadata.start_epoch)}\n")
+        stream.write("    InterpolationMethod     Lagrange\n")
+        stream.write(f"    InterpolationOrder      {LAGRANGE_ORDER}\n")
+        stream.write(f"    CentralBody             {scenario_metadata.central_body}\n")
+        stream.write(f"    CoordinateSystem        {scenario_metadata.coordinate_frame}\n")
+        stream.write("    DistanceUnit            Kilometers\n")
+        stream.write("\n")
+        stream.write("    BEGIN EphemerisTimePosVel\n")
+        write_rows(
+            stream,
+            _EPHEMERIS_ROW_FORMAT,
+            np.column_stack((times, positions, velocities)),
+        )
+        stream.write("    END EphemerisTimePosVel\n")
+        stream.write("END Ephemeris\n")
+    return ExportedFile(ephemeris_path.name, positions.shape[0], max_error_km=max_error_km)
 
 
 def _write_satellite_objects(
@@ -485,42 +849,37 @@ def _write_satellite_objects(
             stream.write("END Satellite\n")
 
 
-def _write_ground_tracks(
-    sim_results: SimulationResults,
+def _write_ground_track(
+    ground_track: GroundTrackData,
     output_dir: Path,
     scenario_metadata: ScenarioMetadata,
-) -> None:
-    for track in sim_results.ground_tracks:
-        points = track.ordered_points()
-        times = np.array([
-            _offset_seconds(scenario_metadata.start_epoch, point.epoch)
-            for point in points
-        ], dtype=float)
-        if np.any(np.diff(times) < 0):
-            raise ValueError(
-                f"Ground-track samples for {track.satellite_id} must be non-decreasing."
-            )
-        track_path = output_dir / f"{track.satellite_id}_groundtrack.gt"
-        with track_path.open("w", encoding="utf-8") as stream:
-            stream.write("stk.v.11.0\n")
-            stream.write("WrittenBy    formation-sat-exporter\n\n")
-            stream.write("BEGIN GroundTrack\n")
-            stream.write(f"    SatelliteId         {track.satellite_id}\n")
-            stream.write(f"    CoordinateSystem    {scenario_metadata.coordinate_frame}\n")
-            stream.write(f"    NumberOfPoints      {len(points)}\n")
-            stream.write("\n")
-            stream.write("    BEGIN Points\n")
-            for time_offset, point in zip(times, points):
-                stream.write(
-                    "        {time:.9f} {lat:.9f} {lon:.9f} {alt:.6f}\n".format(
-                        time=time_offset,
-                        lat=point.latitude_deg,
-                        lon=point.longitude_deg,
-                        alt=point.altitude_km,
-                    )
-                )
-            stream.write("    END Points\n")
-            stream.write("END GroundTrack\n")
+) -> ExportedFile:
+    track = ColumnarGroundTrack.from_track(ground_track).ordered()
+    times = track.offsets_seconds(scenario_metadata.start_epoch)
+    if np.any(np.diff(times) < 0):
+        raise ValueError(
+            f"Ground-track samples for {track.satellite_id} must be non-decreasing."
+        )
+    track_path = output_dir / f"{track.satellite_id}_groundtrack.gt"
+    with track_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as stream:
+        stream.write("stk.v.11.0\n")
+        stream.write("WrittenBy    formation-sat-exporter\n\n")
+        stream.write("BEGIN GroundTrack\n")
+        stream.write(f"    SatelliteId         {track.satellite_id}\n")
+        stream.write(f"    CoordinateSystem    {scenario_metadata.coordinate_frame}\n")
+        stream.write(f"    NumberOfPoints      {times.size}\n")
+        stream.write("\n")
+        stream.write("    BEGIN Points\n")
+        write_rows(
+            stream,
+            _GROUND_TRACK_ROW_FORMAT,
+            np.column_stack(
+                (times, track.latitude_deg, track.longitude_deg, track.altitude_km)
+            ),
+        )
+        stream.write("    END Points\n")
+        stream.write("END GroundTrack\n")
+    return ExportedFile(track_path.name, times.size)
 
 
 def _write_facilities(